@@ -0,0 +1,143 @@
+"""
+Measures the memory and time it takes to build Response objects.
+
+The memory of the slotted, lazily built response classes is compared to a
+dict-backed object graph holding the same attributes, which is how the
+response classes stored their fields before.
+
+Usage:
+    PYTHONPATH=src python scripts/bench_response.py [--items 500]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from oxylabs.sources.response import Response, _Field
+
+
+def make_amazon_search(items: int) -> dict:
+    paid = [
+        {
+            "pos": index,
+            "url": f"https://www.amazon.com/dp/B0{index:08d}",
+            "asin": f"B0{index:08d}",
+            "price": 19.99 + index,
+            "title": f"Product {index}",
+            "rating": 4.5,
+            "currency": "USD",
+            "url_image": f"https://m.media-amazon.com/images/{index}.jpg",
+            "best_seller": index % 7 == 0,
+            "price_upper": 29.99 + index,
+            "is_sponsored": True,
+            "manufacturer": "Oxylabs",
+            "pricing_count": 3,
+            "reviews_count": 100 + index,
+            "is_amazons_choice": False,
+            "sales_volume": "1K+ bought in past month",
+            "is_prime": True,
+            "shipping_information": "FREE delivery",
+            "sitelinks": {"expanded": [], "inline": []},
+        }
+        for index in range(items)
+    ]
+    filters = [
+        {
+            "name": f"Filter {index}",
+            "values": [
+                {"url": f"/s?rh={index}:{value}", "value": f"Value {value}"}
+                for value in range(10)
+            ],
+        }
+        for index in range(20)
+    ]
+    return {
+        "results": [
+            {
+                "content": {},
+                "status_code": 200,
+                "content_parsed": {
+                    "url": "https://www.amazon.com/s?k=headset",
+                    "page": 1,
+                    "query": "headset",
+                    "results": {"paid": paid, "filters": filters},
+                    "last_visible_page": 7,
+                    "parse_status_code": 12000,
+                },
+            }
+        ],
+        "job": {"id": "1", "status": "done"},
+    }
+
+
+def fields(obj) -> dict:
+    names = {}
+    for cls in reversed(type(obj).__mro__):
+        for name, value in vars(cls).items():
+            if isinstance(value, _Field):
+                names[name] = getattr(obj, name)
+    return names
+
+
+def read_all(value) -> int:
+    """
+    Reads every attribute of the object graph and returns the number of
+    response objects in it.
+    """
+    if isinstance(value, list):
+        return sum(read_all(item) for item in value)
+    if not hasattr(value, "_values"):
+        return 0
+    return 1 + sum(read_all(item) for item in fields(value).values())
+
+
+def as_namespace(value):
+    """
+    Copies the object graph into dict-backed objects with every attribute
+    set, like the response classes built before.
+    """
+    if isinstance(value, list):
+        return [as_namespace(item) for item in value]
+    if not hasattr(value, "_values"):
+        return value
+    attributes = {
+        name: as_namespace(item) for name, item in fields(value).items()
+    }
+    return SimpleNamespace(raw=value.raw, **attributes)
+
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=500)
+    args = parser.parse_args()
+
+    data = make_amazon_search(args.items)
+
+    response, untouched, build_time = measure(lambda: Response(data))
+    objects, read_size, read_time = measure(lambda: read_all(response))
+    full = untouched + read_size
+    baseline, dict_backed, _ = measure(lambda: as_namespace(response))
+
+    print(f"Amazon search page with {args.items} items, {objects} objects")
+    print(f"  build, nothing read:    {untouched / 1024:10.1f} KiB  {build_time * 1000:8.2f} ms")
+    print(f"  build, everything read: {full / 1024:10.1f} KiB  {read_time * 1000:8.2f} ms")
+    print(f"  dict-backed objects:    {dict_backed / 1024:10.1f} KiB")
+    print(f"  bytes per object:       {full / objects:10.1f} vs {dict_backed / objects:.1f}")
+    del baseline
+
+
+if __name__ == "__main__":
+    main()
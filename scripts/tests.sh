@@ -172,5 +172,44 @@ python -m unittest tests.sources.airbnb.test_airbnb.TestAirbnbUrlSync
 
 python -m unittest tests.sources.zillow.test_zillow.TestZillowUrlSync
 
+python -m unittest tests.sources.test_response.TestLazyResponse
+
 # Run proxy tests
 python -m unittest tests.proxy.test_proxy.TestProxyGet
+
+# Run export tests
+python -m unittest tests.export.test_arrow.TestArrowExport
+python -m unittest tests.export.test_sinks.TestSinks
+python -m unittest tests.export.test_sinks.TestAsyncSinks
+
+# Run internal tests
+python -m unittest tests.internal.test_api.TestRealtimeSessionPool
+python -m unittest tests.internal.test_batch.TestRealtimeBatch
+python -m unittest tests.internal.test_api.TestAsyncSessionLifecycle
+python -m unittest tests.internal.test_batch.TestAsyncBatchSubmission
+python -m unittest tests.internal.test_poller.TestJobPoller
+python -m unittest tests.internal.test_polling.TestPollStrategies
+python -m unittest tests.internal.test_polling.TestAdaptivePolling
+python -m unittest tests.internal.test_callback.TestCallbackServer
+python -m unittest tests.internal.test_job.TestJobHandle
+python -m unittest tests.internal.test_journal.TestJobJournal
+python -m unittest tests.internal.test_stream.TestAsyncStream
+python -m unittest tests.internal.test_retry.TestRetryPolicy
+python -m unittest tests.internal.test_retry.TestRealtimeRetry
+python -m unittest tests.internal.test_retry.TestAsyncRetry
+python -m unittest tests.internal.test_rate_limit.TestRateLimiter
+python -m unittest tests.internal.test_rate_limit.TestAsyncRateLimiter
+python -m unittest tests.internal.test_in_flight.TestInFlightLimiter
+python -m unittest tests.internal.test_single_flight.TestRealtimeCoalescing
+python -m unittest tests.internal.test_single_flight.TestAsyncCoalescing
+python -m unittest tests.internal.test_cache.TestResultCache
+python -m unittest tests.internal.test_cache.TestAsyncResultCache
+python -m unittest tests.internal.test_decoder.TestJSONDecoder
+python -m unittest tests.internal.test_streaming.TestResultsParser
+python -m unittest tests.internal.test_streaming.TestRealtimeStreaming
+python -m unittest tests.internal.test_streaming.TestAsyncStreaming
+python -m unittest tests.internal.test_spill.TestSpilledContent
+python -m unittest tests.internal.test_spill.TestAsyncSpill
+python -m unittest tests.internal.test_content.TestResultContent
+python -m unittest tests.internal.test_lazy_import.TestLazyImport
+python -m unittest tests.internal.test_lazy_import.TestOptionalAiohttp
@@ -29,5 +29,13 @@ setup(
     license="MIT",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
-    install_requires=["aiohttp", "requests"],
+    install_requires=["requests"],
+    extras_require={
+        "async": ["aiohttp"],
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
+        "arrow": ["pyarrow>=14"],
+        "pandas": ["pyarrow>=14", "pandas"],
+        "zstd": ["zstandard"],
+    },
 )
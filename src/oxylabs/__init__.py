@@ -1,2 +1,28 @@
-from .internal import AsyncClient, RealtimeClient
-from .proxy.proxy import ProxyClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .internal import AsyncClient, RealtimeClient
+    from .proxy.proxy import ProxyClient
+
+__all__ = ["AsyncClient", "ProxyClient", "RealtimeClient"]
+
+# The clients are imported on first access to keep `import oxylabs` fast
+_LAZY_ATTRIBUTES = {
+    "AsyncClient": "oxylabs.internal.client",
+    "RealtimeClient": "oxylabs.internal.client",
+    "ProxyClient": "oxylabs.proxy.proxy",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
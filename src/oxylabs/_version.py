@@ -1 +1 @@
-__version__ = "3.0.0"
+__version__ = "4.0.0"
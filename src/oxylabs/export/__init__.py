@@ -0,0 +1,2 @@
+from .arrow import to_arrow, to_pandas
+from .sinks import JSONLSink, ParquetSink, Sink, SQLiteSink
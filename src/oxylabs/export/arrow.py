@@ -0,0 +1,272 @@
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from oxylabs.sources.response import Response
+
+Responses = Union[Response, dict, Iterable[Union[Response, dict]]]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Exporting to Arrow requires pyarrow. "
+            "Install it with `pip install oxylabs[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def _get_source(raw: dict) -> Optional[str]:
+    job = raw.get("job")
+    if isinstance(job, dict):
+        return job.get("source")
+    return None
+
+
+def get_rows(raw: dict, path: str) -> List[dict]:
+    """
+    Returns the rows found at a path of the parsed content of each result
+    of a raw response.
+
+    Args:
+        raw (dict): The raw response.
+        path (str): Dot separated keys in `content_parsed`, e.g.
+        "results.organic". A list found at the path adds a row per item,
+        an object adds a single row.
+
+    Returns:
+        List[dict]: The rows.
+    """
+    rows = []
+    for result in raw.get("results") or []:
+        value = result.get("content_parsed")
+        if value is None:
+            # Parsed results are returned in `content` when `parse` is set
+            value = result.get("content")
+        for key in path.split(".") if path else []:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        if isinstance(value, list):
+            rows.extend(item for item in value if isinstance(item, dict))
+        elif isinstance(value, dict):
+            rows.append(value)
+    return rows
+
+
+def _to_string(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, default=str)
+
+
+def _stringify(rows: List[dict], names: Set[str]) -> List[dict]:
+    return [
+        {
+            key: _to_string(value)
+            if value is not None and key in names
+            else value
+            for key, value in row.items()
+        }
+        for row in rows
+    ]
+
+
+def _infer_table(pa, rows: List[dict]):
+    # Columns whose values have no common type, e.g. numbers and strings,
+    # are converted to strings
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        try:
+            columns[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns[name] = pa.array(
+                [
+                    None if value is None else _to_string(value)
+                    for value in values
+                ],
+                type=pa.string(),
+            )
+    return pa.table(columns)
+
+
+def _to_table(pa, rows: List[dict], schema: Any):
+    if schema is not None:
+        struct = pa.struct(list(schema))
+        try:
+            array = pa.array(rows, type=struct)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Values of string columns are converted like when inferring
+            strings = {f.name for f in schema if pa.types.is_string(f.type)}
+            try:
+                array = pa.array(_stringify(rows, strings), type=struct)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                raise ValueError(
+                    f"The rows do not match the schema: {e}"
+                ) from e
+        return pa.Table.from_struct_array(array).replace_schema_metadata(
+            schema.metadata
+        )
+    if not rows:
+        return pa.table({})
+    # Column types are inferred from every row, not only the first one
+    try:
+        return pa.Table.from_struct_array(pa.array(rows))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _infer_table(pa, rows)
+
+
+def _unify_schemas(pa, schemas: List[Any]):
+    """
+    Returns a schema the schemas can be converted to. Fields without a
+    common type, e.g. int64 and string, become strings.
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    fields: Dict[str, List[Any]] = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, []).append(field)
+    unified = []
+    for name, same_name in fields.items():
+        try:
+            unified.append(
+                pa.unify_schemas(
+                    [pa.schema([field]) for field in same_name],
+                    promote_options="permissive",
+                ).field(name)
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            unified.append(pa.field(name, pa.string()))
+    return pa.schema(unified, metadata=schemas[0].metadata)
+
+
+def _cast_values(pa, column, type_):
+    if pa.types.is_string(type_):
+        return pa.array(
+            [
+                None if value is None else _to_string(value)
+                for value in column.to_pylist()
+            ],
+            type=type_,
+        )
+    values = []
+    for value in column.to_pylist():
+        try:
+            values.append(pa.array([value]).cast(type_)[0].as_py())
+        except (
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+        ):
+            # Values that cannot be converted are left out
+            values.append(None)
+    return pa.array(values, type=type_)
+
+
+def _conform(pa, table, schema):
+    """
+    Converts a table to the schema. Missing columns are filled with nulls
+    and columns of other types are cast, values by value if needed.
+    """
+    columns = []
+    for field in schema:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table.column(field.name)
+        try:
+            columns.append(column.cast(field.type))
+        except (
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+        ):
+            columns.append(_cast_values(pa, column, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def to_arrow(
+    responses: Responses,
+    path: str = "results.organic",
+    schema: Any = None,
+):
+    """
+    Builds an Arrow table from the parsed results of one or many responses.
+
+    Rows are read straight from the raw response data and converted to
+    columns by pyarrow. Column types are inferred separately for the rows
+    of each source and the tables are then unified, so that a column
+    missing from one source is filled with nulls. A column whose values
+    have no common type, e.g. numbers and strings, is converted to
+    strings; pass a schema to choose the types instead.
+
+    Args:
+        responses (Response | dict | Iterable[Response | dict]): The
+        responses, or their raw data.
+        path (str): Dot separated keys in `content_parsed` where the rows
+        are, e.g. "results.organic" or "results.paid".
+        schema (pyarrow.Schema, optional): The schema of the table. Skips
+        type inference if given.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        ValueError: If the rows do not match the given schema.
+
+    Returns:
+        pyarrow.Table: The table.
+    """
+    pa = _import_pyarrow()
+    if isinstance(responses, (Response, dict)):
+        responses = [responses]
+
+    rows_per_source: Dict[Optional[str], List[dict]] = {}
+    for response in responses:
+        raw = response.raw if isinstance(response, Response) else response
+        rows_per_source.setdefault(_get_source(raw), []).extend(
+            get_rows(raw, path)
+        )
+
+    if schema is not None:
+        rows = [row for rows in rows_per_source.values() for row in rows]
+        return _to_table(pa, rows, schema)
+    tables = [
+        _to_table(pa, rows, None)
+        for rows in rows_per_source.values()
+        if rows
+    ]
+    if not tables:
+        return pa.table({})
+    if len(tables) == 1:
+        return tables[0]
+    unified = _unify_schemas(pa, [table.schema for table in tables])
+    return pa.concat_tables([_conform(pa, table, unified) for table in tables])
+
+
+def to_pandas(
+    responses: Responses,
+    path: str = "results.organic",
+    schema: Any = None,
+):
+    """
+    Builds a pandas DataFrame from the parsed results of one or many
+    responses, see `to_arrow`.
+
+    Raises:
+        ImportError: If pyarrow or pandas is not installed.
+
+    Returns:
+        pandas.DataFrame: The data frame.
+    """
+    try:
+        import pandas  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Exporting to pandas requires pandas. "
+            "Install it with `pip install oxylabs[pandas]`"
+        ) from e
+    return to_arrow(responses, path, schema).to_pandas()
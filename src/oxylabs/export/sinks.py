@@ -0,0 +1,362 @@
+import asyncio
+import gzip
+import json
+import queue
+import sqlite3
+import threading
+from typing import Any, List, Optional, Union
+
+from oxylabs.export.arrow import (
+    _conform,
+    _import_pyarrow,
+    _to_table,
+    _unify_schemas,
+    get_rows,
+)
+from oxylabs.internal.spill import encode_content
+from oxylabs.sources.response import Response
+
+_CLOSE = object()
+
+# The number of row groups ParquetSink holds back while the type of a column
+# is unknown because it only has null values
+_MAX_PENDING_ROW_GROUPS = 10
+
+
+def _get_raw(response: Union[Response, dict]) -> dict:
+    return response.raw if isinstance(response, Response) else response
+
+
+class Sink:
+    def __init__(self, queue_size: int = 1000) -> None:
+        """
+        Initializes an instance of the Sink class.
+
+        A sink writes responses on a writer thread, so that callers on an
+        event loop or in worker threads are not blocked by disk I/O. Up to
+        `queue_size` responses wait to be written; writing blocks once the
+        queue is full. Subclasses implement `_open`, `_write`, `_flush` and
+        `_close`, which are only called on the writer thread.
+
+        Args:
+            queue_size (int): The maximum number of responses waiting to be
+            written.
+        """
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"oxylabs-{type(self).__name__}", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, response: Union[Response, dict]) -> None:
+        """
+        Queues a response to be written.
+
+        Args:
+            response (Response | dict): The response or its raw data.
+
+        Raises:
+            RuntimeError: If the sink is closed.
+            Exception: The error raised by the writer thread, if it failed.
+        """
+        self._check()
+        self._queue.put(response)
+
+    async def write_async(self, response: Union[Response, dict]) -> None:
+        """
+        Queues a response to be written without blocking the event loop
+        while the queue is full.
+
+        Args:
+            response (Response | dict): The response or its raw data.
+        """
+        self._check()
+        try:
+            self._queue.put_nowait(response)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._queue.put, response
+            )
+
+    def close(self) -> None:
+        """
+        Writes the queued responses and closes the sink.
+
+        Raises:
+            Exception: The error raised by the writer thread, if it failed.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    async def close_async(self) -> None:
+        """
+        Closes the sink without blocking the event loop, see `close`.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Sink":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close_async()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise RuntimeError("The sink is closed")
+
+    def _run(self) -> None:
+        try:
+            self._open()
+            while True:
+                item = self._queue.get()
+                if item is _CLOSE:
+                    break
+                self._write(_get_raw(item))
+                if self._queue.empty():
+                    # Flush once there is nothing more to write right away
+                    self._flush()
+        except BaseException as e:
+            self._error = e
+            # Unblock writers waiting for space in the queue
+            while self._queue.get() is not _CLOSE:
+                pass
+        finally:
+            try:
+                self._close()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def _open(self) -> None:
+        pass
+
+    def _write(self, raw: dict) -> None:
+        raise NotImplementedError
+
+    def _flush(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+
+class JSONLSink(Sink):
+    def __init__(
+        self,
+        path: str,
+        compression: Optional[str] = None,
+        queue_size: int = 1000,
+    ) -> None:
+        """
+        Initializes an instance of the JSONLSink class.
+
+        Each response is written as one line of JSON.
+
+        Args:
+            path (str): The path of the file. Existing files are appended
+            to.
+            compression (Optional[str]): "gzip", "zstd" or None. zstd
+            requires the zstandard package.
+            queue_size (int): The maximum number of responses waiting to be
+            written.
+
+        Raises:
+            ValueError: If the compression is unknown.
+            ImportError: If zstd compression is requested and zstandard is
+            not installed.
+        """
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "zstd compression requires zstandard. "
+                    "Install it with `pip install oxylabs[zstd]`"
+                ) from e
+        self._path = path
+        self._compression = compression
+        self._file = None
+        super().__init__(queue_size)
+
+    def _open(self) -> None:
+        if self._compression == "gzip":
+            self._file = gzip.open(self._path, "ab")
+        elif self._compression == "zstd":
+            import zstandard
+
+            self._file = zstandard.open(self._path, "ab")
+        else:
+            self._file = open(self._path, "ab")
+
+    def _write(self, raw: dict) -> None:
+        line = json.dumps(raw, default=encode_content, ensure_ascii=False)
+        self._file.write(line.encode() + b"\n")
+
+    def _flush(self) -> None:
+        self._file.flush()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class ParquetSink(Sink):
+    def __init__(
+        self,
+        path: str,
+        rows: str = "results.organic",
+        schema: Any = None,
+        row_group_size: int = 10000,
+        queue_size: int = 1000,
+    ) -> None:
+        """
+        Initializes an instance of the ParquetSink class.
+
+        The rows at a path of the parsed content of each response are
+        buffered and written as a row group once `row_group_size` rows are
+        buffered. Unless a schema is given, it is inferred from the first
+        row group and later rows are converted to it: columns first seen
+        afterwards are left out, values of string columns are converted to
+        strings and other values that cannot be converted are written as
+        null. While a column only has null values, up
+        to 10 row groups are held back until its type is known; a column
+        still without values after that is left out as well.
+
+        Args:
+            path (str): The path of the file. Existing files are replaced.
+            rows (str): Dot separated keys in `content_parsed` where the
+            rows are, see `oxylabs.export.to_arrow`.
+            schema (pyarrow.Schema, optional): The schema of the file.
+            row_group_size (int): The number of rows in each row group.
+            queue_size (int): The maximum number of responses waiting to be
+            written.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        self._pa = _import_pyarrow()
+        self._path = path
+        self._rows_path = rows
+        self._schema = schema
+        self._infer_schema = schema is None
+        self._row_group_size = row_group_size
+        self._rows: List[dict] = []
+        self._pending: List[Any] = []
+        self._writer = None
+        super().__init__(queue_size)
+
+    def _write(self, raw: dict) -> None:
+        self._rows.extend(get_rows(raw, self._rows_path))
+        if len(self._rows) >= self._row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self, closing: bool = False) -> None:
+        import pyarrow.parquet as pq
+
+        pa = self._pa
+        if self._rows or not self._pending:
+            rows, self._rows = self._rows, []
+            schema = None if self._infer_schema else self._schema
+            self._pending.append(_to_table(pa, rows, schema))
+        if self._writer is None:
+            if self._infer_schema:
+                schema = _unify_schemas(
+                    pa, [table.schema for table in self._pending]
+                )
+                typed = [f for f in schema if not pa.types.is_null(f.type)]
+                if len(typed) < len(schema) and not closing:
+                    if len(self._pending) < _MAX_PENDING_ROW_GROUPS:
+                        return
+                    schema = pa.schema(typed, metadata=schema.metadata)
+                self._schema = schema
+            self._writer = pq.ParquetWriter(self._path, self._schema)
+
+        # Row groups are converted to the schema of the file, which is fixed
+        # once the file is created, and written with their original sizes
+        pending, self._pending = self._pending, []
+        for table in pending:
+            self._writer.write_table(_conform(pa, table, self._schema))
+
+    def _close(self) -> None:
+        try:
+            if (
+                self._rows
+                or self._pending
+                or (self._writer is None and self._schema is not None)
+            ):
+                self._write_row_group(closing=True)
+        finally:
+            # The footer is written even if the last rows failed, so that
+            # the row groups written so far can be read
+            if self._writer is not None:
+                self._writer.close()
+
+
+class SQLiteSink(Sink):
+    def __init__(
+        self, path: str, table: str = "responses", queue_size: int = 1000
+    ) -> None:
+        """
+        Initializes an instance of the SQLiteSink class.
+
+        Each response is stored as a row with its job ID, source and JSON
+        data. Rows are committed whenever the queue is drained.
+
+        Args:
+            path (str): The path of the database.
+            table (str): The name of the table, created if missing.
+            queue_size (int): The maximum number of responses waiting to be
+            written.
+
+        Raises:
+            ValueError: If the table name is not a valid identifier.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self._path = path
+        self._table = table
+        self._connection = None
+        super().__init__(queue_size)
+
+    def _open(self) -> None:
+        self._connection = sqlite3.connect(self._path)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} ("
+            "id INTEGER PRIMARY KEY, job_id TEXT, source TEXT, data TEXT)"
+        )
+
+    def _write(self, raw: dict) -> None:
+        job = raw.get("job") if isinstance(raw.get("job"), dict) else {}
+        self._connection.execute(
+            f"INSERT INTO {self._table} (job_id, source, data) "
+            "VALUES (?, ?, ?)",
+            (
+                job.get("id"),
+                job.get("source"),
+                json.dumps(raw, default=encode_content),
+            ),
+        )
+
+    def _flush(self) -> None:
+        self._connection.commit()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
@@ -1 +1,21 @@
-from .client import AsyncClient, RealtimeClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, RealtimeClient
+
+__all__ = ["AsyncClient", "RealtimeClient"]
+
+
+def __getattr__(name: str):
+    # The clients are imported on first access, so that importing a module
+    # of this package does not import every source
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".client", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
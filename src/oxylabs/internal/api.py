@@ -1,13 +1,68 @@
 import base64
+import json
 import logging
+import threading
+import time
 import requests
-import aiohttp
 import asyncio
 from platform import python_version, architecture
-from typing import Optional
+from contextlib import ExitStack, asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from requests.adapters import HTTPAdapter
 from oxylabs._version import __version__
-from oxylabs.utils.defaults import ASYNC_BASE_URL, SYNC_BASE_URL
-from oxylabs.utils.utils import ensure_session, close_session
+from oxylabs.utils.defaults import (
+    ASYNC_BASE_URL,
+    BATCH_QUERY_LIMIT,
+    DEFAULT_CALLBACK_TIMEOUT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POLLER_CONCURRENCY,
+    DEFAULT_POLLER_THRESHOLD,
+    DEFAULT_POOL_MAXSIZE,
+    STREAM_CHUNK_SIZE,
+    SYNC_BASE_URL,
+)
+from oxylabs.internal.cache import ResultCache, is_cacheable
+from oxylabs.internal.decoder import get_decoder
+from oxylabs.internal.in_flight import InFlightLimiter
+from oxylabs.internal.job import JobHandle, get_submitted_jobs
+from oxylabs.internal.journal import FAULTED, JobJournal
+from oxylabs.internal.poller import JobPoller
+from oxylabs.internal.polling import (
+    AdaptivePollStrategy,
+    FixedPollStrategy,
+)
+from oxylabs.internal.rate_limit import RateLimiter
+from oxylabs.internal.retry import (
+    POLL,
+    RESULT,
+    SUBMIT,
+    get_retry_policies,
+)
+from oxylabs.internal.single_flight import AsyncSingleFlight, SingleFlight
+from oxylabs.internal.spill import spilling
+from oxylabs.internal.streaming import ResultsParser, get_captured_requests
+from oxylabs.utils.utils import (
+    close_session,
+    ensure_session,
+    get_payload_key,
+    import_aiohttp,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from oxylabs.internal.callback import CallbackServer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +80,48 @@ class APICredentials:
         credentials = f"{username}:{password}"
         self.encoded_credentials = base64.b64encode(credentials.encode()).decode()
 
+def get_poll_strategy(
+    poll_strategy: Union[str, FixedPollStrategy, None]
+) -> FixedPollStrategy:
+    """
+    Returns the poll strategy for the given option.
+
+    Args:
+        poll_strategy (str | FixedPollStrategy | None): "fixed", "adaptive",
+        a strategy instance or None for the fixed strategy.
+
+    Raises:
+        ValueError: If the option is not a known strategy.
+
+    Returns:
+        FixedPollStrategy: The poll strategy.
+    """
+    if poll_strategy is None or poll_strategy == "fixed":
+        return FixedPollStrategy()
+    if poll_strategy == "adaptive":
+        return AdaptivePollStrategy()
+    if isinstance(poll_strategy, FixedPollStrategy):
+        return poll_strategy
+    raise ValueError(f"Unknown poll strategy: {poll_strategy}")
+
+def get_journal_key(payload: dict) -> str:
+    """
+    Returns the key under which a payload is recorded in the job journal.
+
+    The callback URL is left out as it does not change the result of the
+    job.
+    """
+    return get_payload_key(
+        {k: v for k, v in payload.items() if k != "callback_url"}
+    )
+
+def _is_final_error(status: int) -> bool:
+    """
+    Returns True for client errors of a result request that retrying will
+    not resolve, e.g. 404 for a faulted or expired job.
+    """
+    return 400 <= status < 500 and status != 429
+
 class BaseAPI:
     def __init__(self, base_url: str, api_credentials: APICredentials, **kwargs) -> None:
         """
@@ -33,8 +130,22 @@ class BaseAPI:
         Args:
             base_url (str): The URL of the API.
             api_credentials (APICredentials): An instance of APICredentials used for authentication.
+            json_decoder (str | Callable[[bytes], Any], optional): The JSON
+            backend decoding response bodies, "orjson", "msgspec", "json"
+            or a function. Defaults to the fastest installed backend.
+            spill_threshold (int, optional): The length in characters above
+            which the content of a result is moved to a temporary file and
+            memory mapped on access. Disabled by default.
+            spill_dir (str, optional): The directory of the temporary files.
+            Defaults to the system temporary directory.
         """
         self._base_url = base_url
+        self._decode = get_decoder(kwargs.get("json_decoder"))
+        spill_threshold = kwargs.get("spill_threshold")
+        if spill_threshold is not None:
+            self._decode = spilling(
+                self._decode, spill_threshold, kwargs.get("spill_dir")
+            )
         bits, _ = architecture()
         sdk_type = kwargs.get("sdk_type", f"oxylabs-sdk-python/{__version__} ({python_version()}; {bits})")
         self._headers = {
@@ -50,8 +161,76 @@ class RealtimeAPI(BaseAPI):
 
         Args:
             api_credentials (APICredentials): An instance of APICredentials used for authentication.
+            pool_connections (int, optional): The number of connection pools to cache.
+            pool_maxsize (int, optional): The maximum number of connections kept
+            alive in the pool. Should be at least the number of threads
+            sharing the client.
+            max_retries (int, optional): The number of retries for failed
+            connection attempts.
+            keep_alive (bool, optional): Whether connections are kept open
+            between requests. Defaults to True.
+            retry (RetryPolicy, optional): The policy for retrying requests
+            that were rate limited or failed with a server or connection
+            error. Defaults to `RetryPolicy()`.
+            rate_limiter (RateLimiter, optional): A limiter for the job rate
+            and the number of concurrent jobs.
+            coalesce (bool, optional): Whether identical requests made while
+            one is in progress share its response instead of creating a
+            new job. Defaults to True.
+            cache (ResultCache, optional): A cache of responses. Cached
+            responses are returned without sending a request.
         """
         super().__init__(SYNC_BASE_URL, api_credentials, **kwargs)
+        self._retry_policy = get_retry_policies(kwargs.get("retry"))[SUBMIT]
+        self._rate_limiter: Optional[RateLimiter] = kwargs.get("rate_limiter")
+        self._single_flight = (
+            SingleFlight() if kwargs.get("coalesce", True) else None
+        )
+        self._cache: Optional[ResultCache] = kwargs.get("cache")
+        self._pool_connections = kwargs.get(
+            "pool_connections", DEFAULT_POOL_CONNECTIONS
+        )
+        self._pool_maxsize = kwargs.get("pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        self._max_retries = kwargs.get("max_retries", DEFAULT_MAX_RETRIES)
+        self._keep_alive = kwargs.get("keep_alive", True)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        """
+        Returns the pooled session, creating it on first use.
+
+        The session is shared by all threads using this instance; the
+        underlying urllib3 connection pool is thread-safe.
+
+        Returns:
+            requests.Session: The session used for making requests.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self._pool_connections,
+                        pool_maxsize=self._pool_maxsize,
+                        max_retries=self._max_retries,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update(self._headers)
+                    if not self._keep_alive:
+                        session.headers["Connection"] = "close"
+                    self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """
+        Closes the pooled session and releases its connections.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
 
     def get_response(self, payload:dict, config:dict) -> dict:
         """
@@ -67,7 +246,32 @@ class RealtimeAPI(BaseAPI):
         # Remove empty or null values from the payload
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        return self._get_http_response(payload, "POST", config)
+        captured = get_captured_requests()
+        if captured is not None:
+            captured.append((payload, config))
+            return None
+
+        key = get_payload_key(payload)
+        if self._cache is not None:
+            cached = self._cache.get(key, payload.get("source"))
+            if cached is not None:
+                return cached
+
+        if self._single_flight is None:
+            return self._send(key, payload, config)
+        return self._single_flight.do(
+            key, lambda: self._send(key, payload, config)
+        )
+
+    def _send(self, key: str, payload: dict, config: dict) -> Optional[dict]:
+        if self._rate_limiter is not None:
+            with self._rate_limiter.slot(payload.get("source")):
+                response = self._get_http_response(payload, "POST", config)
+        else:
+            response = self._get_http_response(payload, "POST", config)
+        if self._cache is not None and is_cacheable(response):
+            self._cache.set(key, response, payload.get("source"))
+        return response
 
     def _get_http_response(self, payload: dict, method: str, config: dict) -> Optional[dict]:
         """
@@ -92,38 +296,114 @@ class RealtimeAPI(BaseAPI):
             requests.exceptions.RequestException: If a general request
             error occurs.
         """
-        try:
-            if method == "POST":
-                response = requests.post(
+        if method != "POST":
+            logger.error(f"Unsupported method: {method}")
+            return None
+
+        response = self._post(payload, config)
+        if response is None:
+            return None
+        return self._decode(response.content)
+
+    def iter_results(self, payload: dict, config: dict) -> Iterator[dict]:
+        """
+        Sends the payload and yields the items of the `results` array of
+        the response as they are received, without buffering the whole
+        response.
+
+        Args:
+            payload (dict): The payload for the request.
+            config (dict): The configuration for the request.
+
+        Yields:
+            dict: Each result of the response.
+        """
+        payload = {k: v for k, v in payload.items() if v is not None}
+        with ExitStack() as stack:
+            if self._rate_limiter is not None:
+                stack.enter_context(
+                    self._rate_limiter.slot(payload.get("source"))
+                )
+            response = self._post(payload, config, stream=True)
+            if response is None:
+                return
+            stack.enter_context(response)
+            parser = ResultsParser()
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield self._decode(item)
+
+    def _post(
+        self, payload: dict, config: dict, stream: bool = False
+    ) -> Optional[requests.Response]:
+        """
+        Posts the payload, retrying it according to the retry policy.
+
+        Args:
+            payload (dict): The payload to be sent with the request.
+            config (dict): Additional configuration options for the
+            request.
+            stream (bool): Whether the response body is read lazily.
+
+        Returns:
+            requests.Response: The successful response, or None if an error
+            occurs during the request.
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.throttle(payload.get("source"))
+
+        policy = self._retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._get_session().post(
                     self._base_url,
-                    headers=self._headers,
                     json=payload,
                     timeout=config["request_timeout"],
+                    stream=stream,
                 )
-            else:
-                logger.error(f"Unsupported method: {method}")
-                return None
+                if policy.should_retry_status(response.status_code, attempt):
+                    delay = policy.get_delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    logger.warning(
+                        f"Request failed with status {response.status_code}, "
+                        f"retrying in {delay:.2f}s"
+                    )
+                    response.close()
+                    time.sleep(delay)
+                    continue
 
-            response.raise_for_status()
+                response.raise_for_status()
 
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"Error occurred: {response.status_code}")
-                return None
+                if response.status_code == 200:
+                    return response
+                else:
+                    logger.error(f"Error occurred: {response.status_code}")
+                    return None
 
-        except requests.exceptions.Timeout:
-            logger.error(
-                f"Timeout error. The request to {self._base_url} with method {method} has timed out."
-            )
-            return None
-        except requests.exceptions.HTTPError as err:
-            logger.error(f"HTTP error occurred: {err}")
-            logger.error(response.text)
-            return None
-        except requests.exceptions.RequestException as err:
-            logger.error(f"Error occurred: {err}")
-            return None
+            except requests.exceptions.HTTPError as err:
+                logger.error(f"HTTP error occurred: {err}")
+                logger.error(response.text)
+                return None
+            except requests.exceptions.RequestException as err:
+                timeout = isinstance(err, requests.exceptions.Timeout)
+                connection_error = isinstance(
+                    err, requests.exceptions.ConnectionError
+                )
+                if policy.should_retry_error(timeout, connection_error, attempt):
+                    delay = policy.get_delay(attempt)
+                    logger.warning(f"Request failed: {err}, retrying in {delay:.2f}s")
+                    time.sleep(delay)
+                    continue
+                if timeout:
+                    logger.error(
+                        f"Timeout error. The request to {self._base_url} has timed out."
+                    )
+                else:
+                    logger.error(f"Error occurred: {err}")
+                return None
 
 class AsyncAPI(BaseAPI):
     def __init__(self, api_credentials: APICredentials, **kwargs) -> None:
@@ -132,11 +412,237 @@ class AsyncAPI(BaseAPI):
 
         Args:
             api_credentials (APICredentials): An instance of APICredentials used for authentication.
+            connector_options (dict, optional): Keyword arguments for the
+            aiohttp.TCPConnector, e.g. `limit`, `limit_per_host`,
+            `ttl_dns_cache` or `keepalive_timeout`.
+            use_poller (bool, optional): Whether job statuses are checked by
+            a single shared poller instead of one polling loop per job. By
+            default the poller is used once `poller_threshold` jobs are in
+            flight.
+            poller_threshold (int, optional): The number of jobs in flight
+            from which the shared poller is used. Defaults to 10.
+            poller_concurrency (int, optional): The maximum number of
+            concurrent status requests sent by the poller. Defaults to 50.
+            poll_strategy (str | FixedPollStrategy, optional): How status
+            checks are scheduled. Pass "adaptive" or an AdaptivePollStrategy
+            to learn the expected completion time per source. Defaults to
+            polling every `poll_interval` seconds.
+            callback_timeout (int, optional): The interval in seconds to wait
+            for a completion notice from the callback server before falling
+            back to polling. Defaults to 30.
+            journal (str | JobJournal, optional): A journal, or the path of a
+            SQLite database, recording submitted jobs. Unfinished jobs found
+            in the journal are resumed instead of being submitted again.
+            retry (RetryPolicy | dict, optional): The policy for retrying
+            requests that were rate limited or failed with a server or
+            connection error. Pass a dict to set separate policies for the
+            "submit", "poll" and "result" requests. Defaults to
+            `RetryPolicy()` for each of them.
+            rate_limiter (RateLimiter, optional): A limiter for the job rate
+            and the number of concurrent jobs. Jobs count as concurrent from
+            submission until their result is fetched. Jobs submitted with
+            `submit` or `submit_batch` only take from the job rate.
+            max_in_flight (int, optional): The maximum number of jobs in
+            flight. Further requests wait before submitting their job.
+            Jobs submitted with `submit` or `submit_batch` are not counted.
+            Defaults to no limit.
+            max_in_flight_per_source (Dict[str, int], optional): The maximum
+            number of jobs in flight for individual sources.
+            coalesce (bool, optional): Whether identical requests made while
+            one is in progress share its job instead of creating a new one.
+            Defaults to True.
+            cache (ResultCache, optional): A cache of responses. Cached
+            responses are returned without submitting a job.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
         """
+        import_aiohttp()
         super().__init__(ASYNC_BASE_URL, api_credentials, **kwargs)
+        self._retry_policies = get_retry_policies(kwargs.get("retry"))
+        self._rate_limiter: Optional[RateLimiter] = kwargs.get("rate_limiter")
+        self._in_flight = InFlightLimiter(
+            kwargs.get("max_in_flight"),
+            kwargs.get("max_in_flight_per_source"),
+        )
+        self._single_flight = (
+            AsyncSingleFlight() if kwargs.get("coalesce", True) else None
+        )
+        self._cache: Optional[ResultCache] = kwargs.get("cache")
+        self._connector_options = kwargs.get("connector_options")
+        self._use_poller = kwargs.get("use_poller")
+        self._poller_threshold = kwargs.get(
+            "poller_threshold", DEFAULT_POLLER_THRESHOLD
+        )
+        self._poller_concurrency = kwargs.get(
+            "poller_concurrency", DEFAULT_POLLER_CONCURRENCY
+        )
+        self._poll_strategy = get_poll_strategy(kwargs.get("poll_strategy"))
+        self._poller = None
+        self._callback_server: Optional["CallbackServer"] = None
+        self._callback_timeout = kwargs.get(
+            "callback_timeout", DEFAULT_CALLBACK_TIMEOUT
+        )
+        journal = kwargs.get("journal")
+        if isinstance(journal, str):
+            journal = JobJournal(journal)
+        self._journal: Optional[JobJournal] = journal
         self._session = None
+        self._persistent = False
         self._requests = 0
 
+    async def open(self) -> None:
+        """
+        Opens a long-lived session that is kept until `close` is called.
+
+        Without an open session, a session is created for each burst of
+        requests and closed once no request is in flight.
+        """
+        self._persistent = True
+        self._session = await ensure_session(
+            self._session, self._connector_options
+        )
+
+    async def close(self) -> None:
+        """
+        Closes the session and its connection pool.
+        """
+        self._persistent = False
+        await self.stop_callback_server()
+        if self._poller is not None:
+            await self._poller.close()
+            self._poller = None
+        await close_session(self._session)
+        self._session = None
+
+    async def start_callback_server(self, server: "CallbackServer") -> None:
+        """
+        Starts a callback server that receives job completion notices.
+
+        While it runs, its URL is sent as `callback_url` with every job that
+        does not set one, and jobs are only polled if no notice arrives
+        within `callback_timeout`.
+
+        Args:
+            server (CallbackServer): The server to start.
+        """
+        await self.stop_callback_server()
+        await server.start()
+        self._callback_server = server
+
+    async def stop_callback_server(self) -> None:
+        """
+        Stops the callback server, if one is running.
+        """
+        if self._callback_server is not None:
+            await self._callback_server.stop()
+            self._callback_server = None
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator["aiohttp.ClientSession"]:
+        """
+        Provides the session for the duration of a request.
+
+        Unless a long-lived session was opened, the session is closed once
+        no request is in flight.
+
+        Yields:
+            aiohttp.ClientSession: The session used for making requests.
+        """
+        self._requests += 1
+        try:
+            self._session = await ensure_session(
+                self._session, self._connector_options
+            )
+            yield self._session
+        finally:
+            self._requests -= 1
+            if self._requests == 0 and not self._persistent:
+                await close_session(self._session)
+
+    async def _request(
+        self,
+        phase: str,
+        method: str,
+        url: str,
+        user_session: "aiohttp.ClientSession",
+        **kwargs,
+    ) -> dict:
+        """
+        Sends a request, retrying it according to the retry policy of the
+        given phase.
+
+        Args:
+            phase (str): The request phase, "submit", "poll" or "result".
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the request.
+            **kwargs: Additional arguments passed to the session request.
+
+        Raises:
+            aiohttp.ClientResponseError: If the last attempt failed with an
+            HTTP error.
+            aiohttp.ClientConnectionError: If the last attempt failed to
+            connect.
+            asyncio.TimeoutError: If the last attempt timed out.
+
+        Returns:
+            dict: The JSON response data.
+        """
+        import aiohttp
+
+        policy = self._retry_policies[phase]
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with user_session.request(
+                    method, url, headers=self._headers, **kwargs
+                ) as response:
+                    if policy.should_retry_status(response.status, attempt):
+                        delay = policy.get_delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        logger.warning(
+                            f"Request to {url} failed with status "
+                            f"{response.status}, retrying in {delay:.2f}s"
+                        )
+                    else:
+                        await self._raise_for_status(response)
+                        return self._decode(await response.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                timeout = isinstance(e, asyncio.TimeoutError)
+                if not policy.should_retry_error(timeout, not timeout, attempt):
+                    raise
+                delay = policy.get_delay(attempt)
+                logger.warning(
+                    f"Request to {url} failed: {e!r}, retrying in {delay:.2f}s"
+                )
+            await asyncio.sleep(delay)
+
+    async def _raise_for_status(self, response: "aiohttp.ClientResponse") -> None:
+        import aiohttp
+
+        if response.status >= 400:
+            raise aiohttp.ClientResponseError(
+                response.request_info,
+                response.history,
+                status=response.status,
+                message=await self._get_error_message(response),
+                headers=response.headers,
+            )
+
+    async def _get_error_message(self, response: "aiohttp.ClientResponse") -> str:
+        message = response.reason or ""
+        try:
+            data = self._decode(await response.read())
+            if isinstance(data, dict) and data.get("message"):
+                message = f"{message} - {data['message']}"
+        except Exception:
+            pass
+        return message
+
     async def get_response(self, payload: dict, config: dict) -> Optional[dict]:
         """
         Processes the payload asynchronously and fetches the response.
@@ -148,49 +654,269 @@ class AsyncAPI(BaseAPI):
         Returns:
             dict: The response from the server after the job is completed.
         """
+        submitted_jobs = get_submitted_jobs()
+        if submitted_jobs is not None:
+            submitted_jobs.append(await self.submit(payload, config))
+            return None
+
         # Remove empty or null values from the payload
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        result = None
-        self._requests += 1
+        key = get_payload_key(payload)
+        if self._cache is not None:
+            cached = self._cache.get(key, payload.get("source"))
+            if cached is not None:
+                return cached
+
+        if self._single_flight is None:
+            return await self._process(key, payload, config)
+        return await self._single_flight.do(
+            key, lambda: self._process(key, payload, config)
+        )
 
+    async def _process(
+        self, key: str, payload: dict, config: dict
+    ) -> Optional[dict]:
+        source = payload.get("source")
+        response = None
         try:
-            self._session = await ensure_session(self._session)
+            async with self._in_flight.slot(source), self._job_slot(source):
+                async with self._session_scope() as session:
+                    response = await self._execute_with_timeout(
+                        payload, config, session
+                    )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+        if self._cache is not None and is_cacheable(response):
+            self._cache.set(key, response, source)
+        return response
 
-            result = await self._execute_with_timeout(
-                payload, config, self._session
-            )
-            return result
+    @asynccontextmanager
+    async def _job_slot(self, source: Optional[str]) -> AsyncIterator[None]:
+        """
+        Holds a concurrent job slot of the rate limiter, if one is set.
+        """
+        if self._rate_limiter is None:
+            yield
+            return
+        async with self._rate_limiter.slot_async(source):
+            yield
+
+    async def submit(self, payload: dict, config: dict) -> Optional[JobHandle]:
+        """
+        Submits a job without waiting for it to complete.
+
+        Args:
+            payload (dict): The payload for the request.
+            config (dict): The configuration for the request.
 
+        Returns:
+            Optional[JobHandle]: A handle to the submitted job, or None if
+            the job could not be submitted.
+        """
+        # Remove empty or null values from the payload
+        payload = {k: v for k, v in payload.items() if v is not None}
+        payload, callback = self._with_callback_url(payload)
+
+        job_id = None
+        try:
+            async with self._session_scope() as session:
+                submitted_at = asyncio.get_event_loop().time()
+                job_id = await self._get_job_id(
+                    payload, session, config["request_timeout"]
+                )
         except Exception as e:
             logger.error(f"An error occurred: {e}")
+        if not job_id:
+            logger.error("Failed to get job ID")
+            return None
 
-        finally:
-            self._requests -= 1
-            if self._requests == 0:
-                await close_session(self._session)
+        return JobHandle(
+            self,
+            job_id,
+            config,
+            source=payload.get("source"),
+            submitted_at=submitted_at,
+            callback=callback,
+        )
+
+    async def get_job_response(
+        self, job_id: str, config: dict
+    ) -> Optional[dict]:
+        """
+        Waits for an already submitted job to complete and fetches its
+        response.
+
+        Args:
+            job_id (str): The ID of the job.
+            config (dict): The configuration for the request.
+
+        Returns:
+            dict: The response from the server after the job is completed.
+        """
+        try:
+            async with self._session_scope() as session:
+                return await self._wait_for_result(
+                    job_id,
+                    config,
+                    session,
+                    callback=self._callback_server is not None,
+                )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+        return None
+
+    async def submit_batch(
+        self, payloads: List[dict], config: dict
+    ) -> List[Optional[str]]:
+        """
+        Submits many jobs through the batch endpoint.
+
+        Payloads that only differ in their `query` or `url` are sent together
+        in batches of up to BATCH_QUERY_LIMIT values.
+
+        Args:
+            payloads (List[dict]): The payloads of the jobs to submit. Each
+            payload must contain either a `query` or a `url`.
+            config (dict): The configuration for the request.
+
+        Raises:
+            ValueError: If a payload has neither or both of `query` and
+            `url`.
+
+        Returns:
+            List[Optional[str]]: The job IDs in the order of the payloads.
+            The ID is None if the batch containing the payload failed.
+        """
+        payloads = [
+            {k: v for k, v in payload.items() if v is not None}
+            for payload in payloads
+        ]
+        job_ids = [None] * len(payloads)
+        hashes = [None] * len(payloads)
+        if self._journal is not None:
+            hashes = [get_journal_key(payload) for payload in payloads]
+            job_ids = await self._run_journal(
+                lambda: [self._journal.find_pending(h) for h in hashes]
+            )
+        groups = {}
+        for index, payload in enumerate(payloads):
+            if job_ids[index]:
+                continue
+            if self._callback_server is not None:
+                payload.setdefault(
+                    "callback_url", self._callback_server.callback_url
+                )
+            fields = [f for f in ("query", "url") if f in payload]
+            if len(fields) != 1:
+                raise ValueError(
+                    "Each batch payload must contain either a query or a url"
+                )
+            field = fields[0]
+            value = payload.pop(field)
+            key = (field, json.dumps(payload, sort_keys=True, default=str))
+            group = groups.setdefault(key, (payload, []))
+            group[1].append((index, value))
+
+        async with self._session_scope() as session:
+            for (field, _), (shared, items) in groups.items():
+                for start in range(0, len(items), BATCH_QUERY_LIMIT):
+                    chunk = items[start : start + BATCH_QUERY_LIMIT]
+                    body = {**shared, field: [value for _, value in chunk]}
+                    if self._rate_limiter is not None:
+                        for _ in chunk:
+                            await self._rate_limiter.throttle_async(
+                                shared.get("source")
+                            )
+                    ids = await self._get_batch_job_ids(
+                        body, session, config["request_timeout"]
+                    )
+                    if ids is None:
+                        logger.error("Failed to submit batch")
+                        continue
+                    submitted = []
+                    for (index, value), job_id in zip(chunk, ids):
+                        job_ids[index] = job_id
+                        if hashes[index] is not None:
+                            payload = {**shared, field: value}
+                            submitted.append((hashes[index], job_id, payload))
+                    if submitted:
+                        await self._run_journal(
+                            self._journal.record_submitted_many, submitted
+                        )
+        return job_ids
+
+    async def _get_batch_job_ids(
+        self,
+        body: dict,
+        user_session: "aiohttp.ClientSession",
+        request_timeout: int,
+    ) -> Optional[List[str]]:
+        import aiohttp
+
+        batch_url = f"{self._base_url}/batch"
+        try:
+            data = await self._request(
+                SUBMIT,
+                "POST",
+                batch_url,
+                user_session,
+                json=body,
+                timeout=request_timeout,
+            )
+            return [query["id"] for query in data["queries"]]
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error occurred: {e.status} - {e.message}")
+        except aiohttp.ClientConnectionError as e:
+            logger.error(f"Connection error occurred: {e}")
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Timeout error. The request to {batch_url} has timed out."
+            )
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
         return None
 
     async def _get_job_id(
         self,
         payload: dict,
-        user_session: aiohttp.ClientSession,
+        user_session: "aiohttp.ClientSession",
         request_timeout: int,
     ) -> Optional[str]:
+        import aiohttp
+
+        payload_hash = None
+        if self._journal is not None:
+            payload_hash = get_journal_key(payload)
+            job_id = await self._run_journal(
+                self._journal.find_pending, payload_hash
+            )
+            if job_id:
+                logger.info(f"Resuming unfinished job {job_id}")
+                return job_id
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.throttle_async(payload.get("source"))
         try:
-            async with user_session.post(
+            data = await self._request(
+                SUBMIT,
+                "POST",
                 self._base_url,
-                headers=self._headers,
+                user_session,
                 json=payload,
                 timeout=request_timeout,
-            ) as response:
-                data = await response.json()
-                response.raise_for_status()
-                return data["id"]
-        except aiohttp.ClientResponseError as e:
-            logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
             )
+            job_id = data["id"]
+            if payload_hash is not None:
+                await self._run_journal(
+                    self._journal.record_submitted,
+                    payload_hash,
+                    job_id,
+                    payload,
+                )
+            return job_id
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error occurred: {e.status} - {e.message}")
         except aiohttp.ClientConnectionError as e:
             logger.error(f"Connection error occurred: {e}")
         except asyncio.TimeoutError:
@@ -204,35 +930,78 @@ class AsyncAPI(BaseAPI):
     async def _poll_job_status(
         self,
         job_id: str,
-        poll_interval: int,
-        user_session: aiohttp.ClientSession,
+        delays: Iterator[float],
+        user_session: "aiohttp.ClientSession",
         timeout: int,
+        request_timeout: int,
     ) -> bool:
-        job_status_url = f"{self._base_url}/{job_id}"
-        end_time = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < end_time:
+        loop = asyncio.get_event_loop()
+        end_time = loop.time() + timeout
+        for delay in delays:
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                break
+            # The last status check is made at the deadline
+            await asyncio.sleep(min(delay, remaining))
             try:
-                async with user_session.get(
-                    job_status_url,
-                    headers=self._headers,
-                    timeout=poll_interval,
-                ) as response:
-                    data = await response.json()
-                    response.raise_for_status()
-                    if data["status"] == "done":
-                        return True
-                    elif data["status"] == "faulted":
-                        raise Exception("Job faulted")
+                status = await self._get_job_status(
+                    job_id, user_session, request_timeout
+                )
+                if status == "done":
+                    return True
+                elif status == "faulted":
+                    raise Exception("Job faulted")
             except Exception as e:
                 logger.error(f"Error occurred: {str(e)}")
                 return False
-            await asyncio.sleep(poll_interval)
 
         logger.info("Job completion timeout exceeded")
         return False
 
+    async def _get_job_status(
+        self,
+        job_id: str,
+        user_session: "aiohttp.ClientSession",
+        request_timeout: int,
+    ) -> str:
+        """
+        Retrieves the status of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the request.
+            request_timeout (int): The timeout for the request in seconds.
+
+        Jobs that faulted, or whose status is rejected with a 4xx error,
+        are marked as faulted in the journal.
+
+        Raises:
+            aiohttp.ClientResponseError: If a client response error occurs.
+
+        Returns:
+            str: The job status, e.g. "pending", "done" or "faulted".
+        """
+        import aiohttp
+
+        try:
+            data = await self._request(
+                POLL,
+                "GET",
+                f"{self._base_url}/{job_id}",
+                user_session,
+                timeout=request_timeout,
+            )
+        except aiohttp.ClientResponseError as e:
+            if _is_final_error(e.status):
+                await self._mark_faulted(job_id)
+            raise
+        if data["status"] == "faulted":
+            await self._mark_faulted(job_id)
+        return data["status"]
+
     async def _get_http_response(
-        self, job_id: str, user_session: aiohttp.ClientSession
+        self, job_id: str, user_session: "aiohttp.ClientSession"
     ) -> Optional[dict]:
         """
         Retrieves the HTTP response for a given job ID.
@@ -251,18 +1020,20 @@ class AsyncAPI(BaseAPI):
             asyncio.TimeoutError: If the request times out.
             Exception: If any other error occurs.
         """
+        import aiohttp
+
         result_url = f"{self._base_url}/{job_id}/results"
         try:
-            async with user_session.get(
-                result_url, headers=self._headers
-            ) as response:
-                data = await response.json()
-                response.raise_for_status()
-                return data
-        except aiohttp.ClientResponseError as e:
-            logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
+            data = await self._request(
+                RESULT, "GET", result_url, user_session
             )
+            if self._journal is not None:
+                await self._run_journal(self._journal.mark_done, job_id)
+            return data
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error occurred: {e.status} - {e.message}")
+            if _is_final_error(e.status):
+                await self._mark_faulted(job_id)
         except aiohttp.ClientConnectionError as e:
             logger.error(f"Connection error occurred: {e}")
         except asyncio.TimeoutError:
@@ -270,26 +1041,214 @@ class AsyncAPI(BaseAPI):
                 f"Timeout error. The request to {result_url} has timed out."
             )
         except Exception as e:
-            logger.error(f"An error occurred: {e} - {data['message']}")
+            logger.error(f"An error occurred: {e}")
         return None
 
+    async def iter_job_results(self, job_id: str) -> AsyncIterator[dict]:
+        """
+        Yields the items of the `results` array of a completed job as they
+        are received, without buffering the whole response.
+
+        Args:
+            job_id (str): The ID of the job.
+
+        Raises:
+            aiohttp.ClientResponseError: If a client response error occurs.
+            aiohttp.ClientConnectionError: If a client connection error occurs.
+
+        Yields:
+            dict: Each result of the job.
+        """
+        result_url = f"{self._base_url}/{job_id}/results"
+        policy = self._retry_policies[RESULT]
+        async with self._session_scope() as session:
+            attempt = 0
+            while True:
+                attempt += 1
+                async with session.get(
+                    result_url, headers=self._headers
+                ) as response:
+                    if not policy.should_retry_status(response.status, attempt):
+                        if _is_final_error(response.status):
+                            await self._mark_faulted(job_id)
+                        await self._raise_for_status(response)
+                        parser = ResultsParser()
+                        async for chunk in response.content.iter_chunked(
+                            STREAM_CHUNK_SIZE
+                        ):
+                            for item in parser.feed(chunk):
+                                yield self._decode(item)
+                        if self._journal is not None:
+                            await self._run_journal(
+                                self._journal.mark_done, job_id
+                            )
+                        return
+                    delay = policy.get_delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                logger.warning(
+                    f"Request to {result_url} failed with status "
+                    f"{response.status}, retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def _mark_faulted(self, job_id: str) -> None:
+        """
+        Records in the journal that the result of a job will never be
+        collected.
+        """
+        if self._journal is not None:
+            await self._run_journal(self._journal.mark_done, job_id, FAULTED)
+
+    async def _run_journal(self, function: Callable, *args) -> Any:
+        """
+        Runs a journal call on a worker thread, so that SQLite commits do
+        not block the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, function, *args
+        )
+
+    def _with_callback_url(self, payload: dict) -> Tuple[dict, bool]:
+        """
+        Sets the callback server URL as `callback_url` of the payload unless
+        the payload already has one.
+
+        Returns:
+            Tuple[dict, bool]: The payload and whether the job reports to the
+            callback server.
+        """
+        if self._callback_server is None or "callback_url" in payload:
+            return payload, False
+        payload = {**payload, "callback_url": self._callback_server.callback_url}
+        return payload, True
+
     async def _execute_with_timeout(
-        self, payload: dict, config: dict, user_session: aiohttp.ClientSession
+        self, payload: dict, config: dict, user_session: "aiohttp.ClientSession"
     ) -> dict:
 
         request_timeout = config["request_timeout"]
-        job_completion_timeout = config["job_completion_timeout"]
-        poll_interval = config["poll_interval"]
 
+        payload, callback = self._with_callback_url(payload)
+        submitted_at = asyncio.get_event_loop().time()
         job_id = await self._get_job_id(payload, user_session, request_timeout)
         if not job_id:
             logger.error("Failed to get job ID")
+            return None
 
-        job_completed = await self._poll_job_status(
-            job_id, poll_interval, user_session, job_completion_timeout
+        return await self._wait_for_result(
+            job_id,
+            config,
+            user_session,
+            source=payload.get("source"),
+            submitted_at=submitted_at,
+            callback=callback,
+        )
+
+    async def _wait_for_result(
+        self,
+        job_id: str,
+        config: dict,
+        user_session: "aiohttp.ClientSession",
+        source: Optional[str] = None,
+        submitted_at: Optional[float] = None,
+        callback: bool = False,
+    ) -> Optional[dict]:
+        await self._wait_for_job(
+            job_id, config, user_session, source, submitted_at, callback
         )
+        result = await self._get_http_response(job_id, user_session)
+        return result
+
+    async def _wait_for_job(
+        self,
+        job_id: str,
+        config: dict,
+        user_session: "aiohttp.ClientSession",
+        source: Optional[str] = None,
+        submitted_at: Optional[float] = None,
+        callback: bool = False,
+    ) -> bool:
+        job_completion_timeout = config["job_completion_timeout"]
+        delays = self._poll_strategy.schedule(source, config["poll_interval"])
+
+        job_completed = None
+        if callback and self._callback_server is not None:
+            callback_timeout = min(
+                self._callback_timeout, job_completion_timeout
+            )
+            loop = asyncio.get_running_loop()
+            started_at = loop.time()
+            status = await self._callback_server.wait(
+                job_id, callback_timeout
+            )
+            if status is not None and status != "done":
+                # A failure notice is confirmed before the job is given up
+                status = await self._confirm_status(
+                    job_id, user_session, config["request_timeout"]
+                )
+            if status == "done":
+                job_completed = True
+            elif status == "faulted":
+                logger.error("Error occurred: Job faulted")
+                job_completed = False
+            else:
+                job_completion_timeout -= loop.time() - started_at
+
+        if job_completed is None and self._should_use_poller():
+            job_completed = await self._get_poller().wait(
+                job_id,
+                delays,
+                job_completion_timeout,
+                config["request_timeout"],
+            )
+        elif job_completed is None:
+            job_completed = await self._poll_job_status(
+                job_id,
+                delays,
+                user_session,
+                job_completion_timeout,
+                config["request_timeout"],
+            )
         if not job_completed:
+            # Jobs that faulted were marked in the journal when their status
+            # was received. Jobs that timed out locally stay pending there,
+            # as they may still complete
             logger.error("Job did not complete successfully")
+        elif submitted_at is not None:
+            self._poll_strategy.record(
+                source, asyncio.get_event_loop().time() - submitted_at
+            )
+        return job_completed
 
-        result = await self._get_http_response(job_id, user_session)
-        return result
\ No newline at end of file
+    async def _confirm_status(
+        self,
+        job_id: str,
+        user_session: "aiohttp.ClientSession",
+        request_timeout: int,
+    ) -> Optional[str]:
+        """
+        Checks the status of a job with the API once, returning None if it
+        could not be retrieved.
+        """
+        try:
+            return await self._get_job_status(
+                job_id, user_session, request_timeout
+            )
+        except Exception as e:
+            logger.error(f"Error occurred: {str(e)}")
+            return None
+
+    def _should_use_poller(self) -> bool:
+        if self._use_poller is not None:
+            return self._use_poller
+        return self._requests >= self._poller_threshold
+
+    def _get_poller(self) -> JobPoller:
+        """
+        Returns the shared job poller of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._poller is None or self._poller.loop is not loop:
+            self._poller = JobPoller(self, self._poller_concurrency)
+        return self._poller
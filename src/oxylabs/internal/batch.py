@@ -0,0 +1,268 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+class BatchResult:
+    def __init__(
+        self,
+        index: int,
+        call: Any,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Initializes an instance of the BatchResult class.
+
+        Args:
+            index (int): The position of the call in the submitted batch.
+            call (Any): The call as it was passed to the batch.
+            response (Any): The value returned by the call, if it succeeded.
+            error (Optional[BaseException]): The exception raised by the
+            call, if it failed.
+        """
+        self.index = index
+        self.call = call
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if the call completed without raising.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, {state})"
+
+
+def as_callable(call: Any) -> Callable[[], Any]:
+    """
+    Converts a batch call specification into a zero-argument callable.
+
+    A call can be a callable taking no arguments (e.g. a lambda or
+    functools.partial) or a tuple of `(fn, args)` or `(fn, args, kwargs)`.
+
+    Args:
+        call (Any): The call specification.
+
+    Raises:
+        TypeError: If the call specification is not supported.
+
+    Returns:
+        Callable[[], Any]: A callable running the call.
+    """
+    if callable(call):
+        return call
+    if isinstance(call, tuple) and 1 <= len(call) <= 3 and callable(call[0]):
+        fn = call[0]
+        args = tuple(call[1]) if len(call) > 1 else ()
+        kwargs = dict(call[2]) if len(call) > 2 else {}
+        return lambda: fn(*args, **kwargs)
+    raise TypeError(
+        "Batch calls must be callables or (fn, args[, kwargs]) tuples, "
+        f"got {type(call).__name__}"
+    )
+
+
+def _run(index: int, call: Any, sink: Any = None) -> BatchResult:
+    try:
+        response = as_callable(call)()
+    except Exception as e:
+        return BatchResult(index, call, error=e)
+    if sink is not None and _has_results(response):
+        sink.write(response)
+    return BatchResult(index, call, response=response)
+
+
+def _has_results(response: Any) -> bool:
+    # Failed source calls return an empty Response, which is not written
+    return bool(getattr(response, "raw", None))
+
+
+def run_batch(
+    calls: Iterable[Any], max_workers: int, sink: Any = None
+) -> List[BatchResult]:
+    """
+    Runs the calls on a bounded thread pool and returns their results in
+    the order the calls were given.
+
+    Args:
+        calls (Iterable[Any]): The calls to run.
+        max_workers (int): The maximum number of calls running at once.
+        sink (Sink, optional): A sink each response is written to as its
+        call completes.
+
+    Returns:
+        List[BatchResult]: The result of every call.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run, index, call, sink)
+            for index, call in enumerate(calls)
+        ]
+        return [future.result() for future in futures]
+
+
+def iter_batch(
+    calls: Iterable[Any], max_workers: int, sink: Any = None
+) -> Iterator[BatchResult]:
+    """
+    Runs the calls on a bounded thread pool and yields their results as
+    they complete.
+
+    Calls that have not started yet are cancelled if the iterator is closed
+    early.
+
+    Args:
+        calls (Iterable[Any]): The calls to run.
+        max_workers (int): The maximum number of calls running at once.
+        sink (Sink, optional): A sink each response is written to as its
+        call completes.
+
+    Yields:
+        BatchResult: The result of each call, in completion order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run, index, call, sink)
+            for index, call in enumerate(calls)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def as_awaitable(request: Any) -> Awaitable:
+    """
+    Converts a stream request into an awaitable.
+
+    A request can be an awaitable (e.g. an unawaited source call), a
+    callable returning an awaitable, or a tuple of `(fn, args)` or
+    `(fn, args, kwargs)`.
+
+    Args:
+        request (Any): The request specification.
+
+    Raises:
+        TypeError: If the request specification is not supported.
+
+    Returns:
+        Awaitable: An awaitable running the request.
+    """
+    if inspect.isawaitable(request):
+        return request
+    awaitable = as_callable(request)()
+    if not inspect.isawaitable(awaitable):
+        raise TypeError(
+            f"Stream requests must produce awaitables, got {type(awaitable).__name__}"
+        )
+    return awaitable
+
+
+async def _run_async(request: Any) -> Tuple[Any, Any, Optional[BaseException]]:
+    try:
+        return request, await as_awaitable(request), None
+    except Exception as e:
+        return request, None, e
+
+
+async def stream_requests(
+    requests: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int,
+    return_exceptions: bool = False,
+    sink: Any = None,
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Runs requests with at most `concurrency` of them in flight and yields
+    their results as they complete.
+
+    Requests are pulled lazily from the iterable, so it can be a generator
+    of any length. Requests still running are cancelled if the iterator is
+    closed early.
+
+    Args:
+        requests (Union[Iterable[Any], AsyncIterable[Any]]): The requests to
+        run.
+        concurrency (int): The maximum number of requests in flight.
+        return_exceptions (bool): If True, exceptions raised by a request are
+        yielded in place of its result instead of being raised. Otherwise
+        the error is raised once the results of requests that completed at
+        the same time are yielded.
+        sink (Sink, optional): A sink each response is written to before it
+        is yielded.
+
+    Yields:
+        Tuple[Any, Any]: The request and its result, in completion order.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if isinstance(requests, AsyncIterable):
+        iterator = requests.__aiter__()
+
+        async def next_request() -> Any:
+            return await iterator.__anext__()
+
+    else:
+        sync_iterator = iter(requests)
+
+        async def next_request() -> Any:
+            try:
+                return next(sync_iterator)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    request = await next_request()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run_async(request)))
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Successful results completed together with a failed request
+            # are yielded before its error is raised
+            first_error = None
+            for task in done:
+                request, result, error = task.result()
+                if error is not None:
+                    if not return_exceptions:
+                        first_error = first_error or error
+                        continue
+                    result = error
+                elif sink is not None and _has_results(result):
+                    await sink.write_async(result)
+                yield request, result
+            if first_error is not None:
+                raise first_error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,220 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from oxylabs.internal.spill import encode_content
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    source TEXT,
+    value BLOB NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS results_expires_at ON results (expires_at);
+"""
+
+
+def is_cacheable(response: Optional[dict]) -> bool:
+    """
+    Returns True if a response can be cached, i.e. it has results and every
+    result was retrieved successfully.
+    """
+    if not response or not response.get("results"):
+        return False
+    return all(
+        200 <= (result.get("status_code") or 200) < 300
+        for result in response["results"]
+    )
+
+
+class ResultCache:
+    def __init__(
+        self,
+        ttl: Optional[float] = 3600,
+        ttl_per_source: Optional[Dict[str, Optional[float]]] = None,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        compression_level: int = 6,
+    ) -> None:
+        """
+        Initializes an instance of the ResultCache class.
+
+        Responses are kept in an in-memory LRU tier and, if `path` is set,
+        in a SQLite database with zlib compressed values that persists
+        between runs.
+
+        Args:
+            ttl (Optional[float]): The time in seconds a response is reused,
+            or None to keep it until it is evicted.
+            ttl_per_source (Optional[Dict[str, Optional[float]]]): TTLs for
+            individual sources, e.g. `{source.GOOGLE_SEARCH: 3600}`. A TTL
+            of 0 disables caching for the source.
+            max_entries (int): The maximum number of responses kept in
+            memory.
+            path (Optional[str]): The path of the SQLite database of the disk
+            tier, or None to only cache in memory.
+            compression_level (int): The zlib compression level of the disk
+            tier.
+        """
+        self._ttl = ttl
+        self._ttl_per_source = dict(ttl_per_source or {})
+        self._max_entries = max_entries
+        self._compression_level = compression_level
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[dict, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._connection:
+                if path != ":memory:":
+                    self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.executescript(_SCHEMA)
+
+    def get_ttl(self, source: Optional[str]) -> Optional[float]:
+        """
+        Returns the TTL in seconds of responses of the source.
+        """
+        return self._ttl_per_source.get(source, self._ttl)
+
+    def get(self, key: str, source: Optional[str] = None) -> Optional[dict]:
+        """
+        Returns the cached response for a payload key.
+
+        Args:
+            key (str): The key of the payload, see `get_payload_key`.
+            source (Optional[str]): The source of the payload.
+
+        Returns:
+            Optional[dict]: The response, or None if it is not cached or has
+            expired.
+        """
+        if self.get_ttl(source) == 0:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._memory[key]
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT value, expires_at FROM results WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    blob, expires_at = row
+                    if expires_at is None or expires_at > now:
+                        value = json.loads(zlib.decompress(blob))
+                        self._remember(key, value, expires_at)
+                        self._hits += 1
+                        self._disk_hits += 1
+                        return value
+                    with self._connection:
+                        self._connection.execute(
+                            "DELETE FROM results WHERE key = ?", (key,)
+                        )
+
+            self._misses += 1
+        return None
+
+    def set(self, key: str, value: dict, source: Optional[str] = None) -> None:
+        """
+        Caches a response for a payload key.
+
+        Args:
+            key (str): The key of the payload, see `get_payload_key`.
+            value (dict): The response.
+            source (Optional[str]): The source of the payload.
+        """
+        ttl = self.get_ttl(source)
+        if ttl == 0:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        blob = None
+        if self._connection is not None:
+            blob = zlib.compress(
+                json.dumps(value, default=encode_content).encode(),
+                self._compression_level,
+            )
+
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if blob is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO results (key, source, value,"
+                        " expires_at) VALUES (?, ?, ?, ?)",
+                        (key, source, blob, expires_at),
+                    )
+
+    def _remember(
+        self, key: str, value: dict, expires_at: Optional[float]
+    ) -> None:
+        # Must be called with the lock held
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def prune(self) -> None:
+        """
+        Removes expired responses from the disk tier.
+        """
+        if self._connection is None:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM results WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def clear(self) -> None:
+        """
+        Removes every cached response.
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute("DELETE FROM results")
+
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: The number of `hits`, of which `disk_hits` were served by
+            the disk tier, the number of `misses` and the number of
+            responses held in memory as `size`.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "size": len(self._memory),
+            }
+
+    def close(self) -> None:
+        """
+        Closes the database connection of the disk tier.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
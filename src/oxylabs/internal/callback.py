@@ -0,0 +1,171 @@
+import asyncio
+import hmac
+import ipaddress
+import logging
+import secrets
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# Number of notices kept for jobs nobody waits on yet
+_MAX_EARLY_NOTICES = 10000
+
+
+def _is_reachable(host: str) -> bool:
+    """
+    Returns False for wildcard and loopback hosts, which cannot be used in
+    the callback URL.
+    """
+    if not host or host == "localhost":
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        # A host name, assumed to resolve to a reachable address
+        return True
+    return not (address.is_unspecified or address.is_loopback)
+
+
+class CallbackServer:
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        public_url: Optional[str] = None,
+        path: str = "/oxylabs/callback",
+        token: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes an instance of the CallbackServer class.
+
+        The server receives the job completion notices Oxylabs sends to the
+        `callback_url` of a job and wakes up the coroutines waiting on them.
+        The callback URL ends with a secret token, and requests to the
+        server without it are rejected, so that notices cannot be forged by
+        anyone who only knows the public URL.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on. Use 0 to pick a free port.
+            public_url (Optional[str]): The URL under which Oxylabs can reach
+            the server, e.g. "https://example.com/oxylabs/callback". Defaults
+            to the local address of the server, which is only allowed if
+            `host` is a reachable address.
+            path (str): The path notices are received on. The token is
+            appended to it and to `public_url`.
+            token (Optional[str]): The secret token of the callback URL.
+            Defaults to a random token.
+
+        Raises:
+            ValueError: If `public_url` is missing and `host` is a wildcard
+            or loopback address, which Oxylabs cannot reach.
+        """
+        if not public_url and not _is_reachable(host):
+            raise ValueError(
+                f"Oxylabs cannot send callbacks to {host or 'all interfaces'}. "
+                "Pass the public_url under which the server can be reached"
+            )
+        self._host = host
+        self._port = port
+        self._public_url = public_url
+        self._path = path.rstrip("/")
+        self._token = token or secrets.token_urlsafe(32)
+        self._runner: Optional[web.AppRunner] = None
+        self._waiters: Dict[str, asyncio.Future] = {}
+        self._notices: "OrderedDict[str, str]" = OrderedDict()
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def callback_url(self) -> str:
+        """
+        Returns the URL sent as `callback_url` with each job.
+        """
+        if self._public_url:
+            return f"{self._public_url.rstrip('/')}/{self._token}"
+        return f"http://{self._host}:{self._port}{self._path}/{self._token}"
+
+    async def start(self) -> None:
+        """
+        Starts listening for job completion notices.
+        """
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_post(self._path + "/{token}", self._handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, self._host, self._port)
+        await site.start()
+        if self._port == 0:
+            self._port = site._server.sockets[0].getsockname()[1]
+        self._runner = runner
+
+    async def stop(self) -> None:
+        """
+        Stops the server and releases every waiting job.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        for future in self._waiters.values():
+            if not future.done():
+                future.set_result(None)
+        self._waiters.clear()
+        self._notices.clear()
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[str]:
+        """
+        Waits for the completion notice of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+            timeout (float): The maximum time to wait in seconds.
+
+        Returns:
+            Optional[str]: The status reported for the job, e.g. "done" or
+            "faulted", or None if no notice arrived in time.
+        """
+        if job_id in self._notices:
+            return self._notices.pop(job_id)
+
+        future = self._waiters.get(job_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[job_id] = future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if self._waiters.get(job_id) is future:
+                del self._waiters[job_id]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        token = request.match_info["token"]
+        if not hmac.compare_digest(token.encode(), self._token.encode()):
+            logger.warning("Callback with an invalid token rejected")
+            return web.Response(status=403)
+        try:
+            data = await request.json()
+            job_id = str(data["id"])
+            status = data.get("status", "done")
+        except Exception as e:
+            logger.error(f"Invalid callback received: {e}")
+            return web.Response(status=400)
+
+        future = self._waiters.pop(job_id, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(status)
+        else:
+            # The notice arrived before anyone waited on the job
+            self._notices[job_id] = status
+            while len(self._notices) > _MAX_EARLY_NOTICES:
+                self._notices.popitem(last=False)
+        return web.Response(status=200)
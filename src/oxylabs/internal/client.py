@@ -1,57 +1,164 @@
+import asyncio
+import importlib
 import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from oxylabs.internal.api import APICredentials, RealtimeAPI, AsyncAPI
-from oxylabs.sources.real_estate.airbnb import Airbnb, AirbnbAsync
-from oxylabs.sources.real_estate.zillow import Zillow, ZillowAsync
-from oxylabs.sources.amazon import Amazon, AmazonAsync
-from oxylabs.sources.asian.alibaba import Alibaba, AlibabaAsync
-from oxylabs.sources.asian.aliexpress import Aliexpress, AliexpressAsync
-from oxylabs.sources.asian.avnet import Avnet, AvnetAsync
-from oxylabs.sources.asian.flipkart import Flipkart, FlipkartAsync
-from oxylabs.sources.asian.indiamart import Indiamart, IndiamartAsync
-from oxylabs.sources.asian.lazada import Lazada, LazadaAsync
-from oxylabs.sources.asian.rakuten import Rakuten, RakutenAsync
-from oxylabs.sources.asian.tokopedia import Tokopedia, TokopediaAsync
-from oxylabs.sources.bing import Bing, BingAsync
-from oxylabs.sources.north_american.bedbathandbeyond import Bedbathandbeyond, BedbathandbeyondAsync
-from oxylabs.sources.north_american.bestbuy import Bestbuy, BestbuyAsync
-from oxylabs.sources.north_american.bodegaaurrera import Bodegaaurrera, BodegaaurreraAsync
-from oxylabs.sources.north_american.costco import Costco, CostcoAsync
-from oxylabs.sources.north_american.grainger import Grainger, GraingerAsync
-from oxylabs.sources.north_american.instacart import Instacart, InstacartAsync
-from oxylabs.sources.north_american.lowes import Lowes, LowesAsync
-from oxylabs.sources.north_american.menards import Menards, MenardsAsync
-from oxylabs.sources.north_american.petco import Petco, PetcoAsync
-from oxylabs.sources.north_american.publix import Publix, PublixAsync
-from oxylabs.sources.north_american.target_store import TargetStore, TargetStoreAsync
-from oxylabs.sources.european.allegro import Allegro, AllegroAsync
-from oxylabs.sources.european.cdiscount import Cdiscount, CdiscountAsync
-from oxylabs.sources.european.idealo import Idealo, IdealoAsync
-from oxylabs.sources.european.mediamarkt import Mediamarkt, MediamarktAsync
-from oxylabs.sources.chatgpt import Chatgpt, ChatgptAsync
-from oxylabs.sources.latin_american.dcard import Dcard, DcardAsync
-from oxylabs.sources.ebay import Ebay, EbayAsync
-from oxylabs.sources.etsy import Etsy, EtsyAsync
-from oxylabs.sources.google import Google, GoogleAsync
-from oxylabs.sources.google_shopping import GoogleShopping, GoogleShoppingAsync
-from oxylabs.sources.kroger import Kroger, KrogerAsync
-from oxylabs.sources.perplexity import Perplexity, PerplexityAsync
-from oxylabs.sources.asian.shein import Shein, SheinAsync
-from oxylabs.sources.north_american.staples import Staples, StaplesAsync
-from oxylabs.sources.north_american.walmart import Walmart, WalmartAsync
-from oxylabs.sources.latin_american.falabella import Falabella, FalabellaAsync
-from oxylabs.sources.latin_american.mercadolibre import Mercadolibre, MercadolibreAsync
-from oxylabs.sources.latin_american.mercadolivre import Mercadolivre, MercadolivreAsync
-from oxylabs.sources.latin_american.magazineluiza import Magazineluiza, MagazineluizaAsync
-from oxylabs.sources.tiktok import Tiktok, TiktokAsync
-from oxylabs.sources.universal import Universal, UniversalAsync
-from oxylabs.sources.wayfair import Wayfair, WayfairAsync
-from oxylabs.sources.youtube import Youtube, YoutubeAsync
+from oxylabs.internal.batch import (
+    BatchResult,
+    as_callable,
+    iter_batch,
+    run_batch,
+    stream_requests,
+)
+from oxylabs.internal.job import JobHandle, submitting
+from oxylabs.internal.streaming import capturing
+from oxylabs.sources.response import Response, Results
+from oxylabs.utils.utils import prepare_config
+
+if TYPE_CHECKING:
+    from oxylabs.export.sinks import Sink
+    from oxylabs.internal.callback import CallbackServer
+    from oxylabs.sources.real_estate.airbnb import Airbnb, AirbnbAsync
+    from oxylabs.sources.real_estate.zillow import Zillow, ZillowAsync
+    from oxylabs.sources.amazon import Amazon, AmazonAsync
+    from oxylabs.sources.asian.alibaba import Alibaba, AlibabaAsync
+    from oxylabs.sources.asian.aliexpress import Aliexpress, AliexpressAsync
+    from oxylabs.sources.asian.avnet import Avnet, AvnetAsync
+    from oxylabs.sources.asian.flipkart import Flipkart, FlipkartAsync
+    from oxylabs.sources.asian.indiamart import Indiamart, IndiamartAsync
+    from oxylabs.sources.asian.lazada import Lazada, LazadaAsync
+    from oxylabs.sources.asian.rakuten import Rakuten, RakutenAsync
+    from oxylabs.sources.asian.tokopedia import Tokopedia, TokopediaAsync
+    from oxylabs.sources.bing import Bing, BingAsync
+    from oxylabs.sources.north_american.bedbathandbeyond import Bedbathandbeyond, BedbathandbeyondAsync
+    from oxylabs.sources.north_american.bestbuy import Bestbuy, BestbuyAsync
+    from oxylabs.sources.north_american.bodegaaurrera import Bodegaaurrera, BodegaaurreraAsync
+    from oxylabs.sources.north_american.costco import Costco, CostcoAsync
+    from oxylabs.sources.north_american.grainger import Grainger, GraingerAsync
+    from oxylabs.sources.north_american.instacart import Instacart, InstacartAsync
+    from oxylabs.sources.north_american.lowes import Lowes, LowesAsync
+    from oxylabs.sources.north_american.menards import Menards, MenardsAsync
+    from oxylabs.sources.north_american.petco import Petco, PetcoAsync
+    from oxylabs.sources.north_american.publix import Publix, PublixAsync
+    from oxylabs.sources.north_american.target_store import TargetStore, TargetStoreAsync
+    from oxylabs.sources.european.allegro import Allegro, AllegroAsync
+    from oxylabs.sources.european.cdiscount import Cdiscount, CdiscountAsync
+    from oxylabs.sources.european.idealo import Idealo, IdealoAsync
+    from oxylabs.sources.european.mediamarkt import Mediamarkt, MediamarktAsync
+    from oxylabs.sources.chatgpt import Chatgpt, ChatgptAsync
+    from oxylabs.sources.latin_american.dcard import Dcard, DcardAsync
+    from oxylabs.sources.ebay import Ebay, EbayAsync
+    from oxylabs.sources.etsy import Etsy, EtsyAsync
+    from oxylabs.sources.google import Google, GoogleAsync
+    from oxylabs.sources.google_shopping import GoogleShopping, GoogleShoppingAsync
+    from oxylabs.sources.kroger import Kroger, KrogerAsync
+    from oxylabs.sources.perplexity import Perplexity, PerplexityAsync
+    from oxylabs.sources.asian.shein import Shein, SheinAsync
+    from oxylabs.sources.north_american.staples import Staples, StaplesAsync
+    from oxylabs.sources.north_american.walmart import Walmart, WalmartAsync
+    from oxylabs.sources.latin_american.falabella import Falabella, FalabellaAsync
+    from oxylabs.sources.latin_american.mercadolibre import Mercadolibre, MercadolibreAsync
+    from oxylabs.sources.latin_american.mercadolivre import Mercadolivre, MercadolivreAsync
+    from oxylabs.sources.latin_american.magazineluiza import Magazineluiza, MagazineluizaAsync
+    from oxylabs.sources.tiktok import Tiktok, TiktokAsync
+    from oxylabs.sources.universal import Universal, UniversalAsync
+    from oxylabs.sources.wayfair import Wayfair, WayfairAsync
+    from oxylabs.sources.youtube import Youtube, YoutubeAsync
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _Source:
+    def __init__(self, module: str, name: str) -> None:
+        """
+        Initializes an instance of the _Source class.
+
+        A source attribute of a client. The module of the source is only
+        imported and the source instantiated when the attribute is first
+        read. The instance is then stored on the client, so later reads
+        are plain attribute lookups.
+
+        Args:
+            module (str): The module of the source class.
+            name (str): The name of the source class.
+        """
+        self._module = module
+        self._name = name
+        self._attribute = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attribute = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        cls = getattr(importlib.import_module(self._module), self._name)
+        source = cls(instance._api)
+        instance.__dict__[self._attribute] = source
+        return source
+
 class RealtimeClient:
+    airbnb: "Airbnb" = _Source("oxylabs.sources.real_estate.airbnb", "Airbnb")
+    alibaba: "Alibaba" = _Source("oxylabs.sources.asian.alibaba", "Alibaba")
+    aliexpress: "Aliexpress" = _Source("oxylabs.sources.asian.aliexpress", "Aliexpress")
+    allegro: "Allegro" = _Source("oxylabs.sources.european.allegro", "Allegro")
+    amazon: "Amazon" = _Source("oxylabs.sources.amazon", "Amazon")
+    avnet: "Avnet" = _Source("oxylabs.sources.asian.avnet", "Avnet")
+    bedbathandbeyond: "Bedbathandbeyond" = _Source("oxylabs.sources.north_american.bedbathandbeyond", "Bedbathandbeyond")
+    bestbuy: "Bestbuy" = _Source("oxylabs.sources.north_american.bestbuy", "Bestbuy")
+    bodegaaurrera: "Bodegaaurrera" = _Source("oxylabs.sources.north_american.bodegaaurrera", "Bodegaaurrera")
+    bing: "Bing" = _Source("oxylabs.sources.bing", "Bing")
+    cdiscount: "Cdiscount" = _Source("oxylabs.sources.european.cdiscount", "Cdiscount")
+    chatgpt: "Chatgpt" = _Source("oxylabs.sources.chatgpt", "Chatgpt")
+    costco: "Costco" = _Source("oxylabs.sources.north_american.costco", "Costco")
+    dcard: "Dcard" = _Source("oxylabs.sources.latin_american.dcard", "Dcard")
+    ebay: "Ebay" = _Source("oxylabs.sources.ebay", "Ebay")
+    etsy: "Etsy" = _Source("oxylabs.sources.etsy", "Etsy")
+    falabella: "Falabella" = _Source("oxylabs.sources.latin_american.falabella", "Falabella")
+    flipkart: "Flipkart" = _Source("oxylabs.sources.asian.flipkart", "Flipkart")
+    indiamart: "Indiamart" = _Source("oxylabs.sources.asian.indiamart", "Indiamart")
+    lazada: "Lazada" = _Source("oxylabs.sources.asian.lazada", "Lazada")
+    rakuten: "Rakuten" = _Source("oxylabs.sources.asian.rakuten", "Rakuten")
+    tokopedia: "Tokopedia" = _Source("oxylabs.sources.asian.tokopedia", "Tokopedia")
+    google: "Google" = _Source("oxylabs.sources.google", "Google")
+    google_shopping: "GoogleShopping" = _Source("oxylabs.sources.google_shopping", "GoogleShopping")
+    grainger: "Grainger" = _Source("oxylabs.sources.north_american.grainger", "Grainger")
+    idealo: "Idealo" = _Source("oxylabs.sources.european.idealo", "Idealo")
+    instacart: "Instacart" = _Source("oxylabs.sources.north_american.instacart", "Instacart")
+    kroger: "Kroger" = _Source("oxylabs.sources.kroger", "Kroger")
+    lowes: "Lowes" = _Source("oxylabs.sources.north_american.lowes", "Lowes")
+    mediamarkt: "Mediamarkt" = _Source("oxylabs.sources.european.mediamarkt", "Mediamarkt")
+    menards: "Menards" = _Source("oxylabs.sources.north_american.menards", "Menards")
+    mercadolibre: "Mercadolibre" = _Source("oxylabs.sources.latin_american.mercadolibre", "Mercadolibre")
+    mercadolivre: "Mercadolivre" = _Source("oxylabs.sources.latin_american.mercadolivre", "Mercadolivre")
+    magazineluiza: "Magazineluiza" = _Source("oxylabs.sources.latin_american.magazineluiza", "Magazineluiza")
+    petco: "Petco" = _Source("oxylabs.sources.north_american.petco", "Petco")
+    publix: "Publix" = _Source("oxylabs.sources.north_american.publix", "Publix")
+    target_store: "TargetStore" = _Source("oxylabs.sources.north_american.target_store", "TargetStore")
+    perplexity: "Perplexity" = _Source("oxylabs.sources.perplexity", "Perplexity")
+    shein: "Shein" = _Source("oxylabs.sources.asian.shein", "Shein")
+    staples: "Staples" = _Source("oxylabs.sources.north_american.staples", "Staples")
+    tiktok: "Tiktok" = _Source("oxylabs.sources.tiktok", "Tiktok")
+    universal: "Universal" = _Source("oxylabs.sources.universal", "Universal")
+    wayfair: "Wayfair" = _Source("oxylabs.sources.wayfair", "Wayfair")
+    walmart: "Walmart" = _Source("oxylabs.sources.north_american.walmart", "Walmart")
+    youtube: "Youtube" = _Source("oxylabs.sources.youtube", "Youtube")
+    zillow: "Zillow" = _Source("oxylabs.sources.real_estate.zillow", "Zillow")
+
     def __init__(self, username: str, password: str, **kwargs) -> None:
         """
         Initializes an instance of the RealtimeClient class.
@@ -59,110 +166,469 @@ class RealtimeClient:
         Args:
             username (str): The username for API authentication.
             password (str): The password for API authentication.
+            pool_maxsize (int, optional): The maximum number of keep-alive
+            connections to the Realtime API. Defaults to 10.
+            retry (RetryPolicy, optional): The policy for retrying requests
+            that were rate limited or failed with a server or connection
+            error.
+            rate_limiter (RateLimiter, optional): A limiter for the job rate
+            and the number of concurrent jobs. It can be shared between
+            clients.
+            cache (ResultCache, optional): A cache of responses with an
+            in-memory and an optional on-disk tier.
+            **kwargs: Additional options of RealtimeAPI (`pool_connections`,
+            `max_retries`, `keep_alive`, `coalesce`, `json_decoder`,
+            `spill_threshold`, `spill_dir`).
         """
         api = RealtimeAPI(APICredentials(username, password), **kwargs)
-        self.airbnb = Airbnb(api)
-        self.alibaba = Alibaba(api)
-        self.aliexpress = Aliexpress(api)
-        self.allegro = Allegro(api)
-        self.amazon = Amazon(api)
-        self.avnet = Avnet(api)
-        self.bedbathandbeyond = Bedbathandbeyond(api)
-        self.bestbuy = Bestbuy(api)
-        self.bodegaaurrera = Bodegaaurrera(api)
-        self.bing = Bing(api)
-        self.cdiscount = Cdiscount(api)
-        self.chatgpt = Chatgpt(api)
-        self.costco = Costco(api)
-        self.dcard = Dcard(api)
-        self.ebay = Ebay(api)
-        self.etsy = Etsy(api)
-        self.falabella = Falabella(api)
-        self.flipkart = Flipkart(api)
-        self.indiamart = Indiamart(api)
-        self.lazada = Lazada(api)
-        self.rakuten = Rakuten(api)
-        self.tokopedia = Tokopedia(api)
-        self.google = Google(api)
-        self.google_shopping = GoogleShopping(api)
-        self.grainger = Grainger(api)
-        self.idealo = Idealo(api)
-        self.instacart = Instacart(api)
-        self.kroger = Kroger(api)
-        self.lowes = Lowes(api)
-        self.mediamarkt = Mediamarkt(api)
-        self.menards = Menards(api)
-        self.mercadolibre = Mercadolibre(api)
-        self.mercadolivre = Mercadolivre(api)
-        self.magazineluiza = Magazineluiza(api)
-        self.petco = Petco(api)
-        self.publix = Publix(api)
-        self.target_store = TargetStore(api)
-        self.perplexity = Perplexity(api)
-        self.shein = Shein(api)
-        self.staples = Staples(api)
-        self.tiktok = Tiktok(api)
-        self.universal = Universal(api)
-        self.wayfair = Wayfair(api)
-        self.walmart = Walmart(api)
-        self.youtube = Youtube(api)
-        self.zillow = Zillow(api)
+        self._api = api
+
+    def batch(
+        self,
+        calls: Iterable[Any],
+        max_workers: Optional[int] = None,
+        as_completed: bool = False,
+        sink: Optional["Sink"] = None,
+    ) -> Union[List[BatchResult], Iterator[BatchResult]]:
+        """
+        Runs many source calls concurrently on a bounded thread pool.
+
+        Each call is either a callable taking no arguments or a tuple of
+        `(fn, args)` or `(fn, args, kwargs)`, for example
+        `(client.google.scrape_search, ("nike",), {"parse": True})`.
+        Exceptions raised by a call are captured on its result instead of
+        being raised.
+
+        Args:
+            calls (Iterable[Any]): The calls to run.
+            max_workers (Optional[int]): The maximum number of calls running
+            at once. Defaults to the connection pool size.
+            as_completed (bool): If True, returns an iterator yielding
+            results as calls complete instead of a list in call order.
+            sink (Optional[Sink]): A sink from `oxylabs.export` each
+            response is written to as its call completes. The sink is not
+            closed.
+
+        Returns:
+            Union[List[BatchResult], Iterator[BatchResult]]: The results of
+            the calls.
+        """
+        if max_workers is None:
+            max_workers = self._api._pool_maxsize
+        if as_completed:
+            return iter_batch(calls, max_workers, sink)
+        return run_batch(calls, max_workers, sink)
+
+    def iter_results(self, call: Any) -> Iterator[Results]:
+        """
+        Runs a source call and yields its results one at a time as they are
+        received, without holding the whole response in memory.
+
+        The call is given like a batch call, as a callable taking no
+        arguments or a tuple of `(fn, args)` or `(fn, args, kwargs)`, for
+        example `(client.youtube.scrape_search_max, ("nike",))`.
+
+        Args:
+            call (Any): The source call.
+
+        Yields:
+            Results: Each result of the response.
+        """
+        with capturing() as requests:
+            as_callable(call)()
+        for payload, config in requests:
+            for item in self._api.iter_results(payload, config):
+                yield Results(item)
+
+    def close(self) -> None:
+        """
+        Closes the underlying connection pool.
+        """
+        self._api.close()
+
+    def __enter__(self) -> "RealtimeClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 class AsyncClient:
+    airbnb: "AirbnbAsync" = _Source("oxylabs.sources.real_estate.airbnb", "AirbnbAsync")
+    alibaba: "AlibabaAsync" = _Source("oxylabs.sources.asian.alibaba", "AlibabaAsync")
+    aliexpress: "AliexpressAsync" = _Source("oxylabs.sources.asian.aliexpress", "AliexpressAsync")
+    allegro: "AllegroAsync" = _Source("oxylabs.sources.european.allegro", "AllegroAsync")
+    amazon: "AmazonAsync" = _Source("oxylabs.sources.amazon", "AmazonAsync")
+    avnet: "AvnetAsync" = _Source("oxylabs.sources.asian.avnet", "AvnetAsync")
+    bedbathandbeyond: "BedbathandbeyondAsync" = _Source("oxylabs.sources.north_american.bedbathandbeyond", "BedbathandbeyondAsync")
+    bestbuy: "BestbuyAsync" = _Source("oxylabs.sources.north_american.bestbuy", "BestbuyAsync")
+    bodegaaurrera: "BodegaaurreraAsync" = _Source("oxylabs.sources.north_american.bodegaaurrera", "BodegaaurreraAsync")
+    bing: "BingAsync" = _Source("oxylabs.sources.bing", "BingAsync")
+    cdiscount: "CdiscountAsync" = _Source("oxylabs.sources.european.cdiscount", "CdiscountAsync")
+    chatgpt: "ChatgptAsync" = _Source("oxylabs.sources.chatgpt", "ChatgptAsync")
+    costco: "CostcoAsync" = _Source("oxylabs.sources.north_american.costco", "CostcoAsync")
+    dcard: "DcardAsync" = _Source("oxylabs.sources.latin_american.dcard", "DcardAsync")
+    ebay: "EbayAsync" = _Source("oxylabs.sources.ebay", "EbayAsync")
+    etsy: "EtsyAsync" = _Source("oxylabs.sources.etsy", "EtsyAsync")
+    falabella: "FalabellaAsync" = _Source("oxylabs.sources.latin_american.falabella", "FalabellaAsync")
+    flipkart: "FlipkartAsync" = _Source("oxylabs.sources.asian.flipkart", "FlipkartAsync")
+    indiamart: "IndiamartAsync" = _Source("oxylabs.sources.asian.indiamart", "IndiamartAsync")
+    lazada: "LazadaAsync" = _Source("oxylabs.sources.asian.lazada", "LazadaAsync")
+    rakuten: "RakutenAsync" = _Source("oxylabs.sources.asian.rakuten", "RakutenAsync")
+    tokopedia: "TokopediaAsync" = _Source("oxylabs.sources.asian.tokopedia", "TokopediaAsync")
+    google: "GoogleAsync" = _Source("oxylabs.sources.google", "GoogleAsync")
+    google_shopping: "GoogleShoppingAsync" = _Source("oxylabs.sources.google_shopping", "GoogleShoppingAsync")
+    grainger: "GraingerAsync" = _Source("oxylabs.sources.north_american.grainger", "GraingerAsync")
+    idealo: "IdealoAsync" = _Source("oxylabs.sources.european.idealo", "IdealoAsync")
+    instacart: "InstacartAsync" = _Source("oxylabs.sources.north_american.instacart", "InstacartAsync")
+    kroger: "KrogerAsync" = _Source("oxylabs.sources.kroger", "KrogerAsync")
+    lowes: "LowesAsync" = _Source("oxylabs.sources.north_american.lowes", "LowesAsync")
+    mediamarkt: "MediamarktAsync" = _Source("oxylabs.sources.european.mediamarkt", "MediamarktAsync")
+    menards: "MenardsAsync" = _Source("oxylabs.sources.north_american.menards", "MenardsAsync")
+    mercadolibre: "MercadolibreAsync" = _Source("oxylabs.sources.latin_american.mercadolibre", "MercadolibreAsync")
+    mercadolivre: "MercadolivreAsync" = _Source("oxylabs.sources.latin_american.mercadolivre", "MercadolivreAsync")
+    magazineluiza: "MagazineluizaAsync" = _Source("oxylabs.sources.latin_american.magazineluiza", "MagazineluizaAsync")
+    petco: "PetcoAsync" = _Source("oxylabs.sources.north_american.petco", "PetcoAsync")
+    publix: "PublixAsync" = _Source("oxylabs.sources.north_american.publix", "PublixAsync")
+    target_store: "TargetStoreAsync" = _Source("oxylabs.sources.north_american.target_store", "TargetStoreAsync")
+    perplexity: "PerplexityAsync" = _Source("oxylabs.sources.perplexity", "PerplexityAsync")
+    shein: "SheinAsync" = _Source("oxylabs.sources.asian.shein", "SheinAsync")
+    staples: "StaplesAsync" = _Source("oxylabs.sources.north_american.staples", "StaplesAsync")
+    tiktok: "TiktokAsync" = _Source("oxylabs.sources.tiktok", "TiktokAsync")
+    universal: "UniversalAsync" = _Source("oxylabs.sources.universal", "UniversalAsync")
+    wayfair: "WayfairAsync" = _Source("oxylabs.sources.wayfair", "WayfairAsync")
+    walmart: "WalmartAsync" = _Source("oxylabs.sources.north_american.walmart", "WalmartAsync")
+    youtube: "YoutubeAsync" = _Source("oxylabs.sources.youtube", "YoutubeAsync")
+    zillow: "ZillowAsync" = _Source("oxylabs.sources.real_estate.zillow", "ZillowAsync")
+
     def __init__(self, username: str, password: str, **kwargs) -> None:
         """
         Initializes an instance of the AsyncClient class.
 
+        Use the client as an async context manager to keep a single session
+        and its connection pool open for all requests.
+
         Args:
             username (str): The username for API authentication.
             password (str): The password for API authentication.
+            connector_options (dict, optional): Keyword arguments for the
+            aiohttp.TCPConnector, e.g. `limit`, `limit_per_host`,
+            `ttl_dns_cache` or `keepalive_timeout`.
+            journal (str | JobJournal, optional): A journal, or the path of a
+            SQLite database, recording submitted jobs so that unfinished jobs
+            can be resumed after a restart.
+            retry (RetryPolicy | dict, optional): The policy for retrying
+            requests that were rate limited or failed with a server or
+            connection error, or a dict of policies for the "submit", "poll"
+            and "result" requests.
+            rate_limiter (RateLimiter, optional): A limiter for the job rate
+            and the number of concurrent jobs. It can be shared between
+            clients. Jobs submitted with `submit` or `submit_batch` only
+            take from the job rate.
+            cache (ResultCache, optional): A cache of responses with an
+            in-memory and an optional on-disk tier.
+            max_in_flight (int, optional): The maximum number of jobs in
+            flight. Further requests wait before submitting their job.
+            Jobs submitted with `submit` or `submit_batch` are not counted.
+            **kwargs: Additional options of AsyncAPI (`use_poller`,
+            `poller_threshold`, `poller_concurrency`, `poll_strategy`,
+            `callback_timeout`, `max_in_flight_per_source`, `coalesce`,
+            `json_decoder`, `spill_threshold`, `spill_dir`).
         """
         api = AsyncAPI(APICredentials(username, password), **kwargs)
-        self.airbnb = AirbnbAsync(api)
-        self.alibaba = AlibabaAsync(api)
-        self.aliexpress = AliexpressAsync(api)
-        self.allegro = AllegroAsync(api)
-        self.amazon = AmazonAsync(api)
-        self.avnet = AvnetAsync(api)
-        self.bedbathandbeyond = BedbathandbeyondAsync(api)
-        self.bestbuy = BestbuyAsync(api)
-        self.bodegaaurrera = BodegaaurreraAsync(api)
-        self.bing = BingAsync(api)
-        self.cdiscount = CdiscountAsync(api)
-        self.chatgpt = ChatgptAsync(api)
-        self.costco = CostcoAsync(api)
-        self.dcard = DcardAsync(api)
-        self.ebay = EbayAsync(api)
-        self.etsy = EtsyAsync(api)
-        self.falabella = FalabellaAsync(api)
-        self.flipkart = FlipkartAsync(api)
-        self.indiamart = IndiamartAsync(api)
-        self.lazada = LazadaAsync(api)
-        self.rakuten = RakutenAsync(api)
-        self.tokopedia = TokopediaAsync(api)
-        self.google = GoogleAsync(api)
-        self.google_shopping = GoogleShoppingAsync(api)
-        self.grainger = GraingerAsync(api)
-        self.idealo = IdealoAsync(api)
-        self.instacart = InstacartAsync(api)
-        self.kroger = KrogerAsync(api)
-        self.lowes = LowesAsync(api)
-        self.mediamarkt = MediamarktAsync(api)
-        self.menards = MenardsAsync(api)
-        self.mercadolibre = MercadolibreAsync(api)
-        self.mercadolivre = MercadolivreAsync(api)
-        self.magazineluiza = MagazineluizaAsync(api)
-        self.petco = PetcoAsync(api)
-        self.publix = PublixAsync(api)
-        self.target_store = TargetStoreAsync(api)
-        self.perplexity = PerplexityAsync(api)
-        self.shein = SheinAsync(api)
-        self.staples = StaplesAsync(api)
-        self.tiktok = TiktokAsync(api)
-        self.universal = UniversalAsync(api)
-        self.wayfair = WayfairAsync(api)
-        self.walmart = WalmartAsync(api)
-        self.youtube = YoutubeAsync(api)
-        self.zillow = ZillowAsync(api)
+        self._api = api
+
+    async def submit(
+        self, call: Awaitable[Response]
+    ) -> Optional[JobHandle]:
+        """
+        Submits the job of a source call without waiting for it to complete.
+
+        The job is subject to the job rate of `rate_limiter`, but it does
+        not hold a concurrent slot of `rate_limiter` nor count towards
+        `max_in_flight`, since it may be collected much later or not at all.
+
+        Args:
+            call (Awaitable[Response]): A source call that has not been
+            awaited yet, e.g. `client.google.scrape_search("nike")`.
+
+        Returns:
+            Optional[JobHandle]: A handle to the submitted job, or None if
+            the job could not be submitted.
+        """
+        with submitting() as jobs:
+            await call
+        return jobs[0] if jobs else None
+
+    async def iter_results(
+        self, call: Awaitable[Response]
+    ) -> AsyncIterator[Results]:
+        """
+        Submits the job of a source call and yields its results one at a
+        time as they are received, without holding the whole response in
+        memory.
+
+        Args:
+            call (Awaitable[Response]): A source call that has not been
+            awaited yet, e.g. `client.youtube.scrape_search_max("nike")`.
+
+        Yields:
+            Results: Each result of the job.
+        """
+        handle = await self.submit(call)
+        if handle is None:
+            return
+        async for result in handle.iter_results():
+            yield result
+
+    def job(
+        self,
+        job_id: str,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+    ) -> JobHandle:
+        """
+        Returns a handle to a previously submitted job.
+
+        Args:
+            job_id (str): The ID of the job.
+            request_timeout (Optional[int]): The timeout for each request in
+            seconds.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for the job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+
+        Returns:
+            JobHandle: A handle to the job.
+        """
+        config = prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        return JobHandle(
+            self._api,
+            job_id,
+            config,
+            callback=self._api._callback_server is not None,
+        )
+
+    def resume(
+        self,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+    ) -> List[JobHandle]:
+        """
+        Returns handles to the unfinished jobs recorded in the job journal.
+
+        Args:
+            request_timeout (Optional[int]): The timeout for each request in
+            seconds.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for each job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+
+        Raises:
+            ValueError: If the client was created without a journal.
+
+        Returns:
+            List[JobHandle]: Handles to the unfinished jobs, oldest first.
+        """
+        if self._api._journal is None:
+            raise ValueError("The client was created without a journal")
+        config = prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        return [
+            JobHandle(
+                self._api,
+                job["job_id"],
+                config,
+                source=job["source"],
+                callback=self._api._callback_server is not None,
+            )
+            for job in self._api._journal.pending()
+        ]
+
+    async def submit_batch(
+        self,
+        payloads: List[dict],
+        request_timeout: Optional[int] = None,
+    ) -> List[Optional[str]]:
+        """
+        Submits many jobs at once through the Push-Pull batch endpoint.
+
+        Payloads are raw API payloads, e.g.
+        `{"source": "google_search", "query": "nike", "parse": True}`.
+        Payloads that only differ in their `query` or `url` are submitted
+        together, up to the server limit per request. Like `submit`, the
+        jobs are subject to the job rate of `rate_limiter` but do not hold
+        concurrent slots or count towards `max_in_flight`.
+
+        Args:
+            payloads (List[dict]): The payloads of the jobs to submit.
+            request_timeout (Optional[int]): The timeout for each batch
+            request in seconds.
+
+        Returns:
+            List[Optional[str]]: The job IDs in the order of the payloads.
+            The ID is None if the job could not be submitted.
+        """
+        config = prepare_config(
+            request_timeout=request_timeout, async_integration=True
+        )
+        return await self._api.submit_batch(payloads, config)
+
+    async def get_results(
+        self,
+        job_ids: List[Optional[str]],
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+    ) -> List[Response]:
+        """
+        Waits for already submitted jobs to complete and fetches their
+        results.
+
+        Args:
+            job_ids (List[Optional[str]]): The IDs of the jobs, e.g. as
+            returned by `submit_batch`. None IDs of jobs that could not be
+            submitted get an empty Response without any request.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for each job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+
+        Returns:
+            List[Response]: The responses in the order of the job IDs.
+        """
+        config = prepare_config(
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        api_responses = await asyncio.gather(
+            *(
+                self._api.get_job_response(job_id, config)
+                for job_id in job_ids
+                if job_id is not None
+            )
+        )
+        responses = iter(api_responses)
+        return [
+            Response(next(responses) if job_id is not None else None)
+            for job_id in job_ids
+        ]
+
+    async def start_callback_server(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        public_url: Optional[str] = None,
+        path: str = "/oxylabs/callback",
+        token: Optional[str] = None,
+    ) -> "CallbackServer":
+        """
+        Starts an embedded server receiving job completion notices.
+
+        While the server runs, its URL is sent as `callback_url` with every
+        job that does not set one, and jobs are only polled if no notice
+        arrives within `callback_timeout` seconds. The server is stopped
+        when the client is closed.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on.
+            public_url (Optional[str]): The URL under which Oxylabs can reach
+            the server. Required unless `host` is a reachable address.
+            path (str): The path notices are received on. A secret token is
+            appended to it and to `public_url`, and notices without it are
+            rejected.
+            token (Optional[str]): The secret token. Defaults to a random
+            token.
+
+        Raises:
+            ValueError: If `public_url` is missing and `host` is a wildcard
+            or loopback address.
+
+        Returns:
+            CallbackServer: The running server.
+        """
+        from oxylabs.internal.callback import CallbackServer
+
+        server = CallbackServer(host, port, public_url, path, token)
+        await self._api.start_callback_server(server)
+        return server
+
+    def stream(
+        self,
+        requests: Union[Iterable[Any], AsyncIterable[Any]],
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+        sink: Optional["Sink"] = None,
+    ) -> AsyncIterator[Tuple[Any, Response]]:
+        """
+        Runs source calls with at most `concurrency` of them in flight and
+        yields each call with its Response as soon as it completes.
+
+        Requests are pulled lazily from any iterable or async iterable, so
+        memory use does not grow with the number of requests. Each request
+        is an unawaited source call (e.g. `client.google.scrape_search("nike")`),
+        a callable returning one, or a `(fn, args, kwargs)` tuple.
+
+        Args:
+            requests (Union[Iterable[Any], AsyncIterable[Any]]): The requests
+            to run.
+            concurrency (int): The maximum number of requests in flight.
+            Defaults to 10.
+            return_exceptions (bool): If True, exceptions raised by a request
+            are yielded in place of its Response instead of being raised.
+            sink (Optional[Sink]): A sink from `oxylabs.export` each
+            response is written to as it completes. The sink is not closed.
+
+        Returns:
+            AsyncIterator[Tuple[Any, Response]]: The requests and their
+            responses, in completion order.
+        """
+        return stream_requests(requests, concurrency, return_exceptions, sink)
+
+    def poll_stats(self) -> Dict[str, dict]:
+        """
+        Returns the completion time statistics learned per source by the
+        adaptive poll strategy.
+
+        Returns:
+            Dict[str, dict]: The number of completed jobs, mean, p50 and p90
+            latency and predicted first poll delay for each source.
+        """
+        return self._api._poll_strategy.stats()
+
+    def in_flight_stats(self) -> Dict[str, dict]:
+        """
+        Returns the number of jobs in flight and waiting for a slot, and
+        the time spent waiting, overall under "all" and per source.
+
+        Returns:
+            Dict[str, dict]: The `in_flight`, `waiting` and `max_waiting` job
+            counts and the `mean_wait` and `max_wait` times in seconds.
+        """
+        return self._api._in_flight.stats()
+
+    async def close(self) -> None:
+        """
+        Closes the underlying session and its connection pool.
+        """
+        await self._api.close()
 
+    async def __aenter__(self) -> "AsyncClient":
+        await self._api.open()
+        return self
 
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
@@ -0,0 +1,121 @@
+import binascii
+import codecs
+from typing import Iterator, Union
+
+from oxylabs.internal.spill import SpilledContent
+from oxylabs.utils.defaults import STREAM_CHUNK_SIZE
+
+Content = Union[str, SpilledContent]
+
+
+def _iter_text(content: Content) -> Iterator[Union[str, memoryview]]:
+    # Spilled content is read from its memory map without loading the file
+    if isinstance(content, SpilledContent):
+        with content.view() as view:
+            for start in range(0, len(view), STREAM_CHUNK_SIZE):
+                yield view[start : start + STREAM_CHUNK_SIZE]
+    else:
+        for start in range(0, len(content), STREAM_CHUNK_SIZE):
+            yield content[start : start + STREAM_CHUNK_SIZE]
+
+
+def iter_decoded(content: Content, encoding: str = "base64") -> Iterator[bytes]:
+    """
+    Yields the bytes of a result content in chunks.
+
+    Args:
+        content (str | SpilledContent): The content.
+        encoding (str): "base64" if the content is base64 encoded, such as
+        screenshots and contents requested with `content_encoding`,
+        otherwise the codec to encode the text with.
+
+    Raises:
+        binascii.Error: If base64 content is malformed.
+
+    Yields:
+        bytes: The next chunk.
+    """
+    if encoding != "base64":
+        # Incremental codecs keep characters split between chunks intact
+        # and write a byte order mark only once
+        encoder = codecs.getincrementalencoder(encoding)()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        utf8 = codecs.lookup(encoding).name == "utf-8"
+        for chunk in _iter_text(content):
+            if isinstance(chunk, memoryview):
+                if utf8:
+                    # Spilled content is stored as UTF-8 already
+                    yield bytes(chunk)
+                    continue
+                chunk = decoder.decode(chunk)
+            encoded = encoder.encode(chunk)
+            if encoded:
+                yield encoded
+        encoded = encoder.encode(decoder.decode(b"", final=True), final=True)
+        if encoded:
+            yield encoded
+        return
+
+    # Whitespace, e.g. the line breaks of wrapped base64, is removed and
+    # chunks are decoded at multiples of 4 characters, carrying the rest
+    # over to the next chunk so that no base64 quantum is split
+    remainder = None
+    for chunk in _iter_text(content):
+        if isinstance(chunk, memoryview):
+            chunk = bytes(chunk)
+        # Splitting and joining returns the chunk itself if it has no
+        # whitespace
+        chunk = chunk[:0].join(chunk.split())
+        if remainder:
+            chunk = remainder + chunk
+        end = len(chunk) - len(chunk) % 4
+        remainder = chunk[end:]
+        if end:
+            yield binascii.a2b_base64(chunk[:end] if remainder else chunk)
+    if remainder:
+        yield binascii.a2b_base64(remainder)
+
+
+def get_decoded_size(content: Content) -> int:
+    """
+    Returns the number of bytes base64 content decodes to, without decoding
+    it. The size is overestimated for content with whitespace.
+    """
+    if isinstance(content, SpilledContent):
+        with content.view() as view:
+            size = len(view)
+            tail = bytes(view[-2:]).decode()
+    else:
+        size = len(content)
+        tail = content[-2:]
+    return size // 4 * 3 - (len(tail) - len(tail.rstrip("=")))
+
+
+def decode_into(content: Content, encoding: str = "base64") -> bytearray:
+    """
+    Decodes the content into a buffer allocated once at its full size.
+
+    Args:
+        content (str | SpilledContent): The content.
+        encoding (str): See `iter_decoded`.
+
+    Raises:
+        binascii.Error: If base64 content is malformed.
+
+    Returns:
+        bytearray: The decoded content.
+    """
+    if encoding != "base64":
+        if isinstance(content, SpilledContent):
+            with content.view() as view:
+                return bytearray(str(view, "utf-8"), encoding)
+        return bytearray(content, encoding)
+
+    buffer = bytearray(get_decoded_size(content))
+    position = 0
+    for chunk in iter_decoded(content):
+        buffer[position : position + len(chunk)] = chunk
+        position += len(chunk)
+    # The size was overestimated if the content has whitespace
+    del buffer[position:]
+    return buffer
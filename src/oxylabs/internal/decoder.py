@@ -0,0 +1,67 @@
+import json
+from typing import Any, Callable, Union
+
+JSONDecoder = Callable[[bytes], Any]
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _load_orjson() -> JSONDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _load_msgspec() -> JSONDecoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def _load_json() -> JSONDecoder:
+    return json.loads
+
+
+_LOADERS = {
+    "orjson": _load_orjson,
+    "msgspec": _load_msgspec,
+    "json": _load_json,
+}
+
+
+def get_decoder(backend: Union[str, JSONDecoder, None] = "auto") -> JSONDecoder:
+    """
+    Returns a function decoding JSON response bodies from bytes.
+
+    Args:
+        backend (str | Callable[[bytes], Any] | None): "orjson", "msgspec",
+        "json" for the standard library, a custom decoding function, or
+        "auto" or None for the fastest installed backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the requested backend is not installed.
+
+    Returns:
+        Callable[[bytes], Any]: The decoding function.
+    """
+    if callable(backend):
+        return backend
+    if backend is None or backend == "auto":
+        for name in BACKENDS:
+            try:
+                return _LOADERS[name]()
+            except ImportError:
+                continue
+    if backend not in _LOADERS:
+        raise ValueError(
+            f"Unknown JSON backend: {backend}. "
+            f"Use one of {', '.join(BACKENDS)} or auto"
+        )
+    try:
+        return _LOADERS[backend]()
+    except ImportError as e:
+        raise ImportError(
+            f"The {backend} JSON backend is not installed. "
+            f"Install it with `pip install oxylabs[{backend}]`"
+        ) from e
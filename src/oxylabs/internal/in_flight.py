@@ -0,0 +1,136 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+
+class _Gauge:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, wait: float) -> None:
+        self.waits += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "mean_wait": self.total_wait / self.waits if self.waits else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class InFlightLimiter:
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        per_source: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initializes an instance of the InFlightLimiter class.
+
+        The limiter bounds the number of jobs AsyncAPI keeps in flight.
+        Requests beyond the limit wait before their job is submitted, so
+        that callers starting many requests at once are slowed down instead
+        of piling up in the connection pool. Only requests that wait for
+        their result are limited; jobs submitted with `submit` or
+        `submit_batch` are not counted.
+
+        Args:
+            max_in_flight (Optional[int]): The maximum number of jobs in
+            flight, or None for no limit.
+            per_source (Optional[Dict[str, int]]): The maximum number of jobs
+            in flight for individual sources.
+        """
+        self._limits: Dict[Optional[str], Optional[int]] = {
+            None: max_in_flight,
+            **(per_source or {}),
+        }
+        self._semaphores: Dict[Optional[str], asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._gauges: Dict[Optional[str], _Gauge] = {None: _Gauge()}
+
+    def _get_semaphores(self, source: Optional[str]) -> List[asyncio.Semaphore]:
+        """
+        Returns the semaphores a job of the source must acquire, the source
+        semaphore first.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {
+                key: asyncio.Semaphore(limit)
+                for key, limit in self._limits.items()
+                if limit is not None
+            }
+        keys = [source, None] if source is not None else [None]
+        return [self._semaphores[key] for key in keys if key in self._semaphores]
+
+    def _get_gauges(self, source: Optional[str]) -> List[_Gauge]:
+        if source is None:
+            return [self._gauges[None]]
+        gauge = self._gauges.setdefault(source, _Gauge())
+        return [self._gauges[None], gauge]
+
+    @asynccontextmanager
+    async def slot(self, source: Optional[str] = None) -> AsyncIterator[None]:
+        """
+        Waits for a free slot for a job of the source and holds it for the
+        duration of the block.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        semaphores = self._get_semaphores(source)
+        gauges = self._get_gauges(source)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        for gauge in gauges:
+            gauge.waiting += 1
+            gauge.max_waiting = max(gauge.max_waiting, gauge.waiting)
+        acquired = []
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+        except BaseException:
+            for semaphore in acquired:
+                semaphore.release()
+            raise
+        finally:
+            for gauge in gauges:
+                gauge.waiting -= 1
+
+        wait = loop.time() - started_at
+        for gauge in gauges:
+            gauge.record_wait(wait)
+            gauge.in_flight += 1
+        try:
+            yield
+        finally:
+            for gauge in gauges:
+                gauge.in_flight -= 1
+            for semaphore in acquired:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns the in-flight and waiting jobs and the wait times, overall
+        under "all" and for each source.
+
+        Returns:
+            Dict[str, dict]: The `in_flight` and `waiting` job counts, the
+            peak `max_waiting` count, and the `mean_wait` and `max_wait`
+            times in seconds.
+        """
+        return {
+            "all" if key is None else key: gauge.as_dict()
+            for key, gauge in self._gauges.items()
+        }
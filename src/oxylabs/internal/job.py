@@ -0,0 +1,169 @@
+import contextvars
+import logging
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, List, Optional
+
+from oxylabs.sources.response import Response, Results
+
+if TYPE_CHECKING:
+    from oxylabs.internal.api import AsyncAPI
+
+logger = logging.getLogger(__name__)
+
+# Collects the jobs submitted by source calls made inside `submitting()`
+_submitted_jobs = contextvars.ContextVar(
+    "oxylabs_submitted_jobs", default=None
+)
+
+
+@contextmanager
+def submitting() -> Iterator[List[Optional["JobHandle"]]]:
+    """
+    Switches AsyncAPI to submit-only mode for the current context.
+
+    Source calls made inside the block submit their job and return an empty
+    Response right away. The handles of the submitted jobs are appended to
+    the yielded list.
+
+    Yields:
+        List[Optional[JobHandle]]: The handles of the submitted jobs.
+    """
+    jobs = []
+    token = _submitted_jobs.set(jobs)
+    try:
+        yield jobs
+    finally:
+        _submitted_jobs.reset(token)
+
+
+def get_submitted_jobs() -> Optional[List[Optional["JobHandle"]]]:
+    """
+    Returns the list collecting submitted jobs if the current context is in
+    submit-only mode, None otherwise.
+    """
+    return _submitted_jobs.get()
+
+
+class JobHandle:
+    def __init__(
+        self,
+        api: "AsyncAPI",
+        job_id: str,
+        config: dict,
+        source: Optional[str] = None,
+        submitted_at: Optional[float] = None,
+        callback: bool = False,
+    ) -> None:
+        """
+        Initializes an instance of the JobHandle class.
+
+        Args:
+            api (AsyncAPI): The API instance the job was submitted with.
+            job_id (str): The ID of the job.
+            config (dict): The configuration used to wait for the job.
+            source (Optional[str]): The source of the job.
+            submitted_at (Optional[float]): The event loop time at which the
+            job was submitted.
+            callback (bool): Whether the job reports to the callback server.
+        """
+        self._api = api
+        self._id = job_id
+        self._config = config
+        self._source = source
+        self._submitted_at = submitted_at
+        self._callback = callback
+        self._completed: Optional[bool] = None
+
+    @property
+    def id(self) -> str:
+        """
+        Returns the ID of the job.
+        """
+        return self._id
+
+    async def status(self) -> Optional[str]:
+        """
+        Retrieves the current status of the job.
+
+        Returns:
+            Optional[str]: The job status, e.g. "pending", "done" or
+            "faulted", or None if it could not be retrieved.
+        """
+        try:
+            async with self._api._session_scope() as session:
+                return await self._api._get_job_status(
+                    self._id, session, self._config["request_timeout"]
+                )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+        return None
+
+    async def wait(self) -> bool:
+        """
+        Waits for the job to complete.
+
+        The outcome is kept once the job completed or faulted. A job that
+        did not complete in time is polled again by the next call.
+
+        Returns:
+            bool: True if the job completed, False if it faulted or did not
+            complete within the job completion timeout.
+        """
+        if self._completed is not None:
+            return self._completed
+        try:
+            async with self._api._session_scope() as session:
+                completed = await self._api._wait_for_job(
+                    self._id,
+                    self._config,
+                    session,
+                    source=self._source,
+                    submitted_at=self._submitted_at,
+                    callback=self._callback,
+                )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+            return False
+        if completed:
+            self._completed = True
+        else:
+            # Tell a fault apart from a timeout or an error while polling
+            status = await self.status()
+            if status in ("done", "faulted"):
+                self._completed = status == "done"
+            return status == "done"
+        return self._completed
+
+    async def result(self) -> Response:
+        """
+        Waits for the job to complete and fetches its result.
+
+        Returns:
+            Response: The response containing the scraped results.
+        """
+        await self.wait()
+        try:
+            async with self._api._session_scope() as session:
+                api_response = await self._api._get_http_response(
+                    self._id, session
+                )
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+            api_response = None
+        return Response(api_response)
+
+    async def iter_results(self) -> AsyncIterator[Results]:
+        """
+        Waits for the job to complete and yields its results one at a time
+        as they are received, without holding the whole response in
+        memory.
+
+        Yields:
+            Results: Each result of the job.
+        """
+        await self.wait()
+        async for item in self._api.iter_job_results(self._id):
+            yield Results(item)
+
+    def __repr__(self) -> str:
+        return f"JobHandle(id={self._id!r}, source={self._source!r})"
@@ -0,0 +1,178 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from oxylabs.utils.defaults import DEFAULT_JOB_RETENTION
+
+PENDING = "pending"
+DONE = "done"
+FAULTED = "faulted"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    payload_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    source TEXT,
+    status TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    completed_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_payload_hash ON jobs (payload_hash, status);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+"""
+
+
+class JobJournal:
+    def __init__(
+        self,
+        path: str = "oxylabs_jobs.db",
+        retention: float = DEFAULT_JOB_RETENTION,
+    ) -> None:
+        """
+        Initializes an instance of the JobJournal class.
+
+        The journal records every job submitted through AsyncAPI in a SQLite
+        database so that a restarted worker can collect the results of
+        unfinished jobs instead of submitting them again.
+
+        Args:
+            path (str): The path of the SQLite database file. Use ":memory:"
+            for a journal that is not persisted.
+            retention (float): The time in seconds Oxylabs keeps the results
+            of a job. Older unfinished jobs are neither reused nor resumed.
+        """
+        self._retention = retention
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def record_submitted(
+        self, payload_hash: str, job_id: str, payload: dict
+    ) -> None:
+        """
+        Records a submitted job.
+
+        Args:
+            payload_hash (str): The key of the payload, see
+            `get_payload_key`.
+            job_id (str): The ID of the job.
+            payload (dict): The payload of the job.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, payload_hash, payload,"
+                " source, status, submitted_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    payload_hash,
+                    json.dumps(payload, default=str),
+                    payload.get("source"),
+                    PENDING,
+                    time.time(),
+                ),
+            )
+
+    def record_submitted_many(
+        self, jobs: List[Tuple[str, str, dict]]
+    ) -> None:
+        """
+        Records many submitted jobs in a single transaction.
+
+        Args:
+            jobs (List[Tuple[str, str, dict]]): The payload key, job ID and
+            payload of each job, see `record_submitted`.
+        """
+        submitted_at = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO jobs (job_id, payload_hash, payload,"
+                " source, status, submitted_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        job_id,
+                        payload_hash,
+                        json.dumps(payload, default=str),
+                        payload.get("source"),
+                        PENDING,
+                        submitted_at,
+                    )
+                    for payload_hash, job_id, payload in jobs
+                ],
+            )
+
+    def mark_done(self, job_id: str, status: str = DONE) -> None:
+        """
+        Records that the result of a job has been collected, or that it
+        never will be.
+
+        Args:
+            job_id (str): The ID of the job.
+            status (str): The final status of the job, `DONE` or `FAULTED`
+            for jobs that faulted or whose results are no longer
+            available.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, completed_at = ? WHERE job_id = ?",
+                (status, time.time(), job_id),
+            )
+
+    def find_pending(self, payload_hash: str) -> Optional[str]:
+        """
+        Returns the ID of an unfinished job submitted with the same payload
+        within the retention period.
+
+        Args:
+            payload_hash (str): The key of the payload.
+
+        Returns:
+            Optional[str]: The ID of the job, or None if there is none.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT job_id FROM jobs WHERE payload_hash = ? AND status = ?"
+                " AND submitted_at > ? ORDER BY submitted_at DESC LIMIT 1",
+                (payload_hash, PENDING, self._expired_before()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def pending(self) -> List[dict]:
+        """
+        Returns every unfinished job submitted within the retention period,
+        oldest first.
+
+        Returns:
+            List[dict]: The `job_id`, `payload`, `source` and `submitted_at`
+            of each unfinished job.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT job_id, payload, source, submitted_at FROM jobs"
+                " WHERE status = ? AND submitted_at > ? ORDER BY submitted_at",
+                (PENDING, self._expired_before()),
+            ).fetchall()
+        return [
+            {
+                "job_id": job_id,
+                "payload": json.loads(payload),
+                "source": source,
+                "submitted_at": submitted_at,
+            }
+            for job_id, payload, source, submitted_at in rows
+        ]
+
+    def _expired_before(self) -> float:
+        return time.time() - self._retention
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from oxylabs.internal.api import AsyncAPI
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingJob:
+    def __init__(
+        self,
+        future: asyncio.Future,
+        delays: Iterator[float],
+        request_timeout: float,
+        next_poll: float,
+        deadline: float,
+    ) -> None:
+        self.future = future
+        self.delays = delays
+        self.request_timeout = request_timeout
+        self.next_poll = next_poll
+        self.deadline = deadline
+        self.waiters = 0
+
+
+class JobPoller:
+    def __init__(self, api: "AsyncAPI", max_concurrency: int) -> None:
+        """
+        Initializes an instance of the JobPoller class.
+
+        A single poller task owns every pending job of an AsyncAPI instance.
+        On each tick it checks the status of all jobs that are due, with at
+        most `max_concurrency` status requests in flight, and resolves the
+        future of each job once it completes, faults or times out.
+
+        Args:
+            api (AsyncAPI): The API instance used for status requests.
+            max_concurrency (int): The maximum number of concurrent status
+            requests.
+        """
+        self._api = api
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._jobs: Dict[str, _PendingJob] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the number of jobs the poller is waiting on.
+        """
+        return len(self._jobs)
+
+    async def wait(
+        self,
+        job_id: str,
+        delays: Iterator[float],
+        timeout: float,
+        request_timeout: float,
+    ) -> bool:
+        """
+        Waits for a job to complete.
+
+        Args:
+            job_id (str): The ID of the job.
+            delays (Iterator[float]): The delays in seconds to wait before
+            each status check of the job.
+            timeout (float): The interval in seconds for the job to time out.
+            request_timeout (float): The timeout for each status request in
+            seconds.
+
+        Returns:
+            bool: True if the job completed, False if it faulted, timed out
+            or its status could not be retrieved.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            now = self._loop.time()
+            job = _PendingJob(
+                future=self._loop.create_future(),
+                delays=delays,
+                request_timeout=request_timeout,
+                next_poll=min(now + next(delays), now + timeout),
+                deadline=now + timeout,
+            )
+            self._jobs[job_id] = job
+            if self._task is None or self._task.done():
+                self._task = self._loop.create_task(self._run())
+            self._wakeup.set()
+
+        job.waiters += 1
+        try:
+            return await asyncio.shield(job.future)
+        finally:
+            job.waiters -= 1
+            # Stop polling jobs nobody is waiting for anymore
+            if job.waiters == 0 and self._jobs.get(job_id) is job:
+                del self._jobs[job_id]
+
+    async def close(self) -> None:
+        """
+        Stops the poller task and releases every waiting job.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for job_id in list(self._jobs):
+            self._resolve(job_id, False)
+
+    def _resolve(self, job_id: str, completed: bool) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is not None and not job.future.done():
+            job.future.set_result(completed)
+
+    async def _run(self) -> None:
+        while self._jobs:
+            self._wakeup.clear()
+            now = self._loop.time()
+            due = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.next_poll <= now
+            ]
+            if due:
+                await asyncio.gather(*(self._check(job_id) for job_id in due))
+                continue
+
+            if not self._jobs:
+                break
+            # Polls are never scheduled after the deadline of a job
+            next_tick = min(job.next_poll for job in self._jobs.values())
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), max(next_tick - now, 0)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, job_id: str) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        async with self._semaphore:
+            try:
+                status = await self._api._get_job_status(
+                    job_id, self._api._session, job.request_timeout
+                )
+            except Exception as e:
+                logger.error(f"Error occurred: {str(e)}")
+                self._resolve(job_id, False)
+                return
+
+        if status == "done":
+            self._resolve(job_id, True)
+        elif status == "faulted":
+            logger.error("Error occurred: Job faulted")
+            self._resolve(job_id, False)
+        elif self._loop.time() >= job.deadline:
+            # The status was checked at the deadline
+            logger.info("Job completion timeout exceeded")
+            self._resolve(job_id, False)
+        else:
+            job.next_poll = min(
+                self._loop.time() + next(job.delays), job.deadline
+            )
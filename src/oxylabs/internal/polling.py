@@ -0,0 +1,149 @@
+import itertools
+import random
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterator, Optional
+
+
+class FixedPollStrategy:
+    """
+    Polls a job right away and then every `poll_interval` seconds.
+    """
+
+    def schedule(
+        self, source: Optional[str], poll_interval: float
+    ) -> Iterator[float]:
+        """
+        Returns the delays in seconds to wait before each status check.
+
+        Args:
+            source (Optional[str]): The source of the job.
+            poll_interval (float): The poll interval of the request.
+
+        Returns:
+            Iterator[float]: An endless iterator of delays.
+        """
+        return itertools.chain([0], itertools.repeat(poll_interval))
+
+    def record(self, source: Optional[str], latency: float) -> None:
+        """
+        Records how long a job took to complete.
+
+        Args:
+            source (Optional[str]): The source of the job.
+            latency (float): The time in seconds from submission to
+            completion.
+        """
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns the learned statistics per source.
+        """
+        return {}
+
+
+class AdaptivePollStrategy(FixedPollStrategy):
+    def __init__(
+        self,
+        window: int = 200,
+        quantile: float = 0.5,
+        min_samples: int = 5,
+        min_interval: float = 0.5,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.2,
+        first_check: float = 0.5,
+    ) -> None:
+        """
+        Initializes an instance of the AdaptivePollStrategy class.
+
+        The expected completion time of a source is taken as a quantile of
+        the latencies of its recently completed jobs, and the first status
+        check of a job is made after `first_check` times that time. Further
+        checks back off exponentially from `min_interval` up to the poll
+        interval of the request, with random jitter so that jobs submitted
+        together are not polled in lockstep.
+
+        A latency is recorded when the job is found to be done, so it is
+        never shorter than the first delay. Checking before the expected
+        completion time lets the prediction come down when jobs get faster.
+
+        Args:
+            window (int): The number of recent latencies kept per source.
+            quantile (float): The quantile of recent latencies used as the
+            first delay.
+            min_samples (int): The number of latencies needed before the
+            first delay is predicted. Until then, jobs are polled right away.
+            min_interval (float): The first delay of the backoff in seconds.
+            backoff_factor (float): The factor applied to the delay after
+            each status check.
+            jitter (float): The maximum relative deviation applied to each
+            delay.
+            first_check (float): The fraction of the expected completion
+            time after which a job is first checked.
+        """
+        self._window = window
+        self._quantile = quantile
+        self._min_samples = min_samples
+        self._min_interval = min_interval
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._first_check = first_check
+        self._latencies: Dict[Optional[str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def predict(self, source: Optional[str]) -> float:
+        """
+        Returns the expected completion time of a job of the given source.
+
+        Args:
+            source (Optional[str]): The source of the job.
+
+        Returns:
+            float: The expected completion time in seconds, or 0 if not
+            enough jobs of the source have completed yet.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(source, ()))
+        if len(latencies) < self._min_samples:
+            return 0
+        return latencies[int(self._quantile * (len(latencies) - 1))]
+
+    def schedule(
+        self, source: Optional[str], poll_interval: float
+    ) -> Iterator[float]:
+        yield self._apply_jitter(self.predict(source) * self._first_check)
+        delay = min(self._min_interval, poll_interval)
+        while True:
+            yield self._apply_jitter(delay)
+            delay = min(delay * self._backoff_factor, poll_interval)
+
+    def record(self, source: Optional[str], latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(source)
+            if latencies is None:
+                latencies = deque(maxlen=self._window)
+                self._latencies[source] = latencies
+            latencies.append(latency)
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            snapshot = {
+                source: sorted(latencies)
+                for source, latencies in self._latencies.items()
+            }
+        stats = {}
+        for source, latencies in snapshot.items():
+            count = len(latencies)
+            stats[source] = {
+                "count": count,
+                "mean": sum(latencies) / count,
+                "p50": latencies[int(0.5 * (count - 1))],
+                "p90": latencies[int(0.9 * (count - 1))],
+                "predicted_delay": self.predict(source),
+            }
+        return stats
+
+    def _apply_jitter(self, delay: float) -> float:
+        if not self._jitter or not delay:
+            return delay
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
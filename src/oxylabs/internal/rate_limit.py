@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+
+class _Budget:
+    def __init__(
+        self,
+        jobs_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        burst: int = 1,
+        utilization: float = 1.0,
+    ) -> None:
+        self.rate = jobs_per_second * utilization if jobs_per_second else None
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+
+    def token_wait(self, now: float) -> float:
+        if self.rate is None:
+            return 0
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take_token(self) -> None:
+        if self.rate is not None:
+            self.tokens -= 1
+
+    def has_slot(self) -> bool:
+        return self.max_concurrent is None or self.in_flight < self.max_concurrent
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        jobs_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        per_source: Optional[Dict[str, dict]] = None,
+        burst: int = 1,
+        utilization: float = 0.95,
+    ) -> None:
+        """
+        Initializes an instance of the RateLimiter class.
+
+        The limiter keeps a token bucket for the job rate and a counter for
+        concurrent jobs, globally and for each source given in
+        `per_source`. A job must fit into every budget it belongs to. One
+        limiter can be shared by several clients, including clients used
+        from different threads and event loops.
+
+        AsyncClient holds a concurrent slot from the submission of a job
+        until its result is fetched. Jobs submitted with `submit` or
+        `submit_batch` are collected separately, possibly never, so they
+        only take from the job rate and do not count towards
+        `max_concurrent`.
+
+        Args:
+            jobs_per_second (Optional[float]): The maximum number of jobs
+            submitted per second, or None for no limit.
+            max_concurrent (Optional[int]): The maximum number of jobs in
+            progress at once, or None for no limit.
+            per_source (Optional[Dict[str, dict]]): Additional budgets keyed
+            by source, e.g. `{"amazon_product": {"jobs_per_second": 5}}`.
+            Each budget accepts `jobs_per_second`, `max_concurrent` and
+            `burst`.
+            burst (int): The number of jobs that can be submitted at once
+            after an idle period.
+            utilization (float): The share of `jobs_per_second` that is used,
+            keeping the client just under the limit.
+        """
+        if not 0 < utilization <= 1:
+            raise ValueError("utilization must be in (0, 1]")
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters = deque()
+        self._global = _Budget(
+            jobs_per_second, max_concurrent, burst, utilization
+        )
+        self._sources = {
+            source: _Budget(
+                options.get("jobs_per_second"),
+                options.get("max_concurrent"),
+                options.get("burst", burst),
+                utilization,
+            )
+            for source, options in (per_source or {}).items()
+        }
+
+    def _budgets(self, source: Optional[str]) -> List[_Budget]:
+        if source in self._sources:
+            return [self._global, self._sources[source]]
+        return [self._global]
+
+    def _try_take_token(self, source: Optional[str]) -> float:
+        """
+        Takes a token from every budget of the source if all have one.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the time in seconds
+            until they are expected to be available.
+        """
+        budgets = self._budgets(source)
+        with self._lock:
+            now = time.monotonic()
+            wait = max(budget.token_wait(now) for budget in budgets)
+            if wait == 0:
+                for budget in budgets:
+                    budget.take_token()
+        return wait
+
+    def throttle(self, source: Optional[str] = None) -> None:
+        """
+        Blocks the calling thread until a job of the source may be
+        submitted.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        wait = self._try_take_token(source)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._try_take_token(source)
+
+    async def throttle_async(self, source: Optional[str] = None) -> None:
+        """
+        Waits without blocking the event loop until a job of the source may
+        be submitted.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        wait = self._try_take_token(source)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._try_take_token(source)
+
+    def _try_take_slot(self, source: Optional[str]) -> bool:
+        # Must be called with the lock held
+        budgets = self._budgets(source)
+        if not all(budget.has_slot() for budget in budgets):
+            return False
+        for budget in budgets:
+            budget.in_flight += 1
+        return True
+
+    def _release_slot(self, source: Optional[str]) -> None:
+        with self._lock:
+            for budget in self._budgets(source):
+                budget.in_flight -= 1
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, deque()
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # The loop of the waiter has been closed
+                pass
+
+    @contextmanager
+    def slot(self, source: Optional[str] = None) -> Iterator[None]:
+        """
+        Holds a concurrent job slot of the source for the duration of the
+        block, blocking the calling thread until one is free.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        with self._condition:
+            while not self._try_take_slot(source):
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            self._release_slot(source)
+
+    @asynccontextmanager
+    async def slot_async(self, source: Optional[str] = None) -> AsyncIterator[None]:
+        """
+        Holds a concurrent job slot of the source for the duration of the
+        block, waiting without blocking the event loop until one is free.
+
+        Args:
+            source (Optional[str]): The source of the job.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_take_slot(source):
+                    break
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            await future
+        try:
+            yield
+        finally:
+            self._release_slot(source)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of jobs in progress, globally and per source.
+
+        Returns:
+            dict: The `in_flight` count and the `sources` counts.
+        """
+        with self._lock:
+            return {
+                "in_flight": self._global.in_flight,
+                "sources": {
+                    source: budget.in_flight
+                    for source, budget in self._sources.items()
+                },
+            }
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,165 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional, Union
+
+# The request phases a retry policy can be set for
+SUBMIT = "submit"
+POLL = "poll"
+RESULT = "result"
+PHASES = (SUBMIT, POLL, RESULT)
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        retry_on_timeout: bool = False,
+        retry_on_connection_error: bool = True,
+    ) -> None:
+        """
+        Initializes an instance of the RetryPolicy class.
+
+        Args:
+            max_attempts (int): The maximum number of attempts, including the
+            first one. Use 1 to disable retries.
+            backoff_factor (float): The delay in seconds before the first
+            retry. It doubles with every further retry.
+            max_backoff (float): The maximum delay in seconds between two
+            attempts.
+            jitter (bool): Whether to randomize delays so that clients
+            retrying at the same time spread out.
+            retry_statuses (Iterable[int]): The HTTP statuses that are
+            retried.
+            respect_retry_after (bool): Whether to wait for the time given in
+            the `Retry-After` header of a response, if any.
+            retry_on_timeout (bool): Whether requests that timed out are
+            retried. Note that a timed out job may still complete on the
+            server.
+            retry_on_connection_error (bool): Whether requests that failed to
+            connect are retried.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.retry_on_timeout = retry_on_timeout
+        self.retry_on_connection_error = retry_on_connection_error
+
+    def should_retry_status(self, status: int, attempt: int) -> bool:
+        """
+        Returns True if a response with the given status should be retried.
+
+        Args:
+            status (int): The HTTP status of the response.
+            attempt (int): The number of the attempt that failed, from 1.
+        """
+        return attempt < self.max_attempts and status in self.retry_statuses
+
+    def should_retry_error(
+        self, timeout: bool, connection_error: bool, attempt: int
+    ) -> bool:
+        """
+        Returns True if a request that failed without a response should be
+        retried.
+
+        Args:
+            timeout (bool): Whether the request timed out.
+            connection_error (bool): Whether the request failed to connect.
+            attempt (int): The number of the attempt that failed, from 1.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return (timeout and self.retry_on_timeout) or (
+            connection_error and self.retry_on_connection_error
+        )
+
+    def get_delay(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> float:
+        """
+        Returns the delay in seconds before the next attempt.
+
+        Args:
+            attempt (int): The number of the attempt that failed, from 1.
+            retry_after (Optional[str]): The `Retry-After` header of the
+            failed response, if any.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        delay = min(
+            self.backoff_factor * 2 ** (attempt - 1), self.max_backoff
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parses a `Retry-After` header given in seconds or as an HTTP date.
+
+    Args:
+        value (str): The header value.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if the value is
+        invalid.
+    """
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+def get_retry_policies(
+    retry: Union[RetryPolicy, Dict[str, RetryPolicy], None]
+) -> Dict[str, RetryPolicy]:
+    """
+    Returns the retry policy of each request phase.
+
+    Args:
+        retry (RetryPolicy | Dict[str, RetryPolicy] | None): A policy used
+        for every phase, a mapping of "submit", "poll" and "result" to their
+        policies, or None for the default policy. Phases missing from the
+        mapping use the default policy.
+
+    Raises:
+        ValueError: If the mapping contains an unknown phase.
+
+    Returns:
+        Dict[str, RetryPolicy]: The policy of each phase.
+    """
+    if isinstance(retry, RetryPolicy):
+        return {phase: retry for phase in PHASES}
+
+    retry = retry or {}
+    unknown = set(retry) - set(PHASES)
+    if unknown:
+        raise ValueError(f"Unknown retry phases: {', '.join(sorted(unknown))}")
+    default = RetryPolicy()
+    return {phase: retry.get(phase, default) for phase in PHASES}
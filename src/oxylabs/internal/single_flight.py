@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        """
+        Initializes an instance of the SingleFlight class.
+
+        Calls made with the same key while a call for that key is running in
+        another thread wait for it and receive its result instead of running
+        themselves.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Runs `fn` unless a call with the same key is already running.
+
+        Args:
+            key (str): The key identifying identical calls.
+            fn (Callable[[], Any]): The function to run.
+
+        Returns:
+            Any: The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    def __init__(self) -> None:
+        """
+        Initializes an instance of the AsyncSingleFlight class.
+
+        Coroutines started with the same key while one for that key is
+        running on the same event loop await it and receive its result
+        instead of running themselves.
+        """
+        self._futures: Dict[str, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits `fn()` unless a call with the same key is already running.
+
+        If the running call is cancelled, waiting calls start their own.
+
+        Args:
+            key (str): The key identifying identical calls.
+            fn (Callable[[], Awaitable[Any]]): The coroutine function to run.
+
+        Returns:
+            Any: The result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._futures.get(key)
+            if future is None or future.get_loop() is not loop:
+                break
+            self.shared += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = loop.create_future()
+        self._futures[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no call is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
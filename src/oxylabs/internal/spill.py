@@ -0,0 +1,143 @@
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Any, Callable, Optional
+
+from oxylabs.utils.defaults import STREAM_CHUNK_SIZE
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class SpilledContent:
+    def __init__(self, content: str, directory: Optional[str] = None) -> None:
+        """
+        Initializes an instance of the SpilledContent class.
+
+        The content is written to a temporary file as UTF-8 and read back
+        through a memory map when accessed. No file is kept open between
+        accesses, and the file is removed once the instance is garbage
+        collected.
+
+        Args:
+            content (str): The content of a result.
+            directory (Optional[str]): The directory of the file. Defaults
+            to the system temporary directory.
+        """
+        fd, self.path = tempfile.mkstemp(
+            prefix="oxylabs-", suffix=".content", dir=directory
+        )
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+        with open(fd, "wb") as file:
+            # Encode in chunks so that no full-size copy is made
+            for start in range(0, len(content), STREAM_CHUNK_SIZE):
+                file.write(
+                    content[start : start + STREAM_CHUNK_SIZE].encode()
+                )
+            self.size = file.tell()
+
+    def view(self) -> memoryview:
+        """
+        Returns the UTF-8 encoded content as a memory mapped view of the
+        file.
+        """
+        if self.size == 0:
+            return memoryview(b"")
+        with open(self.path, "rb") as file:
+            return memoryview(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+
+    def text(self) -> str:
+        """
+        Returns the content read back from the file.
+        """
+        with self.view() as view:
+            return str(view, "utf-8")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def __repr__(self) -> str:
+        return f"SpilledContent(path={self.path!r}, size={self.size})"
+
+
+def spill_content(
+    data: Any, threshold: int, directory: Optional[str] = None
+) -> Any:
+    """
+    Moves string contents of results longer than the threshold to files.
+
+    Both a full response and a single result, as yielded when streaming,
+    are accepted. The data is changed in place and returned.
+
+    Args:
+        data (Any): The decoded response or result.
+        threshold (int): The length in characters above which a content is
+        moved to a file.
+        directory (Optional[str]): The directory of the files.
+
+    Returns:
+        Any: The data.
+    """
+    if not isinstance(data, dict):
+        return data
+    results = data.get("results")
+    if isinstance(results, list):
+        for result in results:
+            spill_content(result, threshold, directory)
+        return data
+    content = data.get("content")
+    if isinstance(content, str) and len(content) > threshold:
+        data["content"] = SpilledContent(content, directory)
+    return data
+
+
+def spilling(
+    decode: Callable[[bytes], Any],
+    threshold: int,
+    directory: Optional[str] = None,
+) -> Callable[[bytes], Any]:
+    """
+    Wraps a JSON decoding function so that large contents of the decoded
+    results are moved to files, see `spill_content`.
+
+    Args:
+        decode (Callable[[bytes], Any]): The decoding function.
+        threshold (int): The length in characters above which a content is
+        moved to a file.
+        directory (Optional[str]): The directory of the files.
+
+    Raises:
+        ValueError: If the threshold is negative.
+
+    Returns:
+        Callable[[bytes], Any]: The wrapped decoding function.
+    """
+    if threshold < 0:
+        raise ValueError("The spill threshold must not be negative")
+
+    def decode_and_spill(data: bytes) -> Any:
+        return spill_content(decode(data), threshold, directory)
+
+    return decode_and_spill
+
+
+def encode_content(value: Any) -> str:
+    """
+    Returns the text of spilled content so that responses holding it can
+    be serialized with `json.dumps(..., default=encode_content)`.
+    """
+    if isinstance(value, SpilledContent):
+        return value.text()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
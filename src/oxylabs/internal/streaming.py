@@ -0,0 +1,164 @@
+import contextvars
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+# Collects the requests made by source calls inside `capturing()`
+_captured_requests = contextvars.ContextVar(
+    "oxylabs_captured_requests", default=None
+)
+
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+@contextmanager
+def capturing() -> Iterator[List[Tuple[dict, dict]]]:
+    """
+    Switches RealtimeAPI to capture mode for the current context.
+
+    Source calls made inside the block send no request and return an empty
+    Response. The payload and configuration of each call are appended to
+    the yielded list.
+
+    Yields:
+        List[Tuple[dict, dict]]: The captured payloads and configurations.
+    """
+    requests = []
+    token = _captured_requests.set(requests)
+    try:
+        yield requests
+    finally:
+        _captured_requests.reset(token)
+
+
+def get_captured_requests() -> Optional[List[Tuple[dict, dict]]]:
+    """
+    Returns the list capturing requests if the current context is in
+    capture mode, None otherwise.
+    """
+    return _captured_requests.get()
+
+
+class ResultsParser:
+    def __init__(self, field: str = "results") -> None:
+        """
+        Initializes an instance of the ResultsParser class.
+
+        The parser splits the items of a top-level array out of a JSON
+        object fed to it in chunks, so that each item can be decoded as
+        soon as it is complete. Only the item being read is buffered; the
+        rest of the object is kept aside and available from `remainder`
+        with the array left empty.
+
+        Args:
+            field (str): The key of the array in the top-level object.
+        """
+        self._field = field.encode()
+        self._buffer = bytearray()
+        self._remainder = bytearray()
+        self._pos = 0
+        self._flushed = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._key = None
+        self._in_array = False
+        self._item_start = None
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Parses the next chunk of the body.
+
+        Args:
+            data (bytes): The chunk.
+
+        Returns:
+            List[bytes]: The items of the array completed by the chunk.
+        """
+        buffer = self._buffer
+        buffer += data
+        items = []
+        i = self._pos
+        end = len(buffer)
+        while i < end:
+            if self._in_string:
+                match = _STRING_END.search(buffer, i)
+                if match is None:
+                    i = end
+                    break
+                j = match.start()
+                if buffer[j] == 0x5C:  # backslash
+                    if j + 1 == end:
+                        # Wait for the escaped character
+                        i = j
+                        break
+                    i = j + 2
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._key = bytes(buffer[self._string_start : j])
+                i = j + 1
+                continue
+
+            match = _STRUCTURAL.search(buffer, i)
+            if match is None:
+                i = end
+                break
+            j = match.start()
+            char = buffer[j]
+            if char == 0x22:  # "
+                self._in_string = True
+                self._string_start = j + 1
+            elif char in b"[{":
+                self._depth += 1
+                if (
+                    char == 0x5B
+                    and self._depth == 2
+                    and self._key == self._field
+                    and not self._in_array
+                ):
+                    self._in_array = True
+                    self._remainder += buffer[self._flushed : j + 1]
+                    self._flushed = j + 1
+                elif self._in_array and self._depth == 3:
+                    self._item_start = j
+            else:
+                if self._in_array and self._depth == 3 and char == 0x7D:
+                    items.append(bytes(buffer[self._item_start : j + 1]))
+                    self._item_start = None
+                    self._flushed = j + 1
+                elif self._in_array and self._depth == 2:
+                    self._in_array = False
+                    self._key = None
+                    self._flushed = j
+                self._depth -= 1
+            i = j + 1
+
+        self._pos = i
+        self._compact()
+        return items
+
+    def _compact(self) -> None:
+        # Drop the parsed bytes that are no longer needed, moving those
+        # outside of the array to the remainder
+        cut = self._pos
+        if self._item_start is not None:
+            cut = self._item_start
+        elif self._in_string:
+            cut = min(cut, self._string_start)
+        if not self._in_array:
+            self._remainder += self._buffer[self._flushed : cut]
+        if cut:
+            del self._buffer[:cut]
+            self._pos -= cut
+            self._string_start -= cut
+            if self._item_start is not None:
+                self._item_start -= cut
+        self._flushed = 0
+
+    def remainder(self) -> bytes:
+        """
+        Returns the body parsed so far without the items of the array.
+        """
+        return bytes(self._remainder + self._buffer[self._flushed :])
@@ -1,1183 +1,984 @@
+import copy
 
-class Response:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.results = [Results(item) for item in data.get("results", [])]
-        self.job = Job(data.get("job", {}))
+from oxylabs.internal.content import decode_into, iter_decoded
+from oxylabs.internal.spill import SpilledContent
 
+_MISSING = object()
 
-class Results:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.custom_content_parsed = data.get("custom_content_parsed", {})
-        self.content_parsed = Content(data.get("content_parsed", {}))
-        self.content = data.get("content")
-        self.created_at = data.get("created_at")
-        self.updated_at = data.get("updated_at")
-        self.page = data.get("page")
-        self.url = data.get("url")
-        self.job_id = data.get("job_id")
-        self.status_code = data.get("status_code")
-        self.parser_type = data.get("parser_type")
-
-
-class Content:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.pages = data.get("pages")
-        self.query = data.get("query")
-        self.images = data.get("images")
-        self.variants = Variants(data.get("variants", {}))
-        self.highlights = data.get("highlights", [])
-        self.description = data.get("description")
-        self.related_items = RelatedItems(data.get("related_items", {}))
-        self.specifications = Specifications(data.get("specifications", {}))
-        self.page = data.get("page")
-        self.errors = data.get("_errors")
-        self.results = Result(data.get("results", {}))
-        self.rating = data.get("rating")
-        self.pricing = [Pricing(item) for item in data.get("pricing", [])]
-        self.ads = [AmazonProductAds(item) for item in data.get("ads", [])]
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.stock = data.get("stock")
-        self.coupon = data.get("coupon")
-        self.category = [
-            AmazonProductCategory(item) for item in data.get("category", [])
-        ]
-        self.currency = data.get("currency")
-        self.delivery = [
-            AmazonProductDelivery(item) for item in data.get("delivery", [])
-        ]
-        self.warnings = data.get("_warnings", [])
-        self.deal_type = data.get("deal_type")
-        self.page_type = data.get("page_type")
-        self.price_sns = data.get("price_sns")
-        self.variation = data.get("variation")
-        self.has_videos = data.get("has_videos")
-        self.sales_rank = [
-            AmazonProductSalesRank(item) for item in data.get("sales_rank", [])
-        ]
-        self.top_review = data.get("top_review")
-        self.asin_in_url = data.get("asin_in_url")
-        self.price_upper = data.get("price_upper")
-        self.pricing_str = data.get("pricing_str")
-        self.pricing_url = data.get("pricing_url")
-        self.discount_end = data.get("discount_end")
-        self.manufacturer = data.get("manufacturer")
-        self.max_quantity = data.get("max_quantity")
-        self.price_buybox = data.get("price_buybox")
-        self.product_name = data.get("product_name")
-        self.bullet_points = data.get("bullet_points")
-        self.is_addon_item = data.get("is_addon_item")
-        self.price_initial = data.get("price_initial")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.sns_discounts = data.get("sns_discounts", [])
-        self.developer_info = data.get("developer_info", [])
-        self.lightning_deal = data.get("lightning_deal")
-        self.price_shipping = data.get("price_shipping")
-        self.is_prime_pantry = data.get("is_prime_pantry")
-        self.product_details = ProductDetails(data.get("product_details", {}))
-        self.featured_merchant = data.get("featured_merchant", [])
-        self.is_prime_eligible = data.get("is_prime_eligible")
-        self.product_dimensions = data.get("product_dimensions")
-        self.refurbished_product = AmazonRefurbishedProduct(
-            data.get("refurbished_product", {})
-        )
-        self.answered_questions_count = data.get("answered_questions_count")
-        self.rating_star_distribution = [
-            AmazonRatingStarDistribution(item)
-            for item in data.get("rating_star_distribution", [])
-        ]
-        self.reviews = [
-            AmazonReviews(item) for item in data.get("reviews", [])
-        ]
-        self.questions = AmazonQuestions(data.get("questions", {}))
-        self.questions_total = data.get("questions_total")
-        self.business_name = data.get("business_name")
-        self.recent_feedback = [
-            RecentFeedback(item) for item in data.get("recent_feedback", [])
-        ]
-        self.business_address = data.get("business_address")
-        self.feedback_summary_table = FeedbackSummaryTable(
-            data.get("feedback_summary_table", {})
-        )
-        self.review_count = data.get("review_count")
-        self.last_visible_page = data.get("last_visible_page")
-        self.parse_status_code = data.get("parse_status_code")
-
-
-class Result:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.paid = [Paid(item) for item in data.get("paid", [])]
-        self.filters = [Filters(item) for item in data.get("filters", [])]
-        self.search_information = SearchInformation(
-            data.get("search_information")
-        )
-        self.suggested = [
-            SuggestedAmazonSearch(item) for item in data.get("suggested", [])
-        ]
-        self.amazon_choices = [
-            AmazonChoices(item) for item in data.get("amazon_choices", [])
-        ]
-        self.instant_recommendations = [
-            InstantRecommendations(item)
-            for item in data.get("instant_recommendations", [])
-        ]
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.currency = data.get("currency")
-        self.is_prime = data.get("is_prime")
-        self.price_str = data.get("price_str")
-        self.price_upper = data.get("price_upper")
-        self.ratings_count = data.get("ratings_count")
-        self.pla = Pla(data.get("pla", {}))
-        self.images = Image(data.get("images", {}))
-        self.twitter = Twitter(data.get("twitter", {}))
-        self.knowledge = Knowledge(data.get("knowledge", {}))
-        self.local_pack = LocalPack(data.get("local_pack", {}))
-        self.top_stories = TopStory(data.get("top_stories", {}))
-        self.popular_products = [
-            PopularProducts(item) for item in data.get("popular_products", [])
-        ]
-        self.related_searches = RelatedSearches(
-            data.get("related_searches", {})
-        )
-        self.related_questions = RelatedQuestions(
-            data.get("related_questions", {})
-        )
-        self.item_carousel = ItemCarousel(data.get("item_carousel", {}))
-        self.recipes = Recipes(data.get("recipes", {}))
-        self.videos = Videos(data.get("videos", {}))
-        self.featured_snippet = [
-            FeaturedSnippet(item) for item in data.get("featured_snippet", [])
-        ]
-        self.related_searches_categorized = [
-            RelatedSearchesCategorized(item)
-            for item in data.get("related_searches_categorized", [])
-        ]
-        self.hotels = Hotels(data.get("hotels", {}))
-        self.flights = Flights(data.get("flights", {}))
-        self.video_box = VideoBox(data.get("video_box", {}))
-        self.local_service_ads = LocalServiceAds(
-            data.get("local_service_ads", {})
-        )
-        self.navigation = [
-            Navigation(item) for item in data.get("navigation", [])
-        ]
-        self.instant_answers = [
-            InstantAnswers(item) for item in data.get("instant_answers", [])
-        ]
-        self.visually_similar_images = VisuallySimilarImages(
-            data.get("visually_similar_images", {})
-        )
-        self.total_results_count = data.get("total_results_count")
-
-
-class Paid:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.desc = data.get("desc")
-        self.title = data.get("title")
-        self.data_rw = data.get("data_rw")
-        self.data_pcu = data.get("data_pcu")
-        self.sitelinks = PaidSitelinks(data.get("sitelinks", {}))
-        self.url_shown = data.get("url_shown")
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.rating = data.get("rating")
-        self.rel_pos = data.get("rel_pos")
-        self.currency = data.get("currency")
-        self.url_image = data.get("url_image")
-        self.best_seller = data.get("best_seller")
-        self.price_upper = data.get("price_upper")
-        self.is_sponsored = data.get("is_sponsored")
-        self.manufacturer = data.get("manufacturer")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.is_amazons_choice = data.get("is_amazons_choice")
-        self.no_price_reason = data.get("no_price_reason")
-        self.sales_volume = data.get("sales_volume")
-        self.is_prime = data.get("is_prime")
-        self.shipping_information = data.get("shipping_information")
-        self.pos_overall = data.get("pos_overall")
-
-
-class PaidSitelinks:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.expanded = [Expanded(item) for item in data.get("expanded", [])]
-        self.inline = [Inline(item) for item in data.get("inline", [])]
 
+class _Field:
+    """
+    A response attribute read from the raw data on access. Nested models,
+    converted values and defaults are built on first access and cached on
+    the instance, so that only the parts of a response that are read are
+    ever constructed.
+    """
 
-class Expanded:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.desc = data.get("desc")
-        self.title = data.get("title")
+    def __init__(self, key, default=None, model=None, many=False, convert=None):
+        self.key = key
+        self.default = default
+        self.model = model
+        self.many = many
+        self.convert = convert
+        self.name = None
 
+    def __set_name__(self, owner, name):
+        self.name = name
 
-class Inline:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.desc = data.get("desc")
-        self.title = data.get("title")
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance._values
+        if values is not None and self.name in values:
+            return values[self.name]
 
+        value = instance.raw.get(self.key, _MISSING)
+        if value is _MISSING:
+            if self.default is None:
+                return None
+            value = copy.copy(self.default)
+        elif self.model is None and self.convert is None:
+            return value
 
-class Filters:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.name = data.get("name")
-        self.values = [FilterValues(item) for item in data.get("values", [])]
+        if self.model is not None:
+            # Models are referenced by name as most are defined further down
+            model = globals()[self.model]
+            if self.many:
+                value = [model(item) for item in value]
+            else:
+                value = model(value)
+        elif self.convert is not None:
+            value = self.convert(value)
+        self.__set__(instance, value)
+        return value
 
+    def __set__(self, instance, value):
+        if instance._values is None:
+            instance._values = {}
+        instance._values[self.name] = value
 
-class FilterValues:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.value = data.get("value")
 
+class _ContentField(_Field):
+    """
+    The content of a result, read back from its file on each access if it
+    was moved out of memory.
+    """
 
-class Organic:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.desc = data.get("desc")
-        self.type = data.get("type")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.currency = data.get("currency")
-        self.merchant = Merchant(data.get("merchant", {}))
-        self.price_str = data.get("price_str")
-        self.product_id = data.get("product_id")
-        self.asin = data.get("asin")
-        self.rating = data.get("rating")
-        self.url_image = data.get("url_image")
-        self.best_seller = data.get("best_seller")
-        self.price_upper = data.get("price_upper")
-        self.is_sponsored = data.get("is_sponsored")
-        self.manufacturer = data.get("manufacturer")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.is_amazons_choice = data.get("is_amazons_choice")
-        self.no_price_reason = data.get("no_price_reason")
-        self.is_prime = data.get("is_prime")
-        self.sales_volume = data.get("sales_volume")
-        self.variations = [
-            Variations(item) for item in data.get("variations", [])
-        ]
-        self.images = [item for item in data.get("images", [])]
-        self.site_links = OrganicSitelinks(data.get("sitelinks", {}))
-        self.url_shown = data.get("url_shown")
-        self.pos_overall = data.get("pos_overall")
-
-
-class Merchant:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.name = data.get("name")
+    def __get__(self, instance, owner=None):
+        value = super().__get__(instance, owner)
+        if isinstance(value, SpilledContent):
+            return value.text()
+        return value
 
 
-class Variations:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.asin = data.get("asin")
-        self.title = data.get("title")
-        self.price = data.get("price")
-        self.price_strikethrough = data.get("price_strikethrough")
-        self.not_available = data.get("not_available")
+def _field(key, default=None, convert=None):
+    return _Field(key, default, convert=convert)
 
 
-class SearchInformation:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.query = data.get("query")
-        self.showing_results_for = data.get("showing_results_for")
-        self.image = SearchInformationImage(data.get("image", {}))
-        self.total_results_count = data.get("total_results_count")
+def _model(key, model):
+    return _Field(key, {}, model=model)
 
 
-class Variants:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.type = data.get("type")
-        self.items = [VariantItem(item) for item in data.get("items", [])]
+def _models(key, model):
+    return _Field(key, [], model=model, many=True)
+
+
+def _ladder(items):
+    return [{"url": item.get("url"), "name": item.get("name")} for item in items]
 
 
-class VariantItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.value = data.get("value")
-        self.selected = data.get("selected")
-        self.available = data.get("available")
-        self.product_id = data.get("product_id")
+class _ModelMeta(type):
+    def __new__(mcs, name, bases, namespace):
+        # Models keep no instance __dict__, only the slots of _Model
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace)
 
 
-class RelatedItems:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [RelatedItem(item) for item in data.get("items", [])]
+class _Model(metaclass=_ModelMeta):
+    __slots__ = ("raw", "_values")
+
+    def __init__(self, data):
+        if data is None:
+            data = {}
+        self.raw = data
+        self._values = None
+
+
+class Response(_Model):
+    results = _models("results", "Results")
+    job = _model("job", "Job")
+
+    def to_arrow(self, path="results.organic", schema=None):
+        """
+        Builds an Arrow table from the parsed results, reading the rows at
+        `path` of `content_parsed` straight from the raw data. Requires
+        pyarrow, see `oxylabs.export.to_arrow`.
+        """
+        from oxylabs.export.arrow import to_arrow
+
+        return to_arrow(self, path, schema)
+
+    def to_pandas(self, path="results.organic", schema=None):
+        """
+        Builds a pandas DataFrame from the parsed results. Requires pyarrow
+        and pandas, see `oxylabs.export.to_pandas`.
+        """
+        from oxylabs.export.arrow import to_pandas
+
+        return to_pandas(self, path, schema)
+
+
+class Results(_Model):
+    custom_content_parsed = _field("custom_content_parsed", {})
+    content_parsed = _model("content_parsed", "Content")
+    content = _ContentField("content")
+    created_at = _field("created_at")
+    updated_at = _field("updated_at")
+    page = _field("page")
+    url = _field("url")
+    job_id = _field("job_id")
+    status_code = _field("status_code")
+    parser_type = _field("parser_type")
+
+    @property
+    def content_spilled(self):
+        """
+        Whether the content was moved to a file, see `spill_threshold`.
+        """
+        return isinstance(self.raw.get("content"), SpilledContent)
+
+    def content_view(self):
+        """
+        Returns the UTF-8 encoded text content as a memoryview, memory
+        mapped from its file if the content was moved out of memory, or
+        None if the content is not text.
+        """
+        content = self.raw.get("content")
+        if isinstance(content, SpilledContent):
+            return content.view()
+        if isinstance(content, str):
+            return memoryview(content.encode())
+        return None
+
+    def content_bytes(self, encoding="base64"):
+        """
+        Returns the content decoded into a buffer allocated once at its
+        full size, without intermediate copies of the whole content.
+
+        Args:
+            encoding (str): "base64" for screenshots (`render="png"`) and
+            contents requested with `content_encoding="base64"`, otherwise
+            the codec to encode text content with, e.g. "utf-8".
+
+        Raises:
+            TypeError: If the content is not text.
+
+        Returns:
+            bytearray: The content.
+        """
+        return decode_into(self._text_content(), encoding)
+
+    def save(self, path, encoding="base64"):
+        """
+        Writes the content to a file, decoding it in chunks so that the
+        decoded content is never held in memory at once.
+
+        Args:
+            path (str | os.PathLike): The path of the file.
+            encoding (str): See `content_bytes`.
+
+        Raises:
+            TypeError: If the content is not text.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        content = self._text_content()
+        written = 0
+        with open(path, "wb") as file:
+            for chunk in iter_decoded(content, encoding):
+                written += file.write(chunk)
+        return written
+
+    def _text_content(self):
+        content = self.raw.get("content")
+        if not isinstance(content, (str, SpilledContent)):
+            raise TypeError("The content of the result is not text")
+        return content
+
+
+class Content(_Model):
+    url = _field("url")
+    title = _field("title")
+    pages = _field("pages")
+    query = _field("query")
+    images = _field("images")
+    variants = _model("variants", "Variants")
+    highlights = _field("highlights", [])
+    description = _field("description")
+    related_items = _model("related_items", "RelatedItems")
+    specifications = _model("specifications", "Specifications")
+    page = _field("page")
+    errors = _field("_errors")
+    results = _model("results", "Result")
+    rating = _field("rating")
+    pricing = _models("pricing", "Pricing")
+    ads = _models("ads", "AmazonProductAds")
+    asin = _field("asin")
+    price = _field("price")
+    stock = _field("stock")
+    coupon = _field("coupon")
+    category = _models("category", "AmazonProductCategory")
+    currency = _field("currency")
+    delivery = _models("delivery", "AmazonProductDelivery")
+    warnings = _field("_warnings", [])
+    deal_type = _field("deal_type")
+    page_type = _field("page_type")
+    price_sns = _field("price_sns")
+    variation = _field("variation")
+    has_videos = _field("has_videos")
+    sales_rank = _models("sales_rank", "AmazonProductSalesRank")
+    top_review = _field("top_review")
+    asin_in_url = _field("asin_in_url")
+    price_upper = _field("price_upper")
+    pricing_str = _field("pricing_str")
+    pricing_url = _field("pricing_url")
+    discount_end = _field("discount_end")
+    manufacturer = _field("manufacturer")
+    max_quantity = _field("max_quantity")
+    price_buybox = _field("price_buybox")
+    product_name = _field("product_name")
+    bullet_points = _field("bullet_points")
+    is_addon_item = _field("is_addon_item")
+    price_initial = _field("price_initial")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    sns_discounts = _field("sns_discounts", [])
+    developer_info = _field("developer_info", [])
+    lightning_deal = _field("lightning_deal")
+    price_shipping = _field("price_shipping")
+    is_prime_pantry = _field("is_prime_pantry")
+    product_details = _model("product_details", "ProductDetails")
+    featured_merchant = _field("featured_merchant", [])
+    is_prime_eligible = _field("is_prime_eligible")
+    product_dimensions = _field("product_dimensions")
+    refurbished_product = _model(
+        "refurbished_product", "AmazonRefurbishedProduct"
+    )
+    answered_questions_count = _field("answered_questions_count")
+    rating_star_distribution = _models(
+        "rating_star_distribution", "AmazonRatingStarDistribution"
+    )
+    reviews = _models("reviews", "AmazonReviews")
+    questions = _model("questions", "AmazonQuestions")
+    questions_total = _field("questions_total")
+    business_name = _field("business_name")
+    recent_feedback = _models("recent_feedback", "RecentFeedback")
+    business_address = _field("business_address")
+    feedback_summary_table = _model(
+        "feedback_summary_table", "FeedbackSummaryTable"
+    )
+    review_count = _field("review_count")
+    last_visible_page = _field("last_visible_page")
+    parse_status_code = _field("parse_status_code")
+
+
+class Result(_Model):
+    paid = _models("paid", "Paid")
+    filters = _models("filters", "Filters")
+    search_information = _model("search_information", "SearchInformation")
+    suggested = _models("suggested", "SuggestedAmazonSearch")
+    amazon_choices = _models("amazon_choices", "AmazonChoices")
+    instant_recommendations = _models(
+        "instant_recommendations", "InstantRecommendations"
+    )
+    pos = _field("pos")
+    url = _field("url")
+    asin = _field("asin")
+    price = _field("price")
+    title = _field("title")
+    rating = _field("rating")
+    currency = _field("currency")
+    is_prime = _field("is_prime")
+    price_str = _field("price_str")
+    price_upper = _field("price_upper")
+    ratings_count = _field("ratings_count")
+    pla = _model("pla", "Pla")
+    images = _model("images", "Image")
+    twitter = _model("twitter", "Twitter")
+    knowledge = _model("knowledge", "Knowledge")
+    local_pack = _model("local_pack", "LocalPack")
+    top_stories = _model("top_stories", "TopStory")
+    popular_products = _models("popular_products", "PopularProducts")
+    related_searches = _model("related_searches", "RelatedSearches")
+    related_questions = _model("related_questions", "RelatedQuestions")
+    item_carousel = _model("item_carousel", "ItemCarousel")
+    recipes = _model("recipes", "Recipes")
+    videos = _model("videos", "Videos")
+    featured_snippet = _models("featured_snippet", "FeaturedSnippet")
+    related_searches_categorized = _models(
+        "related_searches_categorized", "RelatedSearchesCategorized"
+    )
+    hotels = _model("hotels", "Hotels")
+    flights = _model("flights", "Flights")
+    video_box = _model("video_box", "VideoBox")
+    local_service_ads = _model("local_service_ads", "LocalServiceAds")
+    navigation = _models("navigation", "Navigation")
+    instant_answers = _models("instant_answers", "InstantAnswers")
+    visually_similar_images = _model(
+        "visually_similar_images", "VisuallySimilarImages"
+    )
+    total_results_count = _field("total_results_count")
+
+
+class Paid(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    desc = _field("desc")
+    title = _field("title")
+    data_rw = _field("data_rw")
+    data_pcu = _field("data_pcu")
+    sitelinks = _model("sitelinks", "PaidSitelinks")
+    url_shown = _field("url_shown")
+    asin = _field("asin")
+    price = _field("price")
+    rating = _field("rating")
+    rel_pos = _field("rel_pos")
+    currency = _field("currency")
+    url_image = _field("url_image")
+    best_seller = _field("best_seller")
+    price_upper = _field("price_upper")
+    is_sponsored = _field("is_sponsored")
+    manufacturer = _field("manufacturer")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    is_amazons_choice = _field("is_amazons_choice")
+    no_price_reason = _field("no_price_reason")
+    sales_volume = _field("sales_volume")
+    is_prime = _field("is_prime")
+    shipping_information = _field("shipping_information")
+    pos_overall = _field("pos_overall")
+
+
+class PaidSitelinks(_Model):
+    expanded = _models("expanded", "Expanded")
+    inline = _models("inline", "Inline")
+
+
+class Expanded(_Model):
+    url = _field("url")
+    desc = _field("desc")
+    title = _field("title")
+
+
+class Inline(_Model):
+    url = _field("url")
+    desc = _field("desc")
+    title = _field("title")
+
+
+class Filters(_Model):
+    name = _field("name")
+    values = _models("values", "FilterValues")
+
+
+class FilterValues(_Model):
+    url = _field("url")
+    value = _field("value")
+
+
+class Organic(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    desc = _field("desc")
+    type = _field("type")
+    price = _field("price")
+    title = _field("title")
+    currency = _field("currency")
+    merchant = _model("merchant", "Merchant")
+    price_str = _field("price_str")
+    product_id = _field("product_id")
+    asin = _field("asin")
+    rating = _field("rating")
+    url_image = _field("url_image")
+    best_seller = _field("best_seller")
+    price_upper = _field("price_upper")
+    is_sponsored = _field("is_sponsored")
+    manufacturer = _field("manufacturer")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    is_amazons_choice = _field("is_amazons_choice")
+    no_price_reason = _field("no_price_reason")
+    is_prime = _field("is_prime")
+    sales_volume = _field("sales_volume")
+    variations = _models("variations", "Variations")
+    images = _field("images", [], convert=list)
+    site_links = _model("sitelinks", "OrganicSitelinks")
+    url_shown = _field("url_shown")
+    pos_overall = _field("pos_overall")
+
+
+class Merchant(_Model):
+    url = _field("url")
+    name = _field("name")
+
+
+class Variations(_Model):
+    asin = _field("asin")
+    title = _field("title")
+    price = _field("price")
+    price_strikethrough = _field("price_strikethrough")
+    not_available = _field("not_available")
+
+
+class SearchInformation(_Model):
+    query = _field("query")
+    showing_results_for = _field("showing_results_for")
+    image = _model("image", "SearchInformationImage")
+    total_results_count = _field("total_results_count")
+
+
+class Variants(_Model):
+    type = _field("type")
+    items = _models("items", "VariantItem")
+
+
+class VariantItem(_Model):
+    value = _field("value")
+    selected = _field("selected")
+    available = _field("available")
+    product_id = _field("product_id")
+
+
+class RelatedItems(_Model):
+    items = _models("items", "RelatedItem")
+
+
+class RelatedItem(_Model):
+    url = _field("url")
+    price = _field("price")
+    title = _field("title")
+    rating = _field("rating")
+    currency = _field("currency")
+    reviews_count = _field("reviews_count")
+
+
+class Specifications(_Model):
+    items = _models("items", "SpecificationItem")
+    section_title = _field("section_title")
+
+
+class SpecificationItem(_Model):
+    title = _field("title")
+    value = _field("value")
+
+
+class Pricing(_Model):
+    price = _field("price")
+    seller = _field("seller")
+    details = _field("details")
+    currency = _field("currency")
+    condition = _field("condition")
+    price_tax = _field("price_tax")
+    price_total = _field("price_total")
+    seller_link = _field("seller_link")
+    price_shipping = _field("price_shipping")
+    delivery = _field("delivery")
+    seller_id = _field("seller_id")
+    rating_count = _field("rating_count")
+    delivery_options = _field("delivery_options")
+
+
+class SuggestedAmazonSearch(_Model):
+    url = _field("url")
+    asin = _field("asin")
+    price = _field("price")
+    title = _field("title")
+    rating = _field("rating")
+    currency = _field("currency")
+    url_image = _field("url_image")
+    best_seller = _field("best_seller")
+    price_upper = _field("price_upper")
+    is_sponsored = _field("is_sponsored")
+    manufacturer = _field("manufacturer")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    is_amazons_choice = _field("is_amazons_choice")
+    pos = _field("pos")
+    shipping_information = _field("shipping_information")
+    sales_volume = _field("sales_volume")
+    no_price_reason = _field("no_price_reason")
+    suggested_query = _field("suggested_query")
+
+
+class AmazonChoices(_Model):
+    url = _field("url")
+    asin = _field("asin")
+    price = _field("price")
+    title = _field("title")
+    rating = _field("rating")
+    currency = _field("currency")
+    url_image = _field("url_image")
+    best_seller = _field("best_seller")
+    price_upper = _field("price_upper")
+    is_sponsored = _field("is_sponsored")
+    manufacturer = _field("manufacturer")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    is_amazons_choice = _field("is_amazons_choice")
+    pos = _field("pos")
+    is_prime = _field("is_prime")
+    shipping_information = _field("shipping_information")
+    sales_volume = _field("sales_volume")
+    no_price_reason = _field("no_price_reason")
+    variations = _models("variations", "Variations")
+
+
+class InstantRecommendations(_Model):
+    url = _field("url")
+    asin = _field("asin")
+    price = _field("price")
+    title = _field("title")
+    rating = _field("rating")
+    currency = _field("currency")
+    url_image = _field("url_image")
+    best_seller = _field("best_seller")
+    price_upper = _field("price_upper")
+    is_sponsored = _field("is_sponsored")
+    manufacturer = _field("manufacturer")
+    pricing_count = _field("pricing_count")
+    reviews_count = _field("reviews_count")
+    is_amazons_choice = _field("is_amazons_choice")
+    pos = _field("pos")
+    sales_volume = _field("sales_volume")
+    no_price_reason = _field("no_price_reason")
+
+
+class AmazonProductAds(_Model):
+    pos = _field("pos")
+    asin = _field("asin")
+    type = _field("type")
+    price = _field("price")
+    title = _field("title")
+    images = _field("images", [])
+    rating = _field("rating")
+    location = _field("location")
+    price_upper = _field("price_upper")
+    reviews_count = _field("reviews_count")
+    is_prime_eligible = _field("is_prime_eligible")
+
+
+class AmazonProductCategory(_Model):
+    ladder = _field("ladder", [], convert=_ladder)
+
+
+class AmazonProductDelivery(_Model):
+    date = _model("date", "Date")
+    type = _field("type")
+
+
+class Date(_Model):
+    by = _field("by")
+    from_date = _field("from")
+
+
+class AmazonProductSalesRank(_Model):
+    rank = _field("rank")
+    ladder = _field("ladder", [], convert=_ladder)
+
+
+class ProductDetails(_Model):
+    asin = _field("asin")
+    batteries = _field("batteries")
+    item_weight = _field("item_weight")
+    manufacturer = _field("manufacturer")
+    customer_reviews = _field("customer_reviews")
+    best_sellers_rank = _field("best_sellers_rank")
+    country_of_origin = _field("country_of_origin")
+    item_model_number = _field("item_model_number")
+    product_dimensions = _field("product_dimensions")
+    date_first_available = _field("date_first_available")
+    is_discontinued_by_manufacturer = _field("is_discontinued_by_manufacturer")
+
+
+class AmazonRefurbishedProduct(_Model):
+    link = _model("link", "Link")
+    condition_title = _field("condition_title")
+
+
+class Link(_Model):
+    url = _field("url")
+    title = _field("title")
+
+
+class AmazonRatingStarDistribution(_Model):
+    rating = _field("rating")
+    percentage = _field("percentage")
+
+
+class AmazonReviews(_Model):
+    id = _field("id")
+    title = _field("title")
+    author = _field("author")
+    rating = _field("rating")
+    content = _field("content")
+    timestamp = _field("timestamp")
+    is_verified = _field("is_verified")
+    product_attributes = _field("product_attributes")
+
+
+class AmazonQuestions(_Model):
+    title = _field("title")
+    votes = _field("votes")
+    answers = _models("answers", "Answer")
+
+
+class Answer(_Model):
+    author = _field("author")
+    content = _field("content")
+    timestamp = _field("timestamp")
+
+
+class RecentFeedback(_Model):
+    feedback = _field("feedback")
+    rated_by = _field("rated_by")
+    rating_stars = _field("rating_stars")
+
 
+class FeedbackSummaryTable(_Model):
+    counts = _model("counts", "Counts")
+    neutral = _model("neutral", "Counts")
+    negative = _model("negative", "Counts")
+    positive = _model("positive", "Counts")
 
-class RelatedItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.currency = data.get("currency")
-        self.reviews_count = data.get("reviews_count")
 
+class Counts(_Model):
+    thirty_days = _field("30_days")
+    ninety_days = _field("90_days")
+    all_time = _field("all_time")
+    twelve_months = _field("12_months")
 
-class Specifications:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [
-            SpecificationItem(item) for item in data.get("items", [])
-        ]
-        self.section_title = data.get("section_title")
 
+class Job(_Model):
+    callback_url = _field("callback_url")
+    client_id = _field("client_id")
+    context = _models("context", "Context")
+    created_at = _field("created_at")
+    domain = _field("domain")
+    geo_location = _field("geo_location")
+    id = _field("id")
+    limit = _field("limit")
+    locale = _field("locale")
+    pages = _field("pages")
+    parse = _field("parse")
+    parser_type = _field("parser_type")
+    parsing_instructions = _field("parsing_instructions")
+    browser_instructions = _field("browser_instructions")
+    render = _field("render")
+    url = _field("url")
+    query = _field("query")
+    source = _field("source")
+    start_page = _field("start_page")
+    status = _field("status")
+    storage_type = _field("storage_type")
+    storage_url = _field("storage_url")
+    subdomain = _field("subdomain")
+    content_encoding = _field("content_encoding")
+    updated_at = _field("updated_at")
+    user_agent_type = _field("user_agent_type")
+    session_info = _field("session_info")
+    statuses = _field("statuses")
+    client_notes = _field("client_notes")
+    links = _models("_links", "JobLink")
 
-class SpecificationItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.title = data.get("title")
-        self.value = data.get("value")
 
+class Context(_Model):
+    key = _field("key")
+    value = _field("value")
 
-class Pricing:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.price = data.get("price")
-        self.seller = data.get("seller")
-        self.details = data.get("details")
-        self.currency = data.get("currency")
-        self.condition = data.get("condition")
-        self.price_tax = data.get("price_tax")
-        self.price_total = data.get("price_total")
-        self.seller_link = data.get("seller_link")
-        self.price_shipping = data.get("price_shipping")
-        self.delivery = data.get("delivery")
-        self.seller_id = data.get("seller_id")
-        self.rating_count = data.get("rating_count")
-        self.delivery_options = data.get("delivery_options")
-
-
-class SuggestedAmazonSearch:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.currency = data.get("currency")
-        self.url_image = data.get("url_image")
-        self.best_seller = data.get("best_seller")
-        self.price_upper = data.get("price_upper")
-        self.is_sponsored = data.get("is_sponsored")
-        self.manufacturer = data.get("manufacturer")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.is_amazons_choice = data.get("is_amazons_choice")
-        self.pos = data.get("pos")
-        self.shipping_information = data.get("shipping_information")
-        self.sales_volume = data.get("sales_volume")
-        self.no_price_reason = data.get("no_price_reason")
-        self.suggested_query = data.get("suggested_query")
-
-
-class AmazonChoices:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.currency = data.get("currency")
-        self.url_image = data.get("url_image")
-        self.best_seller = data.get("best_seller")
-        self.price_upper = data.get("price_upper")
-        self.is_sponsored = data.get("is_sponsored")
-        self.manufacturer = data.get("manufacturer")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.is_amazons_choice = data.get("is_amazons_choice")
-        self.pos = data.get("pos")
-        self.is_prime = data.get("is_prime")
-        self.shipping_information = data.get("shipping_information")
-        self.sales_volume = data.get("sales_volume")
-        self.no_price_reason = data.get("no_price_reason")
-        self.variations = [
-            Variations(item) for item in data.get("variations", [])
-        ]
-
-
-class InstantRecommendations:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.asin = data.get("asin")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.currency = data.get("currency")
-        self.url_image = data.get("url_image")
-        self.best_seller = data.get("best_seller")
-        self.price_upper = data.get("price_upper")
-        self.is_sponsored = data.get("is_sponsored")
-        self.manufacturer = data.get("manufacturer")
-        self.pricing_count = data.get("pricing_count")
-        self.reviews_count = data.get("reviews_count")
-        self.is_amazons_choice = data.get("is_amazons_choice")
-        self.pos = data.get("pos")
-        self.sales_volume = data.get("sales_volume")
-        self.no_price_reason = data.get("no_price_reason")
-
-
-class AmazonProductAds:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.asin = data.get("asin")
-        self.type = data.get("type")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.images = data.get("images", [])
-        self.rating = data.get("rating")
-        self.location = data.get("location")
-        self.price_upper = data.get("price_upper")
-        self.reviews_count = data.get("reviews_count")
-        self.is_prime_eligible = data.get("is_prime_eligible")
-
-
-class AmazonProductCategory:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.ladder = [
-            {"url": item.get("url"), "name": item.get("name")}
-            for item in data.get("ladder", [])
-        ]
 
+class JobLink(_Model):
+    rel = _field("rel")
+    href = _field("href")
+    method = _field("method")
 
-class AmazonProductDelivery:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.date = Date(data.get("date", {}))
-        self.type = data.get("type")
 
+class Pla(_Model):
+    items = _models("items", "PlaItem")
+    pos_overall = _field("pos_overall")
 
-class Date:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.by = data.get("by")
-        self.from_date = data.get("from")
 
+class PlaItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    price = _field("price")
+    title = _field("title")
+    seller = _field("seller")
+    url_image = _field("url_image")
+    image_data = _field("image_data")
 
-class AmazonProductSalesRank:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.rank = data.get("rank")
-        self.ladder = [
-            {"url": item.get("url"), "name": item.get("name")}
-            for item in data.get("ladder", [])
-        ]
 
+class Image(_Model):
+    items = _models("items", "ImageItem")
+    pos_overall = _field("pos_overall")
 
-class ProductDetails:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.asin = data.get("asin")
-        self.batteries = data.get("batteries")
-        self.item_weight = data.get("item_weight")
-        self.manufacturer = data.get("manufacturer")
-        self.customer_reviews = data.get("customer_reviews")
-        self.best_sellers_rank = data.get("best_sellers_rank")
-        self.country_of_origin = data.get("country_of_origin")
-        self.item_model_number = data.get("item_model_number")
-        self.product_dimensions = data.get("product_dimensions")
-        self.date_first_available = data.get("date_first_available")
-        self.is_discontinued_by_manufacturer = data.get(
-            "is_discontinued_by_manufacturer"
-        )
-
-
-class AmazonRefurbishedProduct:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.link = Link(data.get("link", {}))
-        self.condition_title = data.get("condition_title")
 
+class ImageItem(_Model):
+    alt = _field("alt")
+    pos = _field("pos")
+    url = _field("url")
+    data = _field("data")
+    source = _field("source")
 
-class Link:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
 
+class OrganicSitelinks(_Model):
+    expanded = _models("expanded", "Expanded")
+    inline = _models("inline", "Inline")
 
-class AmazonRatingStarDistribution:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.rating = data.get("rating")
-        self.percentage = data.get("percentage")
 
+class Twitter(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    items = _models("items", "TwitterItem")
+    title = _field("title")
+    pos_overall = _field("pos_overall")
 
-class AmazonReviews:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.id = data.get("id")
-        self.title = data.get("title")
-        self.author = data.get("author")
-        self.rating = data.get("rating")
-        self.content = data.get("content")
-        self.timestamp = data.get("timestamp")
-        self.is_verified = data.get("is_verified")
-        self.product_attributes = data.get("product_attributes")
 
+class TwitterItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    content = _field("content")
+    time_frame = _field("time_frame")
 
-class AmazonQuestions:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.title = data.get("title")
-        self.votes = data.get("votes")
-        self.answers = [Answer(item) for item in data.get("answers", [])]
 
+class Knowledge(_Model):
+    title = _field("title")
+    images = _field("images", [], convert=list)
+    factoids = _models("factoids", "Factoid")
+    profiles = _models("profiles", "Profile")
+    subtitle = _field("subtitle")
+    description = _field("description")
+    related_searches = _models("related_searches", "RelatedSearches")
 
-class Answer:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.author = data.get("author")
-        self.content = data.get("content")
-        self.timestamp = data.get("timestamp")
 
+class Factoid(_Model):
+    links = _models("links", "LinkElement")
+    title = _field("title")
+    content = _field("content")
 
-class RecentFeedback:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.feedback = data.get("feedback")
-        self.rated_by = data.get("rated_by")
-        self.rating_stars = data.get("rating_stars")
 
+class LinkElement(_Model):
+    href = _field("href")
+    title = _field("title")
 
-class FeedbackSummaryTable:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.counts = Counts(data.get("counts", {}))
-        self.neutral = Counts(data.get("neutral", {}))
-        self.negative = Counts(data.get("negative", {}))
-        self.positive = Counts(data.get("positive", {}))
 
+class Profile(_Model):
+    url = _field("url")
+    title = _field("title")
 
-class Counts:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.thirty_days = data.get("30_days")
-        self.ninety_days = data.get("90_days")
-        self.all_time = data.get("all_time")
-        self.twelve_months = data.get("12_months")
 
+class RelatedSearches(_Model):
+    url = _field("url")
+    title = _field("title")
+    section_title = _field("section_title")
+    pos_overall = _field("pos_overall")
+    related_searches = _field("related_searches", [], convert=list)
 
-class Job:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.callback_url = data.get("callback_url")
-        self.client_id = data.get("client_id")
-        self.context = [Context(item) for item in data.get("context", [])]
-        self.created_at = data.get("created_at")
-        self.domain = data.get("domain")
-        self.geo_location = data.get("geo_location")
-        self.id = data.get("id")
-        self.limit = data.get("limit")
-        self.locale = data.get("locale")
-        self.pages = data.get("pages")
-        self.parse = data.get("parse")
-        self.parser_type = data.get("parser_type")
-        self.parsing_instructions = data.get("parsing_instructions")
-        self.browser_instructions = data.get("browser_instructions")
-        self.render = data.get("render")
-        self.url = data.get("url")
-        self.query = data.get("query")
-        self.source = data.get("source")
-        self.start_page = data.get("start_page")
-        self.status = data.get("status")
-        self.storage_type = data.get("storage_type")
-        self.storage_url = data.get("storage_url")
-        self.subdomain = data.get("subdomain")
-        self.content_encoding = data.get("content_encoding")
-        self.updated_at = data.get("updated_at")
-        self.user_agent_type = data.get("user_agent_type")
-        self.session_info = data.get("session_info")
-        self.statuses = data.get("statuses")
-        self.client_notes = data.get("client_notes")
-        self.links = [JobLink(item) for item in data.get("_links", [])]
-
-
-class Context:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.key = data.get("key")
-        self.value = data.get("value")
 
+class LocalPack(_Model):
+    items = _models("items", "LocalPackItem")
+    pos_overall = _field("pos_overall")
 
-class JobLink:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.rel = data.get("rel")
-        self.href = data.get("href")
-        self.method = data.get("method")
 
-class Pla:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [PlaItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
+class LocalPackItem(_Model):
+    cid = _field("cid")
+    pos = _field("pos")
+    links = _models("links", "LocalPackLink")
+    phone = _field("phone")
+    title = _field("title")
+    rating = _field("rating")
+    address = _field("address")
+    subtitle = _field("subtitle")
+    rating_count = _field("rating_count")
 
-class PlaItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.seller = data.get("seller")
-        self.url_image = data.get("url_image")
-        self.image_data = data.get("image_data")
-
-class Image:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.items = [ImageItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
-
-
-class ImageItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.alt = data.get("alt")
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.data = data.get("data")
-        self.source = data.get("source")
-
-
-class OrganicSitelinks:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.expanded = [Expanded(item) for item in data.get("expanded", [])]
-        self.inline = [Inline(item) for item in data.get("inline", [])]
 
+class LocalPackLink(_Model):
+    href = _field("href")
+    title = _field("title")
 
-class Twitter:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.items = [TwitterItem(item) for item in data.get("items", [])]
-        self.title = data.get("title")
-        self.pos_overall = data.get("pos_overall")
 
+class TopStory(_Model):
+    items = _models("items", "TopStoryItem")
+    pos_overall = _field("pos_overall")
 
-class TwitterItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.content = data.get("content")
-        self.time_frame = data.get("time_frame")
 
+class TopStoryItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    title = _field("title")
+    source = _field("source")
+    time_frame = _field("time_frame")
 
-class Knowledge:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.title = data.get("title")
-        self.images = [item for item in data.get("images", [])]
-        self.factoids = [Factoid(item) for item in data.get("factoids", [])]
-        self.profiles = [Profile(item) for item in data.get("profiles", [])]
-        self.subtitle = data.get("subtitle")
-        self.description = data.get("description")
-        self.related_searches = [
-            RelatedSearches(item) for item in data.get("related_searches", [])
-        ]
-
-
-class Factoid:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.links = [LinkElement(item) for item in data.get("links", [])]
-        self.title = data.get("title")
-        self.content = data.get("content")
 
+class PopularProducts(_Model):
+    pos = _field("pos")
+    price = _field("price")
+    rating = _field("rating")
+    seller = _field("seller")
+    title = _field("title")
+    image_data = _field("image_data")
 
-class LinkElement:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.href = data.get("href")
-        self.title = data.get("title")
 
+class RelatedQuestions(_Model):
+    pos_overall = _field("pos_overall")
+    related_questions = _models("related_questions", "RelatedQuestionsItem")
 
-class Profile:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
 
+class RelatedQuestionsItem(_Model):
+    pos = _field("pos")
+    answer = _field("answer")
+    source = _field("source")
+    question = _field("question")
 
-class RelatedSearches:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.section_title = data.get("section_title")
-        self.pos_overall = data.get("pos_overall")
-        self.related_searches = [
-            item for item in data.get("related_searches", [])
-        ]
 
+class Source(_Model):
+    url = _field("url")
+    title = _field("title")
+    url_shown = _field("url_shown")
 
-class LocalPack:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [LocalPackItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
-
-
-class LocalPackItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.cid = data.get("cid")
-        self.pos = data.get("pos")
-        self.links = [LocalPackLink(item) for item in data.get("links", [])]
-        self.phone = data.get("phone")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.address = data.get("address")
-        self.subtitle = data.get("subtitle")
-        self.rating_count = data.get("rating_count")
-
-
-class LocalPackLink:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.href = data.get("href")
-        self.title = data.get("title")
-
-
-class TopStory:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [TopStoryItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
-
-
-class TopStoryItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.source = data.get("source")
-        self.time_frame = data.get("time_frame")
-
-
-class PopularProducts:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.price = data.get("price")
-        self.rating = data.get("rating")
-        self.seller = data.get("seller")
-        self.title = data.get("title")
-        self.image_data = data.get("image_data")
-
-class RelatedQuestions:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos_overall = data.get("pos_overall")
-        self.related_questions = [
-            RelatedQuestionsItem(item)
-            for item in data.get("related_questions", [])
-        ]
-
-
-class RelatedQuestionsItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.answer = data.get("answer")
-        self.source = data.get("source")
-        self.question = data.get("question")
-
-
-class Source:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.url_shown = data.get("url_shown")
 
-class SearchInformationImage:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.width = data.get("width")
-        self.height = data.get("height")
-        self.other_sizes = data.get("other_sizes")
+class SearchInformationImage(_Model):
+    url = _field("url")
+    width = _field("width")
+    height = _field("height")
+    other_sizes = _field("other_sizes")
 
 
-class ItemCarousel:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [ItemCarouselItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
-        self.title = data.get("title")
+class ItemCarousel(_Model):
+    items = _models("items", "ItemCarouselItem")
+    pos_overall = _field("pos_overall")
+    title = _field("title")
 
 
-class ItemCarouselItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.href = data.get("href")
-        self.title = data.get("title")
-        self.subtitle = data.get("subtitle")
+class ItemCarouselItem(_Model):
+    pos = _field("pos")
+    href = _field("href")
+    title = _field("title")
+    subtitle = _field("subtitle")
 
 
-class Recipes:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [RecipesItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
+class Recipes(_Model):
+    items = _models("items", "RecipesItem")
+    pos_overall = _field("pos_overall")
 
 
-class RecipesItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.source = data.get("source")
-        self.duration = data.get("duration")
+class RecipesItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    title = _field("title")
+    rating = _field("rating")
+    source = _field("source")
+    duration = _field("duration")
 
 
-class Videos:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [VideosItem(item) for item in data.get("items", [])]
-        self.pos_overall = data.get("pos_overall")
+class Videos(_Model):
+    items = _models("items", "VideosItem")
+    pos_overall = _field("pos_overall")
 
 
-class VideosItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.author = data.get("author")
-        self.source = data.get("source")
+class VideosItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    title = _field("title")
+    author = _field("author")
+    source = _field("source")
 
 
-class FeaturedSnippet:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.desc = data.get("desc")
-        self.title = data.get("title")
-        self.url_shown = data.get("url_shown")
-        self.pos_overall = data.get("pos_overall")
+class FeaturedSnippet(_Model):
+    url = _field("url")
+    desc = _field("desc")
+    title = _field("title")
+    url_shown = _field("url_shown")
+    pos_overall = _field("pos_overall")
 
 
-class RelatedSearchesCategorized:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.items = [
-            RelatedSearchesCategorizedItem(item)
-            for item in data.get("items", [])
-        ]
-        self.category = data.get("category")
-        self.pos_overall = data.get("pos_overall")
+class RelatedSearchesCategorized(_Model):
+    items = _models("items", "RelatedSearchesCategorizedItem")
+    category = _field("category")
+    pos_overall = _field("pos_overall")
 
 
-class RelatedSearchesCategorizedItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
+class RelatedSearchesCategorizedItem(_Model):
+    url = _field("url")
+    title = _field("title")
 
 
-class Category:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.name = data.get("name")
-        self.type = data.get("type")
+class Category(_Model):
+    name = _field("name")
+    type = _field("type")
 
 
-class Hotels:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.date_to = data.get("date_to")
-        self.results = [HotelsResult(item) for item in data.get("results", [])]
-        self.date_from = data.get("date_from")
-        self.pos_overall = data.get("pos_overall")
+class Hotels(_Model):
+    date_to = _field("date_to")
+    results = _models("results", "HotelsResult")
+    date_from = _field("date_from")
+    pos_overall = _field("pos_overall")
 
 
-class HotelsResult:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.price = data.get("price")
-        self.title = data.get("title")
-        self.from_location = data.get("from")
+class HotelsResult(_Model):
+    price = _field("price")
+    title = _field("title")
+    from_location = _field("from")
 
 
-class Flights:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.to = data.get("to")
-        self.from_location = data.get("from")
-        self.results = [
-            FlightsResult(item) for item in data.get("results", [])
-        ]
-        self.date_from = data.get("date_from")
-        self.pos_overall = data.get("pos_overall")
+class Flights(_Model):
+    to = _field("to")
+    from_location = _field("from")
+    results = _models("results", "FlightsResult")
+    date_from = _field("date_from")
+    pos_overall = _field("pos_overall")
 
 
-class FlightsResult:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.type = data.get("type")
-        self.price = data.get("price")
-        self.airline = data.get("airline")
-        self.duration = data.get("duration")
+class FlightsResult(_Model):
+    url = _field("url")
+    type = _field("type")
+    price = _field("price")
+    airline = _field("airline")
+    duration = _field("duration")
 
 
-class VideoBox:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.pos_overall = data.get("pos_overall")
+class VideoBox(_Model):
+    url = _field("url")
+    title = _field("title")
+    pos_overall = _field("pos_overall")
 
 
-class LocalServiceAds:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos_overall = data.get("pos_overall")
-        self.items = [
-            LocalServiceAdsItem(item) for item in data.get("items", [])
-        ]
+class LocalServiceAds(_Model):
+    pos_overall = _field("pos_overall")
+    items = _models("items", "LocalServiceAdsItem")
 
 
-class LocalServiceAdsItem:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.pos = data.get("pos")
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.rating = data.get("rating")
-        self.reviews_count = data.get("reviews_count")
-        self.google_guaranteed = data.get("google_guaranteed")
+class LocalServiceAdsItem(_Model):
+    pos = _field("pos")
+    url = _field("url")
+    title = _field("title")
+    rating = _field("rating")
+    reviews_count = _field("reviews_count")
+    google_guaranteed = _field("google_guaranteed")
 
 
-class Navigation:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.url = data.get("url")
-        self.title = data.get("title")
-        self.pos = data.get("pos")
+class Navigation(_Model):
+    url = _field("url")
+    title = _field("title")
+    pos = _field("pos")
 
 
-class InstantAnswers:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.type = data.get("type")
-        self.parsed = data.get("_parsed")
-        self.pos_overall = data.get("pos_overall")
+class InstantAnswers(_Model):
+    type = _field("type")
+    parsed = _field("_parsed")
+    pos_overall = _field("pos_overall")
 
 
-class VisuallySimilarImages:
-    def __init__(self, data):
-        if data is None:
-            data = {}
-        self.raw = data
-        self.all_images_url = data.get("all_images_url")
-        self.featured_images = data.get("featured_images")
+class VisuallySimilarImages(_Model):
+    all_images_url = _field("all_images_url")
+    featured_images = _field("featured_images")
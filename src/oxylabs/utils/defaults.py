@@ -1,5 +1,6 @@
 SYNC_BASE_URL = "https://realtime.oxylabs.io/v1/queries"
 ASYNC_BASE_URL = "https://data.oxylabs.io/v1/queries"
+BATCH_QUERY_LIMIT = 5000
 
 PROXY_BASE_URL = "realtime.oxylabs.io"
 PROXY_PORT = 60000
@@ -10,3 +11,14 @@ DEFAULT_REQUEST_TIMEOUT = 165
 DEFAULT_POLL_INTERVAL = 5
 DEFAULT_REQUEST_TIMEOUT_ASYNC = 105
 DEFAULT_JOB_COMPLETION_TIMEOUT = 50
+DEFAULT_POLLER_THRESHOLD = 10
+DEFAULT_POLLER_CONCURRENCY = 50
+DEFAULT_CALLBACK_TIMEOUT = 30
+# How long the results of a Push-Pull job are kept by Oxylabs
+DEFAULT_JOB_RETENTION = 24 * 60 * 60
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 0
+
+STREAM_CHUNK_SIZE = 64 * 1024
@@ -1,8 +1,8 @@
-from typing import Any, List
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, List, Optional
 from urllib.parse import urlparse
 
-import aiohttp
-
 from .defaults import (
     DEFAULT_JOB_COMPLETION_TIMEOUT,
     DEFAULT_POLL_INTERVAL,
@@ -11,6 +11,9 @@ from .defaults import (
 )
 from .types import fn_name
 
+if TYPE_CHECKING:
+    import aiohttp
+
 
 def get_valid_values(module: object) -> list:
     """
@@ -72,6 +75,26 @@ def prepare_config(**kwargs):
     return config
 
 
+def get_payload_key(payload: dict) -> str:
+    """
+    Returns a stable key identifying the given payload.
+
+    Null values are ignored and the key does not depend on the order of the
+    payload keys.
+
+    Args:
+        payload (dict): The payload of a request.
+
+    Returns:
+        str: The SHA-256 hex digest of the canonical JSON of the payload.
+    """
+    payload = {k: v for k, v in payload.items() if v is not None}
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 def validate_url(input_url: str, host: str) -> None:
     """
     Validates if the given URL is valid and belongs to the specified host.
@@ -109,23 +132,54 @@ def validate_url(input_url: str, host: str) -> None:
     return None
 
 
-async def ensure_session(session) -> aiohttp.ClientSession:
+def import_aiohttp() -> Any:
+    """
+    Imports aiohttp, which is only required by AsyncClient.
+
+    Raises:
+        ImportError: If aiohttp is not installed.
+
+    Returns:
+        The aiohttp module.
+    """
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError(
+            "AsyncClient requires aiohttp. "
+            "Install it with `pip install oxylabs[async]`"
+        ) from e
+    return aiohttp
+
+
+async def ensure_session(
+    session, connector_options: Optional[dict] = None
+) -> "aiohttp.ClientSession":
     """
     Ensure the provided session is valid and return a valid session.
 
     Args:
         session: The session to ensure.
+        connector_options (Optional[dict]): Keyword arguments for the
+        aiohttp.TCPConnector used by a newly created session, e.g. `limit`,
+        `limit_per_host`, `ttl_dns_cache` or `keepalive_timeout`.
 
     Returns:
         A valid aiohttp.ClientSession object.
 
     """
     if session is None or session.closed:
-        session = aiohttp.ClientSession()
+        aiohttp = import_aiohttp()
+        connector = (
+            aiohttp.TCPConnector(**connector_options)
+            if connector_options
+            else None
+        )
+        session = aiohttp.ClientSession(connector=connector)
     return session
 
 
-async def close_session(user_session: aiohttp.ClientSession) -> None:
+async def close_session(user_session: "aiohttp.ClientSession") -> None:
     """
     Closes the user session.
 
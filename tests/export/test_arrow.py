@@ -0,0 +1,135 @@
+import importlib.util
+import unittest
+
+from oxylabs.export import to_arrow, to_pandas
+from oxylabs.sources.response import Response
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+
+def make_response(source, organic):
+    return Response(
+        {
+            "results": [
+                {"content": {}, "content_parsed": {"results": {"organic": organic}}}
+            ],
+            "job": {"id": "1", "source": source},
+        }
+    )
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestArrowExport(unittest.TestCase):
+    """
+    Test case for building Arrow tables from parsed results.
+    """
+
+    def test_response_to_arrow(self):
+        """
+        Test that rows at the path become columns with types inferred from
+        every row.
+        """
+        response = make_response(
+            "google_search",
+            [
+                {"pos": 1, "url": "https://a.com", "title": "A"},
+                {"pos": 2, "url": "https://b.com", "rating": 4.5},
+            ],
+        )
+        table = response.to_arrow()
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(
+            table.column_names, ["pos", "url", "title", "rating"]
+        )
+        self.assertEqual(str(table.schema.field("pos").type), "int64")
+        self.assertEqual(table.column("rating").to_pylist(), [None, 4.5])
+
+    def test_batch_to_arrow(self):
+        """
+        Test that responses of different sources are typed separately and
+        unified into one table.
+        """
+        import pyarrow as pa
+
+        table = to_arrow(
+            [
+                make_response("google_search", [{"pos": 1, "price": None}]),
+                make_response("bing_search", [{"pos": 2, "price": 9.99}]),
+                make_response("bing_search", []),
+                Response({}),
+            ]
+        )
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field("price").type, pa.float64())
+
+        schema = pa.schema([("pos", pa.int32())])
+        table = to_arrow(
+            [make_response("bing_search", [{"pos": 1, "url": "x"}])],
+            schema=schema,
+        )
+        self.assertEqual(table.schema, schema)
+
+    def test_mixed_types(self):
+        """
+        Test that a column without a common type is converted to strings,
+        and that rows that do not match a given schema raise a ValueError.
+        """
+        import pyarrow as pa
+
+        response = make_response(
+            "amazon_search",
+            [{"price": 1}, {"price": "1.5"}, {"price": None}, {"price": [2]}],
+        )
+        table = response.to_arrow()
+        self.assertEqual(table.schema.field("price").type, pa.string())
+        self.assertEqual(
+            table.column("price").to_pylist(), ["1", "1.5", None, "[2]"]
+        )
+
+        schema = pa.schema([("price", pa.float64())])
+        with self.assertRaises(ValueError):
+            to_arrow(response, schema=schema)
+
+    def test_mixed_types_across_sources(self):
+        """
+        Test that a column with different types in different sources is
+        converted to strings, while other columns keep their types.
+        """
+        import pyarrow as pa
+
+        table = to_arrow(
+            [
+                make_response("google_search", [{"pos": 1, "rank": 1}]),
+                make_response("bing_search", [{"pos": "1", "rank": 2.5}]),
+                make_response("amazon_search", [{"pos": {"page": 1}}]),
+            ]
+        )
+        self.assertEqual(table.schema.field("pos").type, pa.string())
+        self.assertEqual(table.schema.field("rank").type, pa.float64())
+        self.assertEqual(
+            table.column("pos").to_pylist(), ["1", "1", '{"page": 1}']
+        )
+        self.assertEqual(table.column("rank").to_pylist(), [1.0, 2.5, None])
+
+    def test_other_paths(self):
+        """
+        Test that a path to an object gives a single row and that a
+        missing path gives an empty table.
+        """
+        response = Response(
+            {"results": [{"content": {"results": {"title": "Headset"}}}]}
+        )
+        self.assertEqual(
+            response.to_arrow("results").to_pylist(), [{"title": "Headset"}]
+        )
+        self.assertEqual(response.to_arrow("results.paid").num_rows, 0)
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_to_pandas(self):
+        """
+        Test that a DataFrame is built from the table.
+        """
+        frame = to_pandas(make_response(None, [{"pos": 1}, {"pos": 2}]))
+        self.assertEqual(list(frame["pos"]), [1, 2])
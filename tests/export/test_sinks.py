@@ -0,0 +1,272 @@
+import gzip
+import importlib.util
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.export import JSONLSink, ParquetSink, Sink, SQLiteSink
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.sources.response import Response
+from tests.internal.fake_api import FakePushPullAPI
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
+
+
+def make_response(index, rows=2):
+    return Response(
+        {
+            "results": [
+                {
+                    "content_parsed": {
+                        "results": {
+                            "organic": [
+                                {"pos": pos, "title": f"Result {index}"}
+                                for pos in range(rows)
+                            ]
+                        }
+                    }
+                }
+            ],
+            "job": {"id": str(index), "source": "google_search"},
+        }
+    )
+
+
+class TestSinks(unittest.TestCase):
+    """
+    Test case for the sinks writing responses on a writer thread.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_jsonl(self):
+        """
+        Test that each response is written as one line, also compressed.
+        """
+        for compression, open_file in [(None, open), ("gzip", gzip.open)]:
+            with self.subTest(compression=compression):
+                path = self.path(f"results-{compression}.jsonl")
+                with JSONLSink(path, compression=compression) as sink:
+                    for index in range(3):
+                        sink.write(make_response(index))
+                with open_file(path, "rt") as file:
+                    lines = [json.loads(line) for line in file]
+                self.assertEqual([l["job"]["id"] for l in lines], ["0", "1", "2"])
+
+        with self.assertRaises(ValueError):
+            JSONLSink(self.path("results.jsonl"), compression="lz4")
+
+    @unittest.skipUnless(HAS_ZSTANDARD, "zstandard is not installed")
+    def test_jsonl_zstd(self):
+        """
+        Test that zstd compressed lines are written.
+        """
+        import zstandard
+
+        path = self.path("results.jsonl.zst")
+        with JSONLSink(path, compression="zstd") as sink:
+            sink.write(make_response(0))
+        with zstandard.open(path, "rt") as file:
+            self.assertEqual(json.loads(file.readline())["job"]["id"], "0")
+
+    def test_sqlite(self):
+        """
+        Test that responses are stored with their job ID and source.
+        """
+        path = self.path("results.db")
+        with SQLiteSink(path) as sink:
+            sink.write(make_response(0))
+            sink.write(make_response(1).raw)
+        with sqlite3.connect(path) as connection:
+            rows = connection.execute(
+                "SELECT job_id, source, data FROM responses"
+            ).fetchall()
+        self.assertEqual([row[:2] for row in rows][1], ("1", "google_search"))
+        self.assertEqual(json.loads(rows[0][2]), make_response(0).raw)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet(self):
+        """
+        Test that rows are written in row groups of the given size.
+        """
+        import pyarrow.parquet as pq
+
+        path = self.path("results.parquet")
+        with ParquetSink(path, row_group_size=4) as sink:
+            for index in range(5):
+                sink.write(make_response(index))
+
+        file = pq.ParquetFile(path)
+        self.assertEqual(file.metadata.num_rows, 10)
+        self.assertEqual(file.metadata.num_row_groups, 3)
+        self.assertEqual(file.schema_arrow.names, ["pos", "title"])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_null_column(self):
+        """
+        Test that row groups are held back while a column only has null
+        values, and that a column without values is eventually left out.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def response(rows):
+            return {
+                "results": [
+                    {"content_parsed": {"results": {"organic": rows}}}
+                ]
+            }
+
+        path = self.path("ratings.parquet")
+        with ParquetSink(path, row_group_size=2) as sink:
+            sink.write(response([{"pos": 1, "rating": None}] * 2))
+            sink.write(response([{"pos": 2, "rating": 4.5}] * 2))
+
+        file = pq.ParquetFile(path)
+        self.assertEqual(file.metadata.num_row_groups, 2)
+        self.assertEqual(file.schema_arrow.field("rating").type, pa.float64())
+        self.assertEqual(
+            file.read().column("rating").to_pylist(), [None, None, 4.5, 4.5]
+        )
+
+        path = self.path("missing.parquet")
+        with ParquetSink(path, row_group_size=1) as sink:
+            for _ in range(11):
+                sink.write(response([{"pos": 1, "rating": None}]))
+            sink.write(response([{"pos": 2, "rating": 4.5}]))
+
+        file = pq.ParquetFile(path)
+        self.assertEqual(file.metadata.num_rows, 12)
+        self.assertEqual(file.schema_arrow.names, ["pos"])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_mismatched_row_group(self):
+        """
+        Test that later rows are converted to the inferred schema, and that
+        the file is readable after rows failed to match a given schema.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def response(rows):
+            return {
+                "results": [
+                    {"content_parsed": {"results": {"organic": rows}}}
+                ]
+            }
+
+        path = self.path("inferred.parquet")
+        with ParquetSink(path, row_group_size=1) as sink:
+            for pos in [1, "2", "third", 4.0]:
+                sink.write(response([{"pos": pos}]))
+
+        table = pq.read_table(path)
+        self.assertEqual(table.schema.field("pos").type, pa.int64())
+        self.assertEqual(table.column("pos").to_pylist(), [1, 2, None, 4])
+
+        path = self.path("given.parquet")
+        schema = pa.schema([("pos", pa.int64())])
+        sink = ParquetSink(path, schema=schema, row_group_size=1)
+        sink.write(response([{"pos": 1}]))
+        sink.write(response([{"pos": {"page": 2}}]))
+        with self.assertRaises(ValueError):
+            sink.close()
+
+        self.assertEqual(pq.read_table(path).column("pos").to_pylist(), [1])
+
+    def test_writer_error(self):
+        """
+        Test that an error of the writer thread is raised to the caller
+        and that writing to a closed sink fails.
+        """
+
+        class FailingSink(Sink):
+            def _write(self, raw):
+                raise OSError("Disk full")
+
+        sink = FailingSink(queue_size=1)
+        sink.write(make_response(0))
+        with self.assertRaises(OSError):
+            sink.close()
+        with self.assertRaises(OSError):
+            sink.write(make_response(1))
+
+        sink = JSONLSink(self.path("closed.jsonl"))
+        sink.close()
+        with self.assertRaises(RuntimeError):
+            sink.write(make_response(0))
+
+    def test_written_off_thread(self):
+        """
+        Test that responses are written on the writer thread.
+        """
+        threads = []
+
+        class RecordingSink(Sink):
+            def _write(self, raw):
+                threads.append(threading.current_thread())
+
+        with RecordingSink() as sink:
+            sink.write(make_response(0))
+        self.assertNotEqual(threads, [threading.current_thread()])
+        self.assertEqual(len(threads), 1)
+
+    def test_realtime_batch(self):
+        """
+        Test that the responses of a batch are written to the sink.
+        """
+        client = RealtimeClient("user", "pass")
+        api = client.bing._api_instance
+        response = Mock(status_code=200)
+        response.content = json.dumps(make_response(0).raw).encode()
+        path = self.path("batch.jsonl")
+
+        with patch.object(api._get_session(), "post", return_value=response):
+            with JSONLSink(path) as sink:
+                client.batch(
+                    [(client.bing.scrape_search, (q,)) for q in "abc"],
+                    sink=sink,
+                )
+        with open(path) as file:
+            self.assertEqual(len(file.readlines()), 3)
+
+
+class TestAsyncSinks(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for writing streamed Push-Pull responses to sinks.
+    """
+
+    async def test_stream(self):
+        """
+        Test that responses of a stream are written as they complete.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stream.db")
+            async with FakePushPullAPI() as fake:
+                async with AsyncClient("user", "pass") as client:
+                    client._api._base_url = fake.base_url
+                    async with SQLiteSink(path) as sink:
+                        async for _ in client.stream(
+                            (
+                                client.bing.scrape_search(q, poll_interval=0.01)
+                                for q in ["a", "b", "c", "d"]
+                            ),
+                            concurrency=2,
+                            sink=sink,
+                        ):
+                            pass
+            with sqlite3.connect(path) as connection:
+                (count,) = connection.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()
+        self.assertEqual(count, 4)
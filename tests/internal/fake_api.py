@@ -0,0 +1,125 @@
+import asyncio
+import itertools
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+class FakePushPullAPI:
+    """
+    A local stand-in for the Push-Pull API used by the internal tests.
+
+    Jobs are reported as pending for `pending_polls` status checks and then
+    as done, or as faulted if their ID is in `faulted`. Jobs submitted with a `callback_url` are reported as done to it
+    after `callback_delay` seconds. Every request is recorded in `requests`
+    as a `(method, path, body)` tuple. Statuses queued in `errors` under
+    "submit", "status" or "results" are returned, with a `Retry-After: 0`
+    header, before requests of that kind succeed. Results hold the payload
+    of the job as content unless `content` is set.
+    """
+
+    def __init__(
+        self, pending_polls: int = 0, callback_delay: float = 0.01
+    ) -> None:
+        self.pending_polls = pending_polls
+        self.content = None
+        self.callback_delay = callback_delay
+        self._callbacks = set()
+        self.requests = []
+        self.errors = {"submit": [], "status": [], "results": []}
+        self.jobs = {}
+        self.faulted = set()
+        self._ids = itertools.count(1)
+        app = web.Application()
+        app.router.add_post("/v1/queries", self._submit)
+        app.router.add_post("/v1/queries/batch", self._submit_batch)
+        app.router.add_get("/v1/queries/{id}", self._status)
+        app.router.add_get("/v1/queries/{id}/results", self._results)
+        self.server = TestServer(app)
+
+    @property
+    def base_url(self) -> str:
+        return str(self.server.make_url("/v1/queries"))
+
+    async def __aenter__(self) -> "FakePushPullAPI":
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for task in list(self._callbacks):
+            task.cancel()
+        await self.server.close()
+
+    def _create_job(self, payload: dict) -> dict:
+        job_id = str(next(self._ids))
+        self.jobs[job_id] = {"payload": payload, "polls": 0}
+        if "callback_url" in payload:
+            task = asyncio.ensure_future(
+                self._send_callback(payload["callback_url"], job_id)
+            )
+            self._callbacks.add(task)
+            task.add_done_callback(self._callbacks.discard)
+        return {"id": job_id, "status": "pending", **payload}
+
+    async def _send_callback(self, url: str, job_id: str) -> None:
+        await asyncio.sleep(self.callback_delay)
+        async with aiohttp.ClientSession() as session:
+            await session.post(url, json={"id": job_id, "status": "done"})
+
+    def _error(self, kind: str):
+        if not self.errors[kind]:
+            return None
+        return web.json_response(
+            {"message": "Fake error"},
+            status=self.errors[kind].pop(0),
+            headers={"Retry-After": "0"},
+        )
+
+    async def _submit(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.requests.append(("POST", request.path, body))
+        error = self._error("submit")
+        if error is not None:
+            return error
+        return web.json_response(self._create_job(body))
+
+    async def _submit_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.requests.append(("POST", request.path, body))
+        field = "query" if "query" in body else "url"
+        shared = {k: v for k, v in body.items() if k != field}
+        queries = [
+            self._create_job({**shared, field: value})
+            for value in body[field]
+        ]
+        return web.json_response({"queries": queries})
+
+    async def _status(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path, None))
+        error = self._error("status")
+        if error is not None:
+            return error
+        job_id = request.match_info["id"]
+        job = self.jobs[job_id]
+        job["polls"] += 1
+        status = "done" if job["polls"] > self.pending_polls else "pending"
+        if job_id in self.faulted:
+            status = "faulted"
+        return web.json_response({"id": job_id, "status": status})
+
+    async def _results(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path, None))
+        error = self._error("results")
+        if error is not None:
+            return error
+        job_id = request.match_info["id"]
+        content = self.content
+        if content is None:
+            content = self.jobs[job_id]["payload"]
+        return web.json_response(
+            {
+                "results": [{"content": content, "job_id": job_id}],
+                "job": {"id": job_id, "status": "done"},
+            }
+        )
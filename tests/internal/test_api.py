@@ -0,0 +1,112 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+
+
+class TestRealtimeSessionPool(unittest.TestCase):
+    """
+    Test case for the pooled keep-alive session used by RealtimeAPI.
+    """
+
+    def test_session_is_reused(self):
+        """
+        Test that consecutive requests share a single session configured
+        with the requested pool size.
+        """
+        client = RealtimeClient("user", "pass", pool_maxsize=32)
+        api = client.bing._api_instance
+
+        session = api._get_session()
+        self.assertIs(session, api._get_session())
+        adapter = session.get_adapter("https://realtime.oxylabs.io")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertIn("Authorization", session.headers)
+
+    def test_requests_go_through_session(self):
+        """
+        Test that scrape calls are sent through the pooled session rather
+        than a new connection per request.
+        """
+        client = RealtimeClient("user", "pass")
+        api = client.bing._api_instance
+        mock_response = Mock(status_code=200)
+        mock_response.content = json.dumps({"mocked_response": "ok"}).encode()
+
+        with patch.object(
+            api._get_session(), "post", return_value=mock_response
+        ) as mock_post:
+            client.bing.scrape_search("nike")
+            client.bing.scrape_search("adidas")
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_context_manager_closes_session(self):
+        """
+        Test that leaving the client context closes the pooled session.
+        """
+        with RealtimeClient("user", "pass") as client:
+            api = client.bing._api_instance
+            session = api._get_session()
+
+        self.assertIsNone(api._session)
+        self.assertIsNot(session, api._get_session())
+
+    def test_keep_alive_disabled(self):
+        """
+        Test that disabling keep-alive asks the server to close connections.
+        """
+        client = RealtimeClient("user", "pass", keep_alive=False)
+        session = client.bing._api_instance._get_session()
+        self.assertEqual(session.headers["Connection"], "close")
+
+
+class TestAsyncSessionLifecycle(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the long-lived session owned by AsyncClient.
+    """
+
+    async def test_context_manager_keeps_session(self):
+        """
+        Test that a session opened by the client context is reused by every
+        request and closed on exit.
+        """
+        connector_options = {"limit": 50, "limit_per_host": 25}
+        async with AsyncClient(
+            "user", "pass", connector_options=connector_options
+        ) as client:
+            api = client.bing._api_instance
+            sessions = []
+
+            async def mock_execute(payload, config, user_session):
+                sessions.append(user_session)
+                return {"mocked_response": payload["query"]}
+
+            api._execute_with_timeout = mock_execute
+            await client.bing.scrape_search("nike")
+            await client.bing.scrape_search("adidas")
+
+            self.assertIs(sessions[0], sessions[1])
+            self.assertFalse(sessions[0].closed)
+            self.assertEqual(sessions[0].connector.limit, 50)
+            self.assertEqual(sessions[0].connector.limit_per_host, 25)
+
+        self.assertTrue(sessions[0].closed)
+        self.assertIsNone(api._session)
+
+    async def test_session_closed_without_context(self):
+        """
+        Test that without a client context the session is closed once no
+        request is in flight.
+        """
+        client = AsyncClient("user", "pass")
+        api = client.bing._api_instance
+
+        async def mock_execute(payload, config, user_session):
+            return {"mocked_response": "ok"}
+
+        api._execute_with_timeout = mock_execute
+        await client.bing.scrape_search("nike")
+
+        self.assertTrue(api._session.closed)
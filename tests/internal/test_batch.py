@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestRealtimeBatch(unittest.TestCase):
+    """
+    Test case for running source calls concurrently with
+    RealtimeClient.batch.
+    """
+
+    def setUp(self):
+        self.client = RealtimeClient("user", "pass")
+        self.api = self.client.bing._api_instance
+        self.active = 0
+        self.peak = 0
+        lock = threading.Lock()
+
+        def mock_http_response(payload, method, config):
+            with lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with lock:
+                self.active -= 1
+            if payload["query"] == "fail":
+                raise RuntimeError("boom")
+            return {"query": payload["query"]}
+
+        self.api._get_http_response = mock_http_response
+
+    def test_results_in_call_order(self):
+        """
+        Test that results are returned in call order, calls run
+        concurrently up to max_workers and errors are captured per call.
+        """
+        queries = ["a", "b", "fail", "c", "d"]
+        calls = [(self.client.bing.scrape_search, (q,)) for q in queries]
+
+        results = self.client.batch(calls, max_workers=3)
+
+        self.assertEqual([r.index for r in results], list(range(5)))
+        self.assertEqual(self.peak, 3)
+        self.assertEqual(results[0].response.raw, {"query": "a"})
+        self.assertFalse(results[2].ok)
+        self.assertIsInstance(results[2].error, RuntimeError)
+
+    def test_as_completed(self):
+        """
+        Test that as_completed yields every result.
+        """
+        calls = [
+            lambda q=q: self.client.bing.scrape_search(q) for q in "abcd"
+        ]
+
+        results = list(self.client.batch(calls, as_completed=True))
+
+        self.assertEqual(sorted(r.index for r in results), [0, 1, 2, 3])
+        self.assertTrue(all(r.ok for r in results))
+
+    def test_invalid_call(self):
+        """
+        Test that unsupported call specifications are reported as errors.
+        """
+        results = self.client.batch(["not callable"])
+        self.assertIsInstance(results[0].error, TypeError)
+
+
+class TestAsyncBatchSubmission(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for submitting jobs through the Push-Pull batch endpoint.
+    """
+
+    async def test_submit_batch_and_get_results(self):
+        """
+        Test that payloads sharing their parameters are submitted in one
+        batch request per chunk and that the returned job IDs can be used to
+        fetch the results.
+        """
+        payloads = [
+            {"source": "google_search", "query": "nike", "parse": True},
+            {"source": "universal", "url": "https://example.com"},
+            {"source": "google_search", "query": "adidas", "parse": True},
+            {"source": "google_search", "query": "puma", "parse": True},
+        ]
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                with patch("oxylabs.internal.api.BATCH_QUERY_LIMIT", 2):
+                    job_ids = await client.submit_batch(payloads)
+                results = await client.get_results(job_ids, poll_interval=0)
+
+        batches = [body for method, path, body in fake.requests
+                   if path.endswith("/batch")]
+        self.assertEqual(
+            batches,
+            [
+                {"source": "google_search", "parse": True,
+                 "query": ["nike", "adidas"]},
+                {"source": "google_search", "parse": True, "query": ["puma"]},
+                {"source": "universal", "url": ["https://example.com"]},
+            ],
+        )
+        self.assertEqual(len(set(job_ids)), 4)
+        for payload, result in zip(payloads, results):
+            self.assertEqual(result.results[0].content, payload)
+
+    async def test_submit_batch_requires_query_or_url(self):
+        """
+        Test that payloads without a query or url are rejected.
+        """
+        client = AsyncClient("user", "pass")
+        with self.assertRaises(ValueError):
+            await client.submit_batch([{"source": "amazon_product"}])
+
+    async def test_get_results_skips_missing_ids(self):
+        """
+        Test that None IDs of jobs that failed to submit get an empty
+        Response without any request.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                job_ids = await client.submit_batch(
+                    [{"source": "bing_search", "query": "nike"}]
+                )
+                results = await client.get_results(
+                    [None, job_ids[0], None], poll_interval=0
+                )
+
+        self.assertEqual([bool(r.raw) for r in results], [False, True, False])
+        self.assertFalse(any("None" in path for _, path, _ in fake.requests))
@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.cache import ResultCache
+from oxylabs.utils.types import source
+from tests.internal.fake_api import FakePushPullAPI
+
+RESPONSE = {"results": [{"content": "ok", "status_code": 200}]}
+
+
+class TestResultCache(unittest.TestCase):
+    """
+    Test case for the memory and disk tiers of ResultCache.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used response is evicted from memory.
+        """
+        cache = ResultCache(max_entries=2)
+        cache.set("a", RESPONSE)
+        cache.set("b", RESPONSE)
+        cache.get("a")
+        cache.set("c", RESPONSE)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), RESPONSE)
+        self.assertEqual(cache.stats(), {
+            "hits": 2, "disk_hits": 0, "misses": 1, "size": 2
+        })
+
+    def test_ttl_per_source(self):
+        """
+        Test that responses expire after the TTL of their source and that a
+        TTL of 0 disables caching.
+        """
+        cache = ResultCache(
+            ttl_per_source={source.GOOGLE_SEARCH: 0.01, source.BING_SEARCH: 0}
+        )
+        cache.set("google", RESPONSE, source.GOOGLE_SEARCH)
+        cache.set("bing", RESPONSE, source.BING_SEARCH)
+        cache.set("amazon", RESPONSE, source.AMAZON_PRODUCT)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("google", source.GOOGLE_SEARCH))
+        self.assertIsNone(cache.get("bing", source.BING_SEARCH))
+        self.assertEqual(cache.get("amazon", source.AMAZON_PRODUCT), RESPONSE)
+
+    def test_disk_tier(self):
+        """
+        Test that responses are persisted to disk and served by a new cache.
+        """
+        cache = ResultCache(path=self.path)
+        cache.set("a", RESPONSE)
+        cache.close()
+
+        cache = ResultCache(path=self.path)
+        self.assertEqual(cache.get("a"), RESPONSE)
+        self.assertEqual(cache.get("a"), RESPONSE)
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+        cache.close()
+
+    def test_realtime_client(self):
+        """
+        Test that a cached Realtime response is returned without a request
+        and that failed responses are not cached.
+        """
+        cache = ResultCache()
+        client = RealtimeClient("user", "pass", cache=cache)
+        api = client.bing._api_instance
+        ok = Mock(status_code=200)
+        ok.content = json.dumps(RESPONSE).encode()
+        failed = Mock(status_code=200)
+        failed.content = json.dumps({"results": [{"status_code": 404}]}).encode()
+
+        with patch.object(
+            api._get_session(), "post", side_effect=[ok, failed, failed]
+        ) as mock_post:
+            first = client.bing.scrape_search("nike", user_agent_type=None)
+            second = client.bing.scrape_search("nike")
+            client.bing.scrape_search("adidas")
+            client.bing.scrape_search("adidas")
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(first.raw, second.raw)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+
+class TestAsyncResultCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the result cache used by AsyncClient.
+    """
+
+    async def test_cache_hit_skips_job(self):
+        """
+        Test that a cached response is returned without submitting a job.
+        """
+        cache = ResultCache()
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass", cache=cache) as client:
+                client._api._base_url = fake.base_url
+                first = await client.bing.scrape_search(
+                    "nike", poll_interval=0.01
+                )
+                second = await client.bing.scrape_search(
+                    "nike", poll_interval=0.01
+                )
+
+        self.assertEqual(len(fake.jobs), 1)
+        self.assertEqual(first.raw, second.raw)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
@@ -0,0 +1,140 @@
+import asyncio
+import socket
+import unittest
+
+import aiohttp
+
+from oxylabs.internal import AsyncClient
+from tests.internal.fake_api import FakePushPullAPI
+
+
+def local_server(port=None):
+    """
+    Returns the arguments of a callback server on a free local port.
+    """
+    if port is None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+    return {
+        "host": "127.0.0.1",
+        "port": port,
+        "public_url": f"http://127.0.0.1:{port}/oxylabs/callback",
+    }
+
+
+class TestCallbackServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for resolving jobs through the embedded callback server.
+    """
+
+    async def test_jobs_resolved_by_callback(self):
+        """
+        Test that jobs are completed by callback notices without any status
+        polling and that the callback URL is set automatically.
+        """
+        async with FakePushPullAPI(pending_polls=1000) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                server = await client.start_callback_server(**local_server())
+                results = await asyncio.gather(
+                    *(client.bing.scrape_search(q) for q in ["a", "b", "c"])
+                )
+
+        self.assertFalse(server.running)
+        for query, result in zip("abc", results):
+            content = result.results[0].content
+            self.assertEqual(content["query"], query)
+            self.assertEqual(content["callback_url"], server.callback_url)
+        status_requests = [
+            path for method, path, _ in fake.requests
+            if method == "GET" and not path.endswith("/results")
+        ]
+        self.assertEqual(status_requests, [])
+
+    async def test_polling_fallback(self):
+        """
+        Test that jobs are polled once no notice arrives in time.
+        """
+        async with FakePushPullAPI(callback_delay=60) as fake:
+            async with AsyncClient(
+                "user", "pass", callback_timeout=0.05
+            ) as client:
+                client._api._base_url = fake.base_url
+                await client.start_callback_server(**local_server())
+                result = await client.bing.scrape_search("nike")
+
+        self.assertEqual(result.results[0].content["query"], "nike")
+        self.assertEqual(fake.jobs["1"]["polls"], 1)
+
+    async def test_user_callback_url_is_kept(self):
+        """
+        Test that a callback URL set by the caller is not replaced and that
+        such jobs are polled.
+        """
+        async with FakePushPullAPI(callback_delay=60) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                await client.start_callback_server(**local_server())
+                result = await client.bing.scrape_search(
+                    "nike", callback_url="https://example.com/hook"
+                )
+
+        self.assertEqual(
+            result.results[0].content["callback_url"],
+            "https://example.com/hook",
+        )
+        self.assertEqual(fake.jobs["1"]["polls"], 1)
+
+    async def test_unreachable_host_requires_public_url(self):
+        """
+        Test that a wildcard or loopback host without a public URL is
+        rejected instead of sending an unreachable callback URL.
+        """
+        client = AsyncClient("user", "pass")
+        for host in ["0.0.0.0", "::", "127.0.0.1", "localhost"]:
+            with self.subTest(host=host):
+                with self.assertRaises(ValueError):
+                    await client.start_callback_server(host)
+        self.assertIsNone(client._api._callback_server)
+
+    async def test_notices_require_token(self):
+        """
+        Test that notices without the secret token of the callback URL are
+        rejected and that the token is part of the callback URL.
+        """
+        async with AsyncClient("user", "pass") as client:
+            args = local_server()
+            server = await client.start_callback_server(**args)
+            self.assertTrue(server.callback_url.startswith(args["public_url"]))
+            self.assertNotEqual(server.callback_url, args["public_url"])
+            async with aiohttp.ClientSession() as session:
+                for url, expected in [
+                    (args["public_url"], 404),
+                    (args["public_url"] + "/guess", 403),
+                    (server.callback_url, 200),
+                ]:
+                    async with session.post(
+                        url, json={"id": "1", "status": "done"}
+                    ) as response:
+                        self.assertEqual(response.status, expected)
+
+    async def test_faulted_notice_is_confirmed(self):
+        """
+        Test that a faulted notice is confirmed with a status request, so
+        that a forged notice does not fail a healthy job.
+        """
+        async with FakePushPullAPI(callback_delay=60, pending_polls=0) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                server = await client.start_callback_server(**local_server())
+                handle = await client.submit(client.bing.scrape_search("nike"))
+                async with aiohttp.ClientSession() as session:
+                    await session.post(
+                        server.callback_url,
+                        json={"id": handle.id, "status": "faulted"},
+                    )
+                result = await handle.result()
+
+        self.assertEqual(result.results[0].content["query"], "nike")
+        self.assertEqual(fake.jobs[handle.id]["polls"], 1)
@@ -0,0 +1,100 @@
+import base64
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from oxylabs.internal.content import decode_into, get_decoded_size
+from oxylabs.internal.spill import SpilledContent
+from oxylabs.sources.response import Results
+from oxylabs.utils.defaults import STREAM_CHUNK_SIZE
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 1000
+
+
+class TestResultContent(unittest.TestCase):
+    """
+    Test case for decoding and saving base64 encoded result contents.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_content_bytes(self):
+        """
+        Test that base64 content of any padding is decoded, both from
+        memory and from a spilled file.
+        """
+        for data in [b"", b"a", b"ab", b"abc", PNG]:
+            encoded = base64.b64encode(data).decode()
+            self.assertEqual(get_decoded_size(encoded), len(data))
+            for content in [encoded, SpilledContent(encoded)]:
+                with self.subTest(size=len(data), content=type(content)):
+                    result = Results({"content": content})
+                    self.assertEqual(result.content_bytes(), data)
+
+    def test_wrapped_content(self):
+        """
+        Test that line-wrapped base64 content is decoded across chunks.
+        """
+        encoded = base64.encodebytes(PNG).decode()
+        for content in [encoded, SpilledContent(encoded)]:
+            with self.subTest(content=type(content)):
+                self.assertEqual(bytes(decode_into(content)), PNG)
+                result = Results({"content": content})
+                self.assertEqual(result.content_bytes(), PNG)
+
+    def test_text_content(self):
+        """
+        Test that text content is encoded with the given codec.
+        """
+        result = Results({"content": "<html>ü</html>"})
+        self.assertEqual(
+            result.content_bytes("utf-8"), "<html>ü</html>".encode()
+        )
+        with self.assertRaises(TypeError):
+            Results({"content": {"parsed": True}}).content_bytes()
+
+    def test_save_text_across_chunks(self):
+        """
+        Test that text is encoded correctly when characters of spilled
+        content cross a chunk boundary, and that a byte order mark is only
+        written once.
+        """
+        # The leading "a" shifts multi-byte characters across the boundary
+        path = os.path.join(self.directory.name, "page.html")
+        for encoding, text in [
+            ("latin-1", "a" + "ü" * STREAM_CHUNK_SIZE),
+            ("utf-8", "a" + "ü€" * STREAM_CHUNK_SIZE),
+            ("utf-16", "a" + "ü€" * STREAM_CHUNK_SIZE),
+        ]:
+            expected = text.encode(encoding)
+            for content in [text, SpilledContent(text)]:
+                with self.subTest(encoding=encoding, content=type(content)):
+                    result = Results({"content": content})
+                    written = result.save(path, encoding)
+                    self.assertEqual(written, len(expected))
+                    with open(path, "rb") as file:
+                        self.assertEqual(file.read(), expected)
+
+    def test_save(self):
+        """
+        Test that the decoded content is written to a file.
+        """
+        path = os.path.join(self.directory.name, "screenshot.png")
+        result = Results({"content": base64.b64encode(PNG).decode()})
+        self.assertEqual(result.save(path), len(PNG))
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), PNG)
+
+    def test_no_intermediate_copy(self):
+        """
+        Test that decoding allocates little more than the decoded size.
+        """
+        content = base64.b64encode(PNG * 4).decode()
+        tracemalloc.start()
+        decode_into(content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, len(PNG) * 4 * 1.2)
@@ -0,0 +1,71 @@
+import importlib.util
+import json
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.internal.decoder import get_decoder
+from tests.internal.fake_api import FakePushPullAPI
+
+BODY = json.dumps({"results": [{"content": "<html>ü</html>"}]}).encode()
+
+
+def installed(name):
+    return importlib.util.find_spec(name) is not None
+
+
+class TestJSONDecoder(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the selectable JSON backend used to decode responses.
+    """
+
+    def test_backends_decode_bytes(self):
+        """
+        Test that every installed backend decodes the same bytes.
+        """
+        for backend in ["orjson", "msgspec", "json", "auto"]:
+            if backend in ("orjson", "msgspec") and not installed(backend):
+                continue
+            with self.subTest(backend=backend):
+                self.assertEqual(get_decoder(backend)(BODY), json.loads(BODY))
+
+    def test_auto_prefers_fast_backend(self):
+        """
+        Test that the fastest installed backend is picked by default and
+        that a custom function is used as is.
+        """
+        if installed("orjson"):
+            import orjson
+
+            self.assertIs(get_decoder(), orjson.loads)
+        self.assertIs(get_decoder(json.loads), json.loads)
+
+    def test_unknown_backend(self):
+        """
+        Test that unknown and missing backends are reported.
+        """
+        with self.assertRaises(ValueError):
+            get_decoder("simplejson")
+        if not installed("msgspec"):
+            with self.assertRaises(ImportError):
+                get_decoder("msgspec")
+
+    async def test_async_client_uses_backend(self):
+        """
+        Test that Push-Pull responses are decoded with the chosen backend.
+        """
+        decoded = []
+
+        def decode(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass", json_decoder=decode) as client:
+                client._api._base_url = fake.base_url
+                result = await client.bing.scrape_search(
+                    "nike", poll_interval=0.01
+                )
+
+        self.assertEqual(result.results[0].content["query"], "nike")
+        self.assertTrue(all(isinstance(body, bytes) for body in decoded))
+        self.assertEqual(len(decoded), 3)
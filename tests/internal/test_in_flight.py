@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.internal.in_flight import InFlightLimiter
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestInFlightLimiter(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the bounded number of jobs in flight in AsyncAPI.
+    """
+
+    async def test_backpressure(self):
+        """
+        Test that requests beyond `max_in_flight` wait before submitting
+        their job and that the wait is reported.
+        """
+        async with FakePushPullAPI(pending_polls=3) as fake:
+            async with AsyncClient("user", "pass", max_in_flight=2) as client:
+                client._api._base_url = fake.base_url
+                tasks = [
+                    asyncio.ensure_future(
+                        client.bing.scrape_search(q, poll_interval=0.01)
+                    )
+                    for q in ["a", "b", "c", "d", "e"]
+                ]
+                while len(fake.jobs) < 2:
+                    await asyncio.sleep(0.001)
+                submitted = len(fake.jobs)
+                stats = client.in_flight_stats()["all"]
+                self.assertEqual(stats["in_flight"], 2)
+                self.assertEqual(stats["waiting"], 3)
+
+                results = await asyncio.gather(*tasks)
+
+        self.assertEqual(submitted, 2)
+        self.assertTrue(all(r.results for r in results))
+        stats = client.in_flight_stats()["all"]
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["waiting"], 0)
+        self.assertEqual(stats["max_waiting"], 3)
+        self.assertGreater(stats["max_wait"], 0)
+
+    async def test_submitted_jobs_are_exempt(self):
+        """
+        Test that jobs submitted with `submit` and `submit_batch` are not
+        held back by `max_in_flight`.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient(
+                "user",
+                "pass",
+                max_in_flight=1,
+                max_in_flight_per_source={"bing_search": 1},
+            ) as client:
+                client._api._base_url = fake.base_url
+                handles = [
+                    await client.submit(client.bing.scrape_search(q))
+                    for q in ["a", "b"]
+                ]
+                job_ids = await client.submit_batch(
+                    [{"source": "bing_search", "query": q} for q in "cd"]
+                )
+                self.assertEqual(len(fake.jobs), 4)
+                self.assertEqual(client.in_flight_stats()["all"]["in_flight"], 0)
+                responses = await asyncio.wait_for(
+                    client.get_results([h.id for h in handles] + job_ids), 5
+                )
+
+        self.assertTrue(all(r.results for r in responses))
+
+    async def test_per_source_limit(self):
+        """
+        Test that a source limit does not hold back other sources.
+        """
+        limiter = InFlightLimiter(per_source={"amazon": 1})
+        release = asyncio.Event()
+
+        async def hold(source):
+            async with limiter.slot(source):
+                await release.wait()
+
+        tasks = [
+            asyncio.ensure_future(hold(source))
+            for source in ["amazon", "amazon", "google", "google"]
+        ]
+        await asyncio.sleep(0)
+        stats = limiter.stats()
+        self.assertEqual(stats["amazon"]["in_flight"], 1)
+        self.assertEqual(stats["amazon"]["waiting"], 1)
+        self.assertEqual(stats["google"]["in_flight"], 2)
+        self.assertEqual(stats["all"]["in_flight"], 3)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(limiter.stats()["all"]["in_flight"], 0)
+
+    async def test_cancelled_waiter(self):
+        """
+        Test that cancelling a waiting request does not leak a slot.
+        """
+        limiter = InFlightLimiter(max_in_flight=1, per_source={"amazon": 1})
+        release = asyncio.Event()
+
+        async def hold(source):
+            async with limiter.slot(source):
+                await release.wait()
+
+        first = asyncio.ensure_future(hold("google"))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(hold("amazon"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await first
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        async with limiter.slot("amazon"):
+            self.assertEqual(limiter.stats()["amazon"]["in_flight"], 1)
+        self.assertEqual(limiter.stats()["all"]["waiting"], 0)
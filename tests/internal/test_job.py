@@ -0,0 +1,97 @@
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.internal.job import JobHandle
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestJobHandle(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for submitting jobs and collecting their results separately.
+    """
+
+    async def test_submit_and_collect(self):
+        """
+        Test that a source call can be submitted without waiting and its
+        result collected later through the handle.
+        """
+        async with FakePushPullAPI(pending_polls=1) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                handles = [
+                    await client.submit(
+                        client.bing.scrape_search(query, poll_interval=0.01)
+                    )
+                    for query in ["nike", "adidas"]
+                ]
+                self.assertEqual(
+                    [method for method, _, _ in fake.requests],
+                    ["POST", "POST"],
+                )
+
+                self.assertIsInstance(handles[0], JobHandle)
+                self.assertEqual(await handles[0].status(), "pending")
+                results = [await handle.result() for handle in handles]
+                self.assertTrue(await handles[1].wait())
+
+        self.assertEqual(results[0].results[0].content["query"], "nike")
+        self.assertEqual(results[1].results[0].content["query"], "adidas")
+
+    async def test_wait_after_timeout(self):
+        """
+        Test that a job that timed out is polled again by the next wait,
+        while a faulted job is not.
+        """
+        async with FakePushPullAPI(pending_polls=1000) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                handles = [
+                    await client.submit(
+                        client.bing.scrape_search(
+                            query, poll_interval=0.01, job_completion_timeout=0
+                        )
+                    )
+                    for query in ["nike", "adidas"]
+                ]
+                self.assertFalse(await handles[0].wait())
+                fake.pending_polls = 0
+                self.assertTrue(await handles[0].wait())
+                result = await handles[0].result()
+
+                fake.faulted.add(handles[1].id)
+                self.assertFalse(await handles[1].wait())
+                polls = fake.jobs[handles[1].id]["polls"]
+                self.assertFalse(await handles[1].wait())
+                self.assertEqual(fake.jobs[handles[1].id]["polls"], polls)
+
+        self.assertEqual(result.results[0].content["query"], "nike")
+
+    async def test_handle_from_job_id(self):
+        """
+        Test that a handle rebuilt from a stored job ID returns the result.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                handle = await client.submit(client.bing.scrape_search("puma"))
+                job_id = handle.id
+
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                result = await client.job(job_id, poll_interval=0).result()
+
+        self.assertEqual(result.results[0].content["query"], "puma")
+
+    async def test_submit_mode_is_scoped(self):
+        """
+        Test that calls outside of submit still wait for their result.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                await client.submit(client.bing.scrape_search("nike"))
+                result = await client.bing.scrape_search(
+                    "adidas", poll_interval=0
+                )
+
+        self.assertEqual(result.results[0].content["query"], "adidas")
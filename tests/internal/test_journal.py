@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.internal.journal import JobJournal
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestJobJournal(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for resuming unfinished jobs recorded in the job journal.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "jobs.db")
+
+    async def test_resume_unfinished_jobs(self):
+        """
+        Test that jobs submitted by one client are resumed by another client
+        using the same journal and marked done once collected.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass", journal=self.path) as client:
+                client._api._base_url = fake.base_url
+                for query in ["nike", "adidas"]:
+                    await client.submit(client.bing.scrape_search(query))
+
+            async with AsyncClient("user", "pass", journal=self.path) as client:
+                client._api._base_url = fake.base_url
+                handles = client.resume(poll_interval=0)
+                results = [await handle.result() for handle in handles]
+                self.assertEqual(client.resume(), [])
+
+        self.assertEqual([h.id for h in handles], ["1", "2"])
+        self.assertEqual(
+            [r.results[0].content["query"] for r in results],
+            ["nike", "adidas"],
+        )
+
+    async def test_pending_payload_is_not_resubmitted(self):
+        """
+        Test that a request whose payload matches an unfinished job reuses
+        that job instead of submitting a new one.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass", journal=self.path) as client:
+                client._api._base_url = fake.base_url
+                await client.submit(client.bing.scrape_search("nike"))
+
+            async with AsyncClient("user", "pass", journal=self.path) as client:
+                client._api._base_url = fake.base_url
+                job_ids = await client.submit_batch(
+                    [{"source": "bing_search", "query": "nike"},
+                     {"source": "bing_search", "query": "puma"}]
+                )
+                result = await client.bing.scrape_search(
+                    "nike", poll_interval=0
+                )
+
+        submissions = [p for m, p, _ in fake.requests if m == "POST"]
+        self.assertEqual(submissions, ["/v1/queries", "/v1/queries/batch"])
+        self.assertEqual(result.results[0].content["query"], "nike")
+        self.assertEqual(job_ids, ["1", "2"])
+        journal = JobJournal(self.path)
+        self.assertEqual([job["job_id"] for job in journal.pending()], ["2"])
+        journal.close()
+
+    async def test_faulted_jobs_are_not_reused(self):
+        """
+        Test that jobs whose status or results are rejected with a 4xx error
+        are marked faulted, so identical payloads create new jobs.
+        """
+        async with FakePushPullAPI() as fake:
+            fake.errors["results"] = [404] * 2
+            fake.errors["status"] = [404]
+            async with AsyncClient("user", "pass", journal=self.path) as client:
+                client._api._base_url = fake.base_url
+                results = [
+                    await client.bing.scrape_search("nike", poll_interval=0)
+                    for _ in range(3)
+                ]
+
+        submissions = [p for m, p, _ in fake.requests if m == "POST"]
+        self.assertEqual(len(submissions), 3)
+        self.assertEqual([bool(r.raw) for r in results], [False, False, True])
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+        self.assertEqual(journal.pending(), [])
+
+    async def test_timed_out_jobs_stay_pending(self):
+        """
+        Test that a job that timed out locally is kept pending, so that it
+        is resumed or reused instead of being submitted again.
+        """
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+        async with FakePushPullAPI(pending_polls=3) as fake:
+            async with AsyncClient("user", "pass", journal=journal) as client:
+                client._api._base_url = fake.base_url
+                handle = await client.submit(
+                    client.bing.scrape_search(
+                        "adidas", poll_interval=0.01, job_completion_timeout=0.01
+                    )
+                )
+                self.assertFalse(await handle.wait())
+                self.assertEqual(
+                    [job["job_id"] for job in journal.pending()], [handle.id]
+                )
+
+                response = await client.bing.scrape_search(
+                    "adidas", poll_interval=0.01, job_completion_timeout=0.01
+                )
+
+        submissions = [p for m, p, _ in fake.requests if m == "POST"]
+        self.assertEqual(len(submissions), 1)
+        self.assertTrue(response.results)
+        self.assertEqual(journal.pending(), [])
+
+    def test_jobs_past_retention_are_skipped(self):
+        """
+        Test that jobs older than the result retention are neither reused
+        nor resumed.
+        """
+        journal = JobJournal(":memory:", retention=0)
+        self.addCleanup(journal.close)
+        journal.record_submitted("key", "1", {"source": "bing_search"})
+        self.assertIsNone(journal.find_pending("key"))
+        self.assertEqual(journal.pending(), [])
+
+    def test_resume_requires_journal(self):
+        """
+        Test that resuming without a journal is rejected.
+        """
+        with self.assertRaises(ValueError):
+            AsyncClient("user", "pass").resume()
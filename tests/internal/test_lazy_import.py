@@ -0,0 +1,108 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import oxylabs
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.sources.amazon import Amazon, AmazonAsync
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    Test case for importing the clients and their sources on first use.
+    """
+
+    def test_import_loads_no_sources(self):
+        """
+        Test that importing the package and creating a client imports no
+        source until a source attribute is read.
+        """
+        output = run_python(
+            "import sys\n"
+            "from oxylabs import RealtimeClient\n"
+            "client = RealtimeClient('user', 'pass')\n"
+            "loaded = lambda: [m for m in sys.modules"
+            " if m.startswith('oxylabs.sources.')"
+            " and m != 'oxylabs.sources.response']\n"
+            "print(len(loaded()))\n"
+            "client.amazon\n"
+            "print(sorted(loaded()))\n"
+        )
+        self.assertEqual(output[0], "0")
+        self.assertIn("oxylabs.sources.amazon", output[1])
+        self.assertNotIn("oxylabs.sources.bing", output[1])
+
+    def test_source_attributes(self):
+        """
+        Test that a source is created once per client and is bound to the
+        API of that client.
+        """
+        client = RealtimeClient("user", "pass")
+        self.assertIsInstance(client.amazon, Amazon)
+        self.assertIs(client.amazon, client.amazon)
+        self.assertIs(client.amazon._api_instance, client._api)
+        self.assertIsNot(
+            RealtimeClient("user", "pass").amazon, client.amazon
+        )
+        self.assertIsInstance(AsyncClient("user", "pass").amazon, AmazonAsync)
+        self.assertIn("amazon", dir(client))
+
+    def test_package_attributes(self):
+        """
+        Test that the clients are available from the package.
+        """
+        self.assertIs(oxylabs.RealtimeClient, RealtimeClient)
+        self.assertIn("ProxyClient", dir(oxylabs))
+        with self.assertRaises(AttributeError):
+            oxylabs.UnknownClient
+
+
+class TestOptionalAiohttp(unittest.TestCase):
+    """
+    Test case for using the synchronous clients without aiohttp.
+    """
+
+    def test_sync_client_without_aiohttp(self):
+        """
+        Test that the Realtime client does not import aiohttp and works
+        when it is not installed, while AsyncClient explains how to
+        install it.
+        """
+        output = run_python(
+            "import sys\n"
+            "sys.modules['aiohttp'] = None\n"
+            "from oxylabs import AsyncClient, ProxyClient, RealtimeClient\n"
+            "client = RealtimeClient('user', 'pass')\n"
+            "client.amazon, client.google\n"
+            "try:\n"
+            "    AsyncClient('user', 'pass')\n"
+            "except ImportError as e:\n"
+            "    print('oxylabs[async]' in str(e))\n"
+        )
+        self.assertEqual(output, ["True"])
+
+    def test_aiohttp_not_imported(self):
+        """
+        Test that importing and using the Realtime client loads no part of
+        the async stack.
+        """
+        output = run_python(
+            "import sys\n"
+            "from oxylabs import RealtimeClient\n"
+            "RealtimeClient('user', 'pass').bing\n"
+            "print(sorted({m.split('.')[0] for m in sys.modules}"
+            " & {'aiohttp', 'multidict', 'yarl', 'frozenlist'}))\n"
+        )
+        self.assertEqual(output, ["[]"])
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+from oxylabs.internal import AsyncClient
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestJobPoller(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the shared job poller of AsyncAPI.
+    """
+
+    async def test_poller_resolves_all_jobs(self):
+        """
+        Test that a single poller waits on many jobs and every job receives
+        its own result.
+        """
+        async with FakePushPullAPI(pending_polls=2) as fake:
+            async with AsyncClient("user", "pass", use_poller=True) as client:
+                client._api._base_url = fake.base_url
+                queries = [f"query {i}" for i in range(30)]
+                results = await asyncio.gather(
+                    *(
+                        client.bing.scrape_search(query, poll_interval=0.01)
+                        for query in queries
+                    )
+                )
+                self.assertEqual(client._api._poller.pending, 0)
+
+        for query, result in zip(queries, results):
+            self.assertEqual(result.results[0].content["query"], query)
+        status_requests = [
+            path for method, path, _ in fake.requests
+            if method == "GET" and not path.endswith("/results")
+        ]
+        self.assertEqual(len(status_requests), 30 * 3)
+
+    async def test_poller_used_when_many_jobs_in_flight(self):
+        """
+        Test that the poller is used automatically once the number of jobs
+        in flight reaches the threshold.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass", poller_threshold=5) as client:
+                client._api._base_url = fake.base_url
+                await client.bing.scrape_search("single", poll_interval=0.01)
+                self.assertIsNone(client._api._poller)
+
+                await asyncio.gather(
+                    *(
+                        client.bing.scrape_search(str(i), poll_interval=0.01)
+                        for i in range(10)
+                    )
+                )
+                self.assertIsNotNone(client._api._poller)
+
+    async def test_poller_times_out_jobs(self):
+        """
+        Test that jobs exceeding their completion timeout are released and
+        no longer polled.
+        """
+        async with FakePushPullAPI(pending_polls=1000) as fake:
+            async with AsyncClient("user", "pass", use_poller=True) as client:
+                client._api._base_url = fake.base_url
+                await client.bing.scrape_search(
+                    "slow", poll_interval=0.01, job_completion_timeout=0.1
+                )
+                polls = fake.jobs["1"]["polls"]
+                await asyncio.sleep(0.05)
+
+                self.assertEqual(client._api._poller.pending, 0)
+                self.assertEqual(fake.jobs["1"]["polls"], polls)
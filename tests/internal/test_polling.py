@@ -0,0 +1,128 @@
+import asyncio
+import itertools
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.internal.polling import AdaptivePollStrategy, FixedPollStrategy
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestPollStrategies(unittest.TestCase):
+    """
+    Test case for the fixed and adaptive poll schedules.
+    """
+
+    def test_fixed_schedule(self):
+        """
+        Test that the fixed strategy polls right away and then every poll
+        interval.
+        """
+        delays = FixedPollStrategy().schedule("bing_search", 5)
+        self.assertEqual(list(itertools.islice(delays, 4)), [0, 5, 5, 5])
+
+    def test_adaptive_schedule(self):
+        """
+        Test that the adaptive strategy waits for a fraction of the
+        predicted latency of the source and then backs off up to the poll
+        interval.
+        """
+        strategy = AdaptivePollStrategy(min_samples=3, jitter=0)
+        for latency in [4.0, 2.0, 3.0]:
+            strategy.record("universal_ecommerce", latency)
+
+        delays = strategy.schedule("universal_ecommerce", 5)
+        self.assertEqual(
+            list(itertools.islice(delays, 6)), [1.5, 0.5, 1.0, 2.0, 4.0, 5]
+        )
+        unknown = strategy.schedule("bing_search", 5)
+        self.assertEqual(next(unknown), 0)
+
+    def test_prediction_follows_faster_jobs(self):
+        """
+        Test that the prediction drops once jobs complete faster than
+        predicted, although latencies are only recorded when detected.
+        """
+        strategy = AdaptivePollStrategy(window=20, min_samples=1, jitter=0)
+        for _ in range(20):
+            strategy.record("bing_search", 20.0)
+
+        for _ in range(100):
+            elapsed = 0.0
+            for delay in strategy.schedule("bing_search", 5):
+                elapsed += delay
+                if elapsed >= 2.0:
+                    break
+            strategy.record("bing_search", elapsed)
+
+        self.assertLess(strategy.predict("bing_search"), 4.0)
+
+    def test_adaptive_jitter(self):
+        """
+        Test that jitter keeps delays within the configured bounds.
+        """
+        strategy = AdaptivePollStrategy(min_interval=1, jitter=0.2)
+        delays = list(itertools.islice(strategy.schedule(None, 1), 50))[1:]
+        self.assertTrue(all(0.8 <= delay <= 1.2 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+
+class TestAdaptivePolling(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for learning completion times through AsyncClient.
+    """
+
+    async def test_stats_are_learned_per_source(self):
+        """
+        Test that completed jobs are recorded under their source.
+        """
+        async with FakePushPullAPI(pending_polls=1) as fake:
+            async with AsyncClient(
+                "user", "pass", poll_strategy="adaptive"
+            ) as client:
+                client._api._base_url = fake.base_url
+                for query in ["nike", "adidas"]:
+                    await client.bing.scrape_search(query, poll_interval=0.01)
+
+                stats = client.poll_stats()
+
+        self.assertEqual(list(stats), ["bing_search"])
+        self.assertEqual(stats["bing_search"]["count"], 2)
+        self.assertGreater(stats["bing_search"]["p50"], 0)
+
+    async def test_status_checked_at_deadline(self):
+        """
+        Test that a job whose predicted completion is after its timeout is
+        still checked once at the deadline, with and without the poller.
+        """
+        for use_poller in [False, True]:
+            with self.subTest(use_poller=use_poller):
+                strategy = AdaptivePollStrategy(min_samples=1, jitter=0)
+                strategy.record("bing_search", 3)
+                async with FakePushPullAPI() as fake:
+                    async with AsyncClient(
+                        "user",
+                        "pass",
+                        poll_strategy=strategy,
+                        use_poller=use_poller,
+                    ) as client:
+                        client._api._base_url = fake.base_url
+                        start = asyncio.get_running_loop().time()
+                        response = await client.bing.scrape_search(
+                            "nike", job_completion_timeout=0.1
+                        )
+                        elapsed = asyncio.get_running_loop().time() - start
+
+                self.assertEqual(
+                    [path for _, path, _ in fake.requests],
+                    ["/v1/queries", "/v1/queries/1", "/v1/queries/1/results"],
+                )
+                self.assertTrue(response.results)
+                self.assertGreaterEqual(elapsed, 0.09)
+                self.assertLess(elapsed, 1)
+
+    def test_unknown_strategy(self):
+        """
+        Test that unknown strategies are rejected.
+        """
+        with self.assertRaises(ValueError):
+            AsyncClient("user", "pass", poll_strategy="sometimes")
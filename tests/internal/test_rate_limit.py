@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.rate_limit import RateLimiter
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Test case for the token bucket and concurrency budgets of RateLimiter.
+    """
+
+    def test_jobs_per_second(self):
+        """
+        Test that jobs are spread out to the configured rate.
+        """
+        limiter = RateLimiter(jobs_per_second=50, utilization=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.throttle()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_per_source_budget(self):
+        """
+        Test that a source budget only slows down jobs of that source.
+        """
+        limiter = RateLimiter(per_source={"amazon": {"jobs_per_second": 20}})
+        start = time.monotonic()
+        for _ in range(10):
+            limiter.throttle("google")
+        self.assertLess(time.monotonic() - start, 0.05)
+        for _ in range(3):
+            limiter.throttle("amazon")
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_concurrent_threads(self):
+        """
+        Test that no more than `max_concurrent` threads hold a slot at once.
+        """
+        limiter = RateLimiter(max_concurrent=2)
+        peak = []
+
+        def work():
+            with limiter.slot():
+                peak.append(limiter.stats()["in_flight"])
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(peak), 8)
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+    def test_invalid_utilization(self):
+        """
+        Test that a utilization outside of (0, 1] is rejected.
+        """
+        with self.assertRaises(ValueError):
+            RateLimiter(utilization=0)
+
+    def test_realtime_client(self):
+        """
+        Test that Realtime requests hold a slot of the limiter.
+        """
+        limiter = RateLimiter(per_source={"bing_search": {"max_concurrent": 1}})
+        client = RealtimeClient("user", "pass", rate_limiter=limiter)
+        api = client.bing._api_instance
+        seen = []
+        response = Mock(status_code=200)
+        response.content = json.dumps({}).encode()
+
+        def post(*args, **kwargs):
+            seen.append(limiter.stats()["sources"]["bing_search"])
+            return response
+
+        with patch.object(api._get_session(), "post", side_effect=post):
+            client.bing.scrape_search("nike")
+
+        self.assertEqual(seen, [1])
+        self.assertEqual(limiter.stats()["sources"]["bing_search"], 0)
+
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the rate limiter used by AsyncClient.
+    """
+
+    async def test_max_concurrent_jobs(self):
+        """
+        Test that jobs wait for a free slot before being submitted.
+        """
+        limiter = RateLimiter(max_concurrent=2)
+        async with FakePushPullAPI(pending_polls=2) as fake:
+            async with AsyncClient(
+                "user", "pass", rate_limiter=limiter
+            ) as client:
+                client._api._base_url = fake.base_url
+                peak = 0
+
+                async def watch():
+                    nonlocal peak
+                    while True:
+                        peak = max(peak, limiter.stats()["in_flight"])
+                        await asyncio.sleep(0.001)
+
+                watcher = asyncio.ensure_future(watch())
+                results = await asyncio.gather(
+                    *[
+                        client.bing.scrape_search(q, poll_interval=0.01)
+                        for q in ["a", "b", "c", "d", "e"]
+                    ]
+                )
+                watcher.cancel()
+
+        self.assertEqual(len(fake.jobs), 5)
+        self.assertTrue(all(r.results for r in results))
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.stats()["in_flight"], 0)
+
+    async def test_submitted_jobs_do_not_hold_slots(self):
+        """
+        Test that jobs submitted with `submit` and `submit_batch` are
+        throttled but not counted against `max_concurrent`, so that more
+        jobs than slots can be submitted before any is collected.
+        """
+        limiter = RateLimiter(max_concurrent=1)
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient(
+                "user", "pass", rate_limiter=limiter
+            ) as client:
+                client._api._base_url = fake.base_url
+                handles = [
+                    await client.submit(client.bing.scrape_search(q))
+                    for q in ["a", "b"]
+                ]
+                job_ids = await client.submit_batch(
+                    [{"source": "bing_search", "query": q} for q in "cd"]
+                )
+                self.assertEqual(limiter.stats()["in_flight"], 0)
+                responses = await asyncio.wait_for(
+                    client.get_results([h.id for h in handles] + job_ids), 5
+                )
+
+        self.assertEqual(len(fake.jobs), 4)
+        self.assertTrue(all(r.results for r in responses))
+
+    async def test_shared_between_threads(self):
+        """
+        Test that a slot released by another thread wakes an async waiter.
+        """
+        limiter = RateLimiter(max_concurrent=1)
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with limiter.slot():
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        acquired.wait()
+
+        async def take():
+            async with limiter.slot_async():
+                return limiter.stats()["in_flight"]
+
+        task = asyncio.ensure_future(take())
+        await asyncio.sleep(0.01)
+        self.assertFalse(task.done())
+        release.set()
+        self.assertEqual(await asyncio.wait_for(task, 1), 1)
+        thread.join()
@@ -0,0 +1,173 @@
+import json
+import unittest
+from email.utils import formatdate
+from time import time
+from unittest.mock import Mock, patch
+
+import requests
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.retry import (
+    RetryPolicy,
+    get_retry_policies,
+    parse_retry_after,
+)
+from tests.internal.fake_api import FakePushPullAPI
+
+NO_WAIT = RetryPolicy(backoff_factor=0)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """
+    Test case for the retry policy delays and decisions.
+    """
+
+    def test_exponential_backoff(self):
+        """
+        Test that delays double with every attempt up to the maximum.
+        """
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        delays = [policy.get_delay(attempt) for attempt in range(1, 5)]
+        self.assertEqual(delays, [1, 2, 4, 5])
+
+    def test_jitter_stays_within_backoff(self):
+        """
+        Test that jittered delays never exceed the exponential delay.
+        """
+        policy = RetryPolicy(backoff_factor=1)
+        for _ in range(100):
+            self.assertLessEqual(policy.get_delay(3), 4)
+
+    def test_retry_after(self):
+        """
+        Test that Retry-After headers in seconds and as HTTP dates are
+        respected.
+        """
+        policy = RetryPolicy(backoff_factor=1, jitter=False)
+        self.assertEqual(policy.get_delay(1, "7"), 7)
+        self.assertEqual(policy.get_delay(1, "invalid"), 1)
+        self.assertAlmostEqual(
+            parse_retry_after(formatdate(time() + 10, usegmt=True)),
+            10,
+            delta=2,
+        )
+        ignored = RetryPolicy(respect_retry_after=False, jitter=False)
+        self.assertEqual(ignored.get_delay(1, "7"), 0.5)
+
+    def test_retry_decisions(self):
+        """
+        Test that only retryable failures are retried, and only until the
+        maximum number of attempts.
+        """
+        policy = RetryPolicy(max_attempts=2)
+        self.assertTrue(policy.should_retry_status(503, 1))
+        self.assertFalse(policy.should_retry_status(503, 2))
+        self.assertFalse(policy.should_retry_status(400, 1))
+        self.assertTrue(policy.should_retry_error(False, True, 1))
+        self.assertFalse(policy.should_retry_error(True, False, 1))
+
+    def test_policies_per_phase(self):
+        """
+        Test that phases without a policy fall back to the default one.
+        """
+        policies = get_retry_policies({"poll": NO_WAIT})
+        self.assertIs(policies["poll"], NO_WAIT)
+        self.assertEqual(policies["submit"].max_attempts, 3)
+        with self.assertRaises(ValueError):
+            get_retry_policies({"fetch": NO_WAIT})
+
+
+class TestRealtimeRetry(unittest.TestCase):
+    """
+    Test case for retries of Realtime requests.
+    """
+
+    def _response(self, status_code, headers=None):
+        response = Mock(status_code=status_code, headers=headers or {})
+        response.content = json.dumps({"results": []}).encode()
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                str(status_code)
+            )
+        return response
+
+    def test_retries_until_success(self):
+        """
+        Test that rate limited and failed requests are retried.
+        """
+        client = RealtimeClient("user", "pass", retry=NO_WAIT)
+        api = client.bing._api_instance
+        responses = [
+            self._response(429, {"Retry-After": "0"}),
+            requests.exceptions.ConnectionError("reset"),
+            self._response(200),
+        ]
+
+        with patch.object(
+            api._get_session(), "post", side_effect=responses
+        ) as mock_post:
+            result = client.bing.scrape_search("nike")
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(result.raw, {"results": []})
+
+    def test_gives_up_after_max_attempts(self):
+        """
+        Test that the last failure is returned once attempts run out and
+        that other errors are not retried.
+        """
+        client = RealtimeClient(
+            "user", "pass", retry=RetryPolicy(max_attempts=2, backoff_factor=0)
+        )
+        api = client.bing._api_instance
+
+        with patch.object(
+            api._get_session(), "post", return_value=self._response(503)
+        ) as mock_post:
+            result = client.bing.scrape_search("nike")
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertFalse(result.raw)
+
+        with patch.object(
+            api._get_session(), "post", return_value=self._response(400)
+        ) as mock_post:
+            client.bing.scrape_search("nike")
+        self.assertEqual(mock_post.call_count, 1)
+
+
+class TestAsyncRetry(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for retries of Push-Pull requests in each phase.
+    """
+
+    async def test_retries_each_phase(self):
+        """
+        Test that failed submit, status and result requests are retried.
+        """
+        async with FakePushPullAPI() as fake:
+            fake.errors["submit"] = [429, 503]
+            fake.errors["status"] = [502]
+            fake.errors["results"] = [500]
+            async with AsyncClient("user", "pass", retry=NO_WAIT) as client:
+                client._api._base_url = fake.base_url
+                result = await client.bing.scrape_search(
+                    "nike", poll_interval=0.01
+                )
+
+        self.assertEqual(result.results[0].content["query"], "nike")
+        self.assertEqual(len(fake.requests), 7)
+        self.assertFalse(any(fake.errors.values()))
+
+    async def test_phase_policies(self):
+        """
+        Test that each phase uses its own policy.
+        """
+        async with FakePushPullAPI() as fake:
+            fake.errors["submit"] = [503, 503]
+            retry = {"submit": RetryPolicy(max_attempts=1)}
+            async with AsyncClient("user", "pass", retry=retry) as client:
+                client._api._base_url = fake.base_url
+                result = await client.bing.scrape_search("nike")
+
+        self.assertFalse(result.raw)
+        self.assertEqual(len(fake.requests), 1)
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.single_flight import AsyncSingleFlight
+from tests.internal.fake_api import FakePushPullAPI
+
+
+class TestRealtimeCoalescing(unittest.TestCase):
+    """
+    Test case for sharing Realtime responses between identical requests.
+    """
+
+    def _run_concurrently(self, client, queries):
+        api = client.bing._api_instance
+        response = Mock(status_code=200)
+        response.content = json.dumps(
+            {"results": [{"content": "ok"}]}
+        ).encode()
+
+        def post(*args, **kwargs):
+            time.sleep(0.05)
+            return response
+
+        results = [None] * len(queries)
+
+        def scrape(index, query):
+            results[index] = client.bing.scrape_search(query)
+
+        with patch.object(
+            api._get_session(), "post", side_effect=post
+        ) as mock_post:
+            threads = [
+                threading.Thread(target=scrape, args=(index, query))
+                for index, query in enumerate(queries)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return mock_post.call_count, results
+
+    def test_identical_requests_share_response(self):
+        """
+        Test that identical concurrent requests are sent once and that
+        different requests are not merged.
+        """
+        client = RealtimeClient("user", "pass")
+        calls, results = self._run_concurrently(
+            client, ["nike", "nike", "nike", "adidas"]
+        )
+        self.assertEqual(calls, 2)
+        self.assertTrue(all(r.raw for r in results))
+
+    def test_coalescing_disabled(self):
+        """
+        Test that every request is sent when coalescing is disabled.
+        """
+        client = RealtimeClient("user", "pass", coalesce=False)
+        calls, _ = self._run_concurrently(client, ["nike", "nike", "nike"])
+        self.assertEqual(calls, 3)
+
+
+class TestAsyncCoalescing(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for sharing Push-Pull jobs between identical requests.
+    """
+
+    async def test_identical_requests_share_job(self):
+        """
+        Test that identical concurrent requests create one job and all
+        receive its result.
+        """
+        async with FakePushPullAPI(pending_polls=1) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                results = await asyncio.gather(
+                    client.bing.scrape_search("nike", poll_interval=0.01),
+                    client.bing.scrape_search("nike", poll_interval=0.01),
+                    client.bing.scrape_search("adidas", poll_interval=0.01),
+                )
+                again = await client.bing.scrape_search(
+                    "nike", poll_interval=0.01
+                )
+
+        self.assertEqual(len(fake.jobs), 3)
+        self.assertEqual(results[0].raw, results[1].raw)
+        self.assertEqual(results[2].results[0].content["query"], "adidas")
+        self.assertEqual(again.results[0].job_id, "3")
+
+    async def test_cancelled_leader(self):
+        """
+        Test that waiting calls run themselves if the running call is
+        cancelled.
+        """
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(None)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        leader = asyncio.ensure_future(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await follower, 2)
+        self.assertEqual(single_flight.shared, 1)
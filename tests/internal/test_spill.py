@@ -0,0 +1,137 @@
+import gc
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.cache import ResultCache
+from oxylabs.internal.spill import SpilledContent, spill_content, spilling
+from tests.internal.fake_api import FakePushPullAPI
+
+HTML = "<html>" + "ü" * 1000 + "</html>"
+
+
+class TestSpilledContent(unittest.TestCase):
+    """
+    Test case for moving large result contents to memory mapped files.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_spill_above_threshold(self):
+        """
+        Test that only text contents longer than the threshold are moved
+        and that they are read back unchanged.
+        """
+        data = spill_content(
+            {
+                "results": [
+                    {"content": HTML},
+                    {"content": "<html></html>"},
+                    {"content": {"parsed": True}},
+                ]
+            },
+            100,
+            self.directory.name,
+        )
+        spilled = data["results"][0]["content"]
+
+        self.assertIsInstance(spilled, SpilledContent)
+        self.assertEqual(spilled.text(), HTML)
+        self.assertEqual(bytes(spilled.view()), HTML.encode())
+        self.assertEqual(len(spilled), len(HTML.encode()))
+        self.assertEqual(data["results"][1]["content"], "<html></html>")
+        self.assertEqual(data["results"][2]["content"], {"parsed": True})
+
+    def test_file_removed(self):
+        """
+        Test that the file is removed once the content is no longer
+        referenced and that no file is kept open.
+        """
+        spilled = SpilledContent(HTML, self.directory.name)
+        path = spilled.path
+        self.assertTrue(os.path.exists(path))
+        spilled.text()
+        del spilled
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+    def test_invalid_threshold(self):
+        """
+        Test that a negative threshold is rejected.
+        """
+        with self.assertRaises(ValueError):
+            spilling(json.loads, -1)
+
+    def test_disk_cache(self):
+        """
+        Test that responses with spilled content are stored on disk with
+        the content read back.
+        """
+        path = os.path.join(self.directory.name, "cache.db")
+        cache = ResultCache(path=path, max_entries=0)
+        self.addCleanup(cache.close)
+        response = spill_content({"results": [{"content": HTML}]}, 100)
+        cache.set("key", response)
+        self.assertEqual(
+            cache.get("key"), {"results": [{"content": HTML}]}
+        )
+
+    def test_realtime_client(self):
+        """
+        Test that the content of a Realtime result is spilled and read
+        through the Results accessors.
+        """
+        client = RealtimeClient(
+            "user",
+            "pass",
+            spill_threshold=100,
+            spill_dir=self.directory.name,
+        )
+        api = client.bing._api_instance
+        response = Mock(status_code=200)
+        response.content = json.dumps({"results": [{"content": HTML}]}).encode()
+
+        with patch.object(api._get_session(), "post", return_value=response):
+            result = client.bing.scrape_search("nike").results[0]
+
+        self.assertTrue(result.content_spilled)
+        self.assertEqual(result.content, HTML)
+        self.assertEqual(bytes(result.content_view()), HTML.encode())
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+
+class TestAsyncSpill(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for spilling contents of Push-Pull results.
+    """
+
+    async def test_async_client(self):
+        """
+        Test that contents are spilled both for full and streamed results.
+        """
+        async with FakePushPullAPI() as fake:
+            fake.content = HTML
+            async with AsyncClient(
+                "user", "pass", spill_threshold=100
+            ) as client:
+                client._api._base_url = fake.base_url
+                response = await client.universal.scrape_url(
+                    "https://example.com", poll_interval=0.01
+                )
+                streamed = [
+                    result
+                    async for result in client.iter_results(
+                        client.universal.scrape_url(
+                            "https://example.com/2", poll_interval=0.01
+                        )
+                    )
+                ]
+
+        for result in [response.results[0], streamed[0]]:
+            self.assertTrue(result.content_spilled)
+            self.assertEqual(result.content, HTML)
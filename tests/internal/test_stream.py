@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+
+from oxylabs.internal import AsyncClient
+from oxylabs.sources.response import Response
+
+
+class TestAsyncStream(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for streaming many source calls with AsyncClient.stream.
+    """
+
+    def setUp(self):
+        self.client = AsyncClient("user", "pass")
+        self.api = self.client.bing._api_instance
+        self.active = 0
+        self.peak = 0
+        self.started = 0
+
+        async def mock_get_resp(payload, config):
+            self.started += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            if payload["query"] == "fail":
+                raise RuntimeError("boom")
+            return {"query": payload["query"]}
+
+        self.api.get_response = mock_get_resp
+
+    async def test_stream_bounds_concurrency(self):
+        """
+        Test that requests are pulled lazily, at most `concurrency` run at
+        once and every request is yielded with its response.
+        """
+        pulled = []
+
+        def requests():
+            for i in range(20):
+                pulled.append(i)
+                yield (self.client.bing.scrape_search, (str(i),))
+
+        seen = []
+        async for request, response in self.client.stream(
+            requests(), concurrency=4
+        ):
+            self.assertIsInstance(response, Response)
+            self.assertEqual(response.raw["query"], request[1][0])
+            self.assertLessEqual(len(pulled) - len(seen), 4)
+            seen.append(request)
+
+        self.assertEqual(len(seen), 20)
+        self.assertEqual(self.peak, 4)
+
+    async def test_stream_async_iterable(self):
+        """
+        Test that requests can come from an async iterable of unawaited
+        source calls.
+        """
+        async def requests():
+            for query in ["nike", "adidas"]:
+                yield self.client.bing.scrape_search(query)
+
+        queries = sorted(
+            [response.raw["query"]
+             async for _, response in self.client.stream(requests())]
+        )
+        self.assertEqual(queries, ["adidas", "nike"])
+
+    async def test_stream_errors(self):
+        """
+        Test that errors are raised by default and yielded with
+        return_exceptions.
+        """
+        requests = [(self.client.bing.scrape_search, ("fail",))]
+        with self.assertRaises(RuntimeError):
+            async for _ in self.client.stream(requests):
+                pass
+
+        results = [
+            result async for _, result in self.client.stream(
+                requests, return_exceptions=True
+            )
+        ]
+        self.assertIsInstance(results[0], RuntimeError)
+
+    async def test_results_before_error(self):
+        """
+        Test that results completed together with a failed request are
+        yielded before its error is raised.
+        """
+        release = asyncio.Event()
+
+        async def mock_get_resp(payload, config):
+            await release.wait()
+            if payload["query"] == "fail":
+                raise RuntimeError("boom")
+            return {"query": payload["query"]}
+
+        self.api.get_response = mock_get_resp
+        requests = [
+            (self.client.bing.scrape_search, (query,))
+            for query in ["fail", "nike", "adidas"]
+        ]
+        asyncio.get_running_loop().call_later(0.01, release.set)
+        seen = []
+        with self.assertRaises(RuntimeError):
+            async for _, response in self.client.stream(requests):
+                seen.append(response.raw["query"])
+        self.assertEqual(sorted(seen), ["adidas", "nike"])
+
+    async def test_stream_stops_pulling_when_closed(self):
+        """
+        Test that closing the stream early stops pulling new requests.
+        """
+        def requests():
+            for i in range(1000):
+                yield (self.client.bing.scrape_search, (str(i),))
+
+        stream = self.client.stream(requests(), concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        self.assertLessEqual(self.started, 3)
@@ -0,0 +1,142 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+
+from oxylabs.internal import AsyncClient, RealtimeClient
+from oxylabs.internal.streaming import ResultsParser
+from tests.internal.fake_api import FakePushPullAPI
+
+BODY = {
+    "results": [
+        {"content": "<html>]}\\\" [{</html>", "page": 1},
+        {"content": {"items": [{"pos": 1}, {"pos": 2}]}, "page": 2},
+    ],
+    "job": {"id": "1", "status": "done", "tags": ["a"]},
+}
+
+
+def chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestResultsParser(unittest.TestCase):
+    """
+    Test case for splitting the results array out of a chunked body.
+    """
+
+    def test_items_in_any_chunking(self):
+        """
+        Test that items are complete however the body is split, including
+        inside strings and escapes.
+        """
+        data = json.dumps(BODY).encode()
+        for size in [1, 2, 7, len(data)]:
+            with self.subTest(size=size):
+                parser = ResultsParser()
+                items = []
+                for chunk in chunks(data, size):
+                    items.extend(parser.feed(chunk))
+                self.assertEqual(
+                    [json.loads(item) for item in items], BODY["results"]
+                )
+                remainder = json.loads(parser.remainder())
+                self.assertEqual(remainder["results"], [])
+                self.assertEqual(remainder["job"], BODY["job"])
+
+    def test_nested_results_key(self):
+        """
+        Test that only the top-level array is split.
+        """
+        data = json.dumps(
+            {"job": {"results": [{"a": 1}]}, "results": [{"b": 2}]}
+        ).encode()
+        parser = ResultsParser()
+        self.assertEqual(parser.feed(data), [b'{"b": 2}'])
+
+    def test_items_not_buffered(self):
+        """
+        Test that the bytes of yielded items are released.
+        """
+        parser = ResultsParser()
+        parser.feed(b'{"results": [{"content": "' + b"x" * 1000 + b'"}, ')
+        self.assertLess(len(parser._buffer), 10)
+
+
+class TestRealtimeStreaming(unittest.TestCase):
+    """
+    Test case for streaming results of Realtime responses.
+    """
+
+    def test_iter_results(self):
+        """
+        Test that results are yielded from the streamed body of a source
+        call given like a batch call.
+        """
+        client = RealtimeClient("user", "pass")
+        api = client.bing._api_instance
+        response = MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_content.return_value = chunks(
+            json.dumps(BODY).encode(), 5
+        )
+
+        with patch.object(
+            api._get_session(), "post", return_value=response
+        ) as mock_post:
+            results = list(
+                client.iter_results((client.bing.scrape_search, ("nike",)))
+            )
+
+        self.assertEqual([r.page for r in results], [1, 2])
+        self.assertEqual(results[1].content["items"][1]["pos"], 2)
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+        self.assertEqual(
+            mock_post.call_args.kwargs["json"]["query"], "nike"
+        )
+        response.__exit__.assert_called_once()
+
+
+class TestAsyncStreaming(unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for streaming results of Push-Pull jobs.
+    """
+
+    async def test_iter_results(self):
+        """
+        Test that results of a job are yielded once it is done.
+        """
+        async with FakePushPullAPI(pending_polls=1) as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                results = [
+                    result
+                    async for result in client.iter_results(
+                        client.bing.scrape_search("nike", poll_interval=0.01)
+                    )
+                ]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].content["query"], "nike")
+        self.assertEqual(results[0].job_id, "1")
+
+    async def test_retry_and_errors(self):
+        """
+        Test that a rate limited results request is retried and that other
+        errors are raised.
+        """
+        async with FakePushPullAPI() as fake:
+            async with AsyncClient("user", "pass") as client:
+                client._api._base_url = fake.base_url
+                fake.errors["results"] = [429]
+                handle = await client.submit(
+                    client.bing.scrape_search("nike", poll_interval=0.01)
+                )
+                results = [r async for r in handle.iter_results()]
+                self.assertEqual(len(results), 1)
+
+                fake.errors["results"] = [404]
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    [r async for r in handle.iter_results()]
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch
+
+from oxylabs.sources import response as response_module
+from oxylabs.sources.response import Content, Response
+
+DATA = {
+    "results": [
+        {
+            "content": "<html></html>",
+            "status_code": 200,
+            "content_parsed": {
+                "url": "https://www.google.com/search?q=nike",
+                "results": {
+                    "filters": [{"name": "Brand", "values": []}],
+                    "paid": [{"pos": 1, "title": "Ad"}],
+                },
+                "category": [
+                    {"ladder": [{"url": "/shoes", "name": "Shoes", "id": 1}]}
+                ],
+            },
+        }
+    ],
+    "job": {"id": "1", "status": "done"},
+}
+
+
+class TestLazyResponse(unittest.TestCase):
+    """
+    Test case for the lazily built response object graph.
+    """
+
+    def test_attributes(self):
+        """
+        Test that attributes are read from the raw data with the same
+        defaults as before.
+        """
+        response = Response(DATA)
+        result = response.results[0]
+        content = result.content_parsed
+
+        self.assertEqual(response.job.id, "1")
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(content.results.filters[0].name, "Brand")
+        self.assertEqual(content.results.paid[0].title, "Ad")
+        self.assertEqual(
+            content.category[0].ladder, [{"url": "/shoes", "name": "Shoes"}]
+        )
+        self.assertEqual(content.highlights, [])
+        self.assertIsNone(content.title)
+        self.assertEqual(content.variants.raw, {})
+        self.assertEqual(Response(None).results, [])
+
+    def test_built_on_first_access(self):
+        """
+        Test that sub-objects are only built when read and are cached.
+        """
+        with patch.object(
+            response_module, "Paid", wraps=response_module.Paid
+        ) as paid:
+            content = Response(DATA).results[0].content_parsed
+            filters = content.results.filters
+            self.assertEqual(paid.call_count, 0)
+
+            self.assertIs(content.results.paid, content.results.paid)
+            self.assertEqual(paid.call_count, 1)
+        self.assertIs(filters, content.results.filters)
+
+    def test_attributes_can_be_set(self):
+        """
+        Test that attributes can still be assigned.
+        """
+        content = Content({"title": "Nike"})
+        content.title = "Adidas"
+        self.assertEqual(content.title, "Adidas")
+
+    def test_no_instance_dict(self):
+        """
+        Test that response objects are slotted and only allocate storage
+        for values that are built.
+        """
+        content = Content({"title": "Nike", "results": {}})
+        self.assertFalse(hasattr(content, "__dict__"))
+        self.assertEqual(content.title, "Nike")
+        self.assertIsNone(content._values)
+        content.results
+        self.assertEqual(list(content._values), ["results"])